@@ -1,6 +1,103 @@
 import random
 from collections import deque
-from typing import Callable, Dict, Iterable, Set, Tuple, Any
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Any
+
+import numpy as np
+
+from csrBase import csr_slots
+from csrGraph import reach_sums
+from csrHypergraph import CSRHypergraph, as_csr
+from parallelMC import MC_SHARD_SIZE, ShardPool, SpreadEstimate, adaptive_mc, shard_streams
+
+_NO_POLARITY = object()
+
+
+def _lookup_polarity(polarity, u, e):
+    """Polarity of user u in hyperedge e from a callable or mapping (None if missing)."""
+    if callable(polarity):
+        return polarity(u, e)
+    # mapping-like handling:
+    # try (u,e) tuple first
+    try:
+        return polarity[(u, e)]
+    except Exception:
+        pass
+    # try nested: polarity[u][e]
+    try:
+        return polarity[u][e]
+    except Exception:
+        pass
+    # try polarity.get(u, {}).get(e)
+    try:
+        return polarity.get(u, {}).get(e)
+    except Exception:
+        return None
+
+
+def polarity_slots(H, polarity) -> np.ndarray:
+    """
+    Polarity of every incidence of H as int8 codes, aligned with `Hc.edge_members`.
+
+    Parameters
+    ----------
+    H : HyperNetX Hypergraph, CSRHypergraph or edge dict
+    polarity : callable, mapping or np.ndarray
+        polarity(u, e), mapping[(u, e)] or mapping[u][e] (see polarity_aware_diffusion);
+        each is resolved once per incidence. An int8 array of length `Hc.n_incidences`
+        (e.g. from `edge_name_polarity`) is returned as is.
+
+    Returns
+    -------
+    np.ndarray of int8
+        One code per (user, hyperedge) slot. Two slots have the same code exactly when
+        their polarity values compare equal (a missing polarity is the value None).
+    """
+    Hc = as_csr(H)
+    if isinstance(polarity, np.ndarray):
+        if polarity.shape != (Hc.n_incidences,):
+            raise ValueError(f"polarity array has shape {polarity.shape}, expected ({Hc.n_incidences},)")
+        return polarity.astype(np.int8, copy=False)
+
+    nodes, edge_names = Hc.nodes, Hc.edge_names
+    fast = polarity.get if isinstance(polarity, dict) else None
+    codes: Dict[Any, int] = {}
+    values: List[Any] = []
+    slot_pol = np.empty(Hc.n_incidences, dtype=np.int8)
+    for slot, (v, e) in enumerate(zip(Hc.edge_members.tolist(), Hc.slot_edges.tolist())):
+        u, e_name = nodes[v], edge_names[e]
+        value = fast((u, e_name), _NO_POLARITY) if fast is not None else _NO_POLARITY
+        if value is _NO_POLARITY:
+            value = _lookup_polarity(polarity, u, e_name)
+
+        # intern by equality (values need not be hashable)
+        try:
+            code = codes.get(value)
+        except TypeError:
+            code = next((c for c, w in enumerate(values) if w == value), None)
+        if code is None:
+            code = len(values)
+            if code > np.iinfo(np.int8).max:
+                raise ValueError("more than 128 distinct polarity values")
+            values.append(value)
+            try:
+                codes[value] = code
+            except TypeError:
+                pass
+        slot_pol[slot] = code
+    return slot_pol
+
+
+def edge_name_polarity(H) -> np.ndarray:
+    """
+    Opinion-edge polarity slots: +1 in support_* hyperedges, -1 in against_* hyperedges,
+    0 (no polarity) elsewhere. Same as the (user, edge) polarity_dict of IMatrix2.py,
+    one byte per incidence.
+    """
+    Hc = as_csr(H)
+    edge_pol = np.array([1 if str(e).startswith("support") else -1 if str(e).startswith("against") else 0
+                         for e in Hc.edge_names], dtype=np.int8)
+    return edge_pol[Hc.slot_edges]
+
 
 def polarity_aware_diffusion(H,
                              S: Iterable[Any],
@@ -12,15 +109,17 @@ def polarity_aware_diffusion(H,
 
     Parameters
     ----------
-    H : HyperNetX Hypergraph (or any object where H.edges[e] -> set of users and H.nodes lists users)
-        - Access a hyperedge's member set via H.edges[e]
+    H : HyperNetX Hypergraph, CSRHypergraph or edge dict {edge name: users}
+        - Converted once to a CSRHypergraph so incident hyperedges are looked up in O(degree)
     S : iterable
         Initial seed set (iterable of user ids)
-    polarity : callable or mapping
+    polarity : callable, mapping or np.ndarray
         - If callable: polarity(u, e) -> some comparable polarity value (e.g. -1/0/1, 'pos'/'neg', True/False)
         - If mapping/dict: either
             * mapping[(u, e)] -> value, or
             * mapping[u][e] -> value
+        - If array: int8 polarity codes per incidence slot (see `polarity_slots`)
+        Callables and mappings are resolved once, up front, by `polarity_slots`.
     theta : float in [0,1]
         Threshold for random chance to infect when polarities differ.
     rng : random.Random (optional)
@@ -32,66 +131,219 @@ def polarity_aware_diffusion(H,
         Set of activated users after the diffusion finishes.
     """
 
-    # helper to get polarity value robustly
-    def _pol(u, e):
-        if callable(polarity):
-            return polarity(u, e)
-        # mapping-like handling:
-        # try (u,e) tuple first
-        try:
-            return polarity[(u, e)]
-        except Exception:
-            pass
-        # try nested: polarity[u][e]
-        try:
-            return polarity[u][e]
-        except Exception:
-            pass
-        # try polarity.get(u, {}).get(e)
-        try:
-            return polarity.get(u, {}).get(e)
-        except Exception:
-            return None
-
     if rng is None:
         rand = random.random
     else:
         rand = rng.random
 
-    # activated set A and queue Q
+    Hc = as_csr(H)
+    nodes = Hc.nodes
+    slot_pol = polarity_slots(Hc, polarity)
+
+    # activated set A and queue Q (of node ids); seeds outside H are active but influence nobody
     A: Set[Any] = set(S)
-    Q = deque(S)
+    active = np.zeros(Hc.n_nodes, dtype=bool)
+    Q = deque()
+    for u in S:
+        i = Hc.node_index.get(u)
+        if i is not None:
+            active[i] = True
+            Q.append(i)
 
     # main loop
     while Q:
         u = Q.popleft()
 
-        # iterate over hyperedges incident on u.
-        # HyperNetX HypergraphView does not provide .values(), but you can iterate edge names and index:
-        for e in H.edges:            # e is the hyperedge key/name
-            members = H.edges[e]     # set-like of users in this hyperedge
-            if u not in members:
+        # iterate over hyperedges incident on u only (node -> edges index); node_slots
+        # gives u's own slot in each of them, hence its polarity there
+        for j in range(Hc.node_ptr[u], Hc.node_ptr[u + 1]):
+            e = Hc.node_edges[j]
+            pol_u = slot_pol[Hc.node_slots[j]]
+            lo, hi = Hc.edge_ptr[e], Hc.edge_ptr[e + 1]
+
+            # users v in this hyperedge that are not already activated (members are
+            # distinct, so activating one cannot change the others' state in this edge)
+            inactive = np.flatnonzero(~active[Hc.edge_members[lo:hi]])
+            if not inactive.size:
                 continue
+            members = Hc.edge_members[lo:hi][inactive]
+
+            # equal polarity -> immediate activation
+            # polarity differs (or one missing) -> probabilistic activation,
+            # one draw per such user in member order
+            hit = slot_pol[lo:hi][inactive] == pol_u
+            differs = np.flatnonzero(~hit)
+            if differs.size:
+                hit[differs] = np.array([rand() for _ in range(differs.size)]) > theta
+
+            newly = members[hit]
+            active[newly] = True
+            for v in newly.tolist():
+                A.add(nodes[v])
+                Q.append(v)
 
-            # for each user v in this hyperedge that is not already activated
-            for v in members:
-                if v in A:
-                    continue
+    return A
 
-                pol_u = _pol(u, e)
-                pol_v = _pol(v, e)
 
-                # if polarities equal (including both None) -> immediate activation
-                if pol_u == pol_v:
-                    A.add(v)
-                    Q.append(v)
-                else:
-                    # polarity differs (or one missing) -> probabilistic activation
-                    if rand() > theta:
-                        A.add(v)
-                        Q.append(v)
+# ---------- Batched polarity-aware diffusion (Monte Carlo) ----------
 
-    return A
+# runs simulated together by `_polarity_batch`; bounds its (n x runs) work arrays
+POLARITY_RUNS = 64
+
+
+def _polarity_groups(Hc: CSRHypergraph, slot_pol):
+    """For every edge id: list of (member positions within the edge) per polarity code."""
+    groups = []
+    for e in range(Hc.n_edges):
+        pol = slot_pol[Hc.edge_ptr[e]:Hc.edge_ptr[e + 1]]
+        order = np.argsort(pol, kind="stable")
+        bounds = np.flatnonzero(np.diff(pol[order])) + 1
+        groups.append(np.split(order, bounds) if len(order) else [])
+    return groups
+
+
+def _polarity_batch(Hc: CSRHypergraph, seeds, theta, n_runs, rng, groups):
+    """
+    `n_runs` polarity-aware cascades at once (one column of the state per run).
+
+    Every active user makes exactly one attempt on every co-member of every shared
+    hyperedge, as in polarity_aware_diffusion, so the cascades can be advanced a frontier
+    round at a time. Per hyperedge, the frontier members of each polarity are counted
+    with masks over the member array; an inactive user v then activates for certain if
+    some frontier co-member has v's polarity in that hyperedge, otherwise with probability
+    1 - theta^d, d = number of (frontier co-member, hyperedge) attempts with a different
+    polarity.
+
+    Returns the (n, n_runs) boolean activation matrix.
+    """
+    n = Hc.n_nodes
+    active = np.zeros((n, n_runs), dtype=bool)
+    active[seeds] = True
+    frontier = active.copy()
+    log_theta = np.log(theta) if theta > 0 else -np.inf
+
+    while frontier.any():
+        same = np.zeros((n, n_runs), dtype=bool)
+        diff = np.zeros((n, n_runs), dtype=np.int32)
+        for e, edge_groups in enumerate(groups):
+            members = Hc.members(e)
+            F = frontier[members]
+            total = F.sum(axis=0)
+            if not total.any():
+                continue
+            for rows in edge_groups:
+                n_same = F[rows].sum(axis=0)
+                same[members[rows]] |= n_same > 0
+                diff[members[rows]] += total - n_same
+
+        newly = same & ~active
+        chance = ~active & ~same & (diff > 0)
+        prob = -np.expm1(diff[chance] * log_theta)
+        newly[chance] = rng.random(len(prob)) < prob
+
+        active |= newly
+        frontier = newly
+
+    return active
+
+
+def _polarity_cascade(Hc: CSRHypergraph, seeds, slot_pol, theta, rng, active=None):
+    """
+    One polarity-aware cascade, touching only the hyperedges of each frontier.
+
+    Same model as `_polarity_batch` for a single run: per hyperedge of the frontier, the
+    inactive members sharing the polarity of some frontier member there activate for
+    certain, the others with probability 1 - theta^(number of frontier members there).
+    `active` is an optional all-False scratch array of length n, reset before returning.
+
+    Returns the ids of all activated users (seeds included).
+    """
+    if active is None:
+        active = np.zeros(Hc.n_nodes, dtype=bool)
+    frontier = np.unique(np.asarray(seeds, dtype=np.int64))
+    active[frontier] = True
+    reached_all = [frontier]
+
+    # per-edge frontier counts, reset after every round
+    n_frontier = np.zeros(Hc.n_edges, dtype=np.int64)
+
+    while frontier.size:
+        # (frontier user, incident hyperedge) pairs, with the user's polarity code there
+        j = csr_slots(Hc.node_ptr, frontier)
+        inc_e = Hc.node_edges[j]
+        touched, counts = np.unique(inc_e, return_counts=True)
+        n_frontier[touched] = counts
+        present = np.unique(inc_e.astype(np.int64) * 256 + slot_pol[Hc.node_slots[j]] + 128)
+
+        # members of the touched hyperedges: same polarity as a frontier member there -> certain,
+        # otherwise one Bernoulli(1 - theta^frontier members) draw per (member, hyperedge)
+        slots = csr_slots(Hc.edge_ptr, touched)
+        members = Hc.edge_members[slots]
+        slot_e = Hc.slot_edges[slots]
+        inactive = ~active[members]
+        key = slot_e.astype(np.int64) * 256 + slot_pol[slots] + 128
+        same = present[np.minimum(np.searchsorted(present, key), len(present) - 1)] == key
+        hit = inactive & same
+        chance = np.flatnonzero(inactive & ~same)
+        if chance.size:
+            hit[chance] = rng.random(chance.size) >= theta ** n_frontier[slot_e[chance]]
+        n_frontier[touched] = 0
+
+        new_active = np.unique(members[hit])
+        active[new_active] = True
+        reached_all.append(new_active)
+        frontier = new_active
+
+    reached_all = np.concatenate(reached_all)
+    active[reached_all] = False
+    return reached_all
+
+
+def polarity_diffusion_mc(H, S, polarity, theta=0.5, mc=100, seed=0):
+    """
+    Monte Carlo estimate of polarity-aware diffusion (Algorithm 3), run in batches.
+
+    Parameters
+    ----------
+    H : HyperNetX Hypergraph, CSRHypergraph or edge dict
+    S : iterable
+        Seed users.
+    polarity : callable, mapping or np.ndarray
+        As in polarity_aware_diffusion (resolved once by `polarity_slots`).
+    theta : float in [0,1]
+        Probability that an attempt across differing polarities fails.
+    mc : int
+        Number of cascades; they are simulated POLARITY_RUNS at a time.
+    seed : int
+        Seed of the np.random.Generator driving all batches.
+
+    Returns
+    -------
+    mean_spread : float
+        Average number of activated users (seeds included).
+    variance : float
+        Sample variance of the spread over the mc cascades.
+    frequency : np.ndarray of float
+        Fraction of cascades that activated each user, in `as_csr(H).nodes` order.
+    """
+    Hc = as_csr(H)
+    seeds, n_outside = Hc.seed_ids(S)
+    groups = _polarity_groups(Hc, polarity_slots(Hc, polarity))
+    spreads, counts = _polarity_mc(Hc, seeds, n_outside, theta, mc, seed, groups)
+    variance = float(np.var(spreads, ddof=1)) if mc > 1 else 0.0
+    return float(np.mean(spreads)), variance, counts / mc
+
+
+def _polarity_mc(Hc: CSRHypergraph, seeds, n_outside, theta, mc, seed, groups):
+    """Spread of every cascade and activation count of every user (see polarity_diffusion_mc)."""
+    rng = np.random.default_rng(seed)
+    spreads = []
+    counts = np.zeros(Hc.n_nodes, dtype=np.int64)
+    for start in range(0, mc, POLARITY_RUNS):
+        active = _polarity_batch(Hc, seeds, theta, min(POLARITY_RUNS, mc - start), rng, groups)
+        spreads.append(active.sum(axis=0) + n_outside)
+        counts += active.sum(axis=1)
+    return np.concatenate(spreads), counts
 
 
 def relevance_based_seed_selection(H, T_prime, r, k):
@@ -100,7 +352,7 @@ def relevance_based_seed_selection(H, T_prime, r, k):
 
     Parameters:
     -----------
-    H : hypernetx Hypergraph
+    H : hypernetx Hypergraph, CSRHypergraph or edge dict
         H.nodes  = users U
         H.edges  = topics (hyperedges)
 
@@ -118,64 +370,54 @@ def relevance_based_seed_selection(H, T_prime, r, k):
         Top-k seed users
     """
 
-    # Users U
-    U = list(H.nodes)
+    Hc = as_csr(H)
 
-    # Dictionary to store relevance score of each user
-    R = {u: 0.0 for u in U}
+    # Per-topic weight w(u,t) * r_t for every topic t in T' present in H (0 elsewhere);
+    # w(u,t) = hyperparameter or simply |edge|
+    v = np.zeros(Hc.n_edges)
+    for t in T_prime:
+        if t in Hc.edge_index:
+            e = Hc.edge_index[t]
+            v[e] = (Hc.edge_ptr[e + 1] - Hc.edge_ptr[e]) * r.get(t, 0)
 
-    # For each user u in U
-    for u in U:
+    # Relevance score of each user (indexed by node id): one sparse mat-vec over the incidences
+    R = Hc.incidence_matrix() @ v
 
-        # For each topic t in T'
-        for t in T_prime:
+    # Top-k users by descending |R[u]| (ties keep node order)
+    return [Hc.nodes[u] for u in _top_k(np.abs(R), k)]
 
-            # Check if this topic exists in the hypergraph
-            if t not in H.edges:
-                continue
 
-            # Hyperedge node set
-            topic_users = H.edges[t]
-
-            # If t is incident on u  (u belongs to hyperedge t)
-            if u in topic_users:
-                # w(u,t) = hyperparameter or simply |edge|
-                w_ut = len(topic_users)
-
-                # r_t = relevance score of topic t
-                r_t = r.get(t, 0)
+def opinion_based_seed_selection(H, k):
+    # Accept a HyperNetX Hypergraph, a CSRHypergraph, an edge dict or a tuple (V, E)
+    Hc = as_csr(H)
 
-                # Update relevance score
-                R[u] += w_ut * r_t
+    # hyperdegree = number of incident edges = row sums of the incidence matrix
+    hyperdegree = Hc.degrees()
 
-    # Sort users by descending relevance score |R[u]|
-    sorted_users = sorted(U, key=lambda u: abs(R[u]), reverse=True)
+    # top-k by hyperdegree (ties keep node order)
+    return [Hc.nodes[u] for u in _top_k(hyperdegree, k)]
 
-    # Select top-k
-    return sorted_users[:k]
 
+def _top_k(scores, k):
+    """
+    Ids of the k largest scores, best first; ties go to the lower id.
 
-def opinion_based_seed_selection(H, k):
-    # Accept either a HyperNetX Hypergraph object or a tuple (V, E)
-    if hasattr(H, "nodes") and hasattr(H, "edges") and not isinstance(H, tuple):
-        V = list(H.nodes)
-        E = H.edges
+    Same result as np.argsort(-scores, kind="stable")[:k], but only the k winners are
+    sorted: a linear-time partition finds the k-th largest value first.
+    """
+    scores = np.asarray(scores)
+    n = len(scores)
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < n:
+        kth = np.partition(scores, n - k)[n - k]
+        better = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(better)]
+        idx = np.sort(np.concatenate([better, ties]))
     else:
-        V, E = H
-
-    # initialize hyperdegree
-    hyperdegree = {u: 0 for u in V}
-
-    # iterate over edge names and fetch the node set for each edge
-    for edge_name in E:
-        edge_users = E[edge_name]   # works for HypergraphView
-        for u in edge_users:
-            # be safe if some user appears in edges but not in V
-            hyperdegree[u] = hyperdegree.get(u, 0) + 1
-
-    # sort by hyperdegree and return top-k
-    sorted_users = sorted(hyperdegree.keys(), key=lambda u: hyperdegree[u], reverse=True)
-    return sorted_users[:k]
+        idx = np.arange(n)
+    return idx[np.argsort(-scores[idx], kind="stable")]
 
 
 # Linear Threshold Model Hypergraphs
@@ -183,11 +425,12 @@ def opinion_based_seed_selection(H, k):
 import numpy as np
 
 
-def LT_hypergraph(H, seed_set, th_low=0.0, th_high=0.1, mc=10):
+def LT_hypergraph(H, seed_set, th_low=0.0, th_high=0.1, mc=10, batched=False, n_jobs=None, seed=0,
+                  rel_error=None, confidence=0.95):
     """
     Linear Threshold model on a Hypergraph.
 
-    H : HyperNetX Hypergraph object
+    H : HyperNetX Hypergraph object, CSRHypergraph or edge dict
         H.nodes  -> users
         H.edges[e] -> set of users in hyperedge e
 
@@ -201,64 +444,352 @@ def LT_hypergraph(H, seed_set, th_low=0.0, th_high=0.1, mc=10):
     mc : int
         Number of Monte Carlo simulations
 
+    batched : bool
+        If True, advance all simulations together as one boolean (n, runs) state (see
+        `_lt_batch`); thresholds and results are the same as sequential.
+
+    n_jobs : int, optional
+        If given, split the simulations into fixed-size shards with independent
+        SeedSequence streams (spawned from `seed`) and run them on n_jobs worker processes
+        (n_jobs <= 0: all cores). The result is identical for every n_jobs, including 1,
+        but differs from the default per-simulation seeding.
+
+    seed : int
+        Root seed of the shard streams (only used with n_jobs or rel_error).
+
+    rel_error : float, optional
+        If given, sample adaptively: shards of simulations (streams as with n_jobs) are
+        run until the `confidence` interval of the mean is within rel_error of it, with mc
+        as the cap, and a SpreadEstimate (mean, stderr, ci, n_sims) is returned.
+
+    confidence : float
+        Confidence level for rel_error.
+
     Returns:
-        mean spread over MC runs
+        mean spread over MC runs (SpreadEstimate with rel_error)
+    """
+
+    if rel_error is not None:
+        return SpreadEstimator(H, mc=mc, model="LT", th_low=th_low, th_high=th_high, batched=batched,
+                               seed=seed).estimate_adaptive(seed_set, rel_error, confidence)
+
+    if n_jobs is not None:
+        with SpreadEstimator(H, mc=mc, model="LT", th_low=th_low, th_high=th_high,
+                             batched=batched, n_jobs=n_jobs, seed=seed) as estimator:
+            return estimator.estimate(seed_set)
+
+    Hc = as_csr(H)
+    seeds, n_outside = Hc.seed_ids(seed_set)
+    return np.mean(_lt_spreads(Hc, seeds, n_outside, th_low, th_high, mc, batched))
+
+
+def _lt_spreads(Hc: CSRHypergraph, seeds, n_outside, th_low, th_high, mc, batched=False, index=None):
     """
+    Spread of each of the mc LT simulations of LT_hypergraph (seeds given as node ids).
 
+    `index` is the `_lt_index` of Hc for the sequential engine (built if not given).
+    """
+    n = Hc.n_nodes
+    if batched:
+        thresholds = []
+        for sim in range(mc):
+            np.random.seed(sim)
+            thresholds.append(np.random.uniform(th_low, th_high) * n)
+        spreads = [_lt_batch(Hc, seeds, thresholds[start:start + BATCH_RUNS])
+                   for start in range(0, mc, BATCH_RUNS)]
+        return np.concatenate(spreads) + n_outside
+
+    if index is None:
+        index = Hc.derived("lt_index", _lt_index)
     spread = []
-    nodes = list(H.nodes)
 
     for sim in range(mc):
-        curr_active = set(seed_set)
-        new_active = list(seed_set)
-
         # random threshold for this simulation
         np.random.seed(sim)
         threshold = np.random.uniform(th_low, th_high)
-        thr_value = threshold * len(nodes)
+        thr_value = threshold * n
 
-        while new_active:
-            newly_added = []
+        spread.append(_lt_run(Hc, seeds, n_outside, thr_value, index))
 
-            # try activating all nodes not yet active
-            for u in nodes:
-                if u in curr_active:
-                    continue
+    return spread
 
-                # count active neighbors across all incident hyperedges
-                active_neighbors = 0
 
-                for e in H.edges:
-                    if u not in H.edges[e]:
-                        continue
+def _lt_index(Hc: CSRHypergraph):
+    """
+    Signature-class operators for `_lt_run`.
 
-                    # users in the same hyperedge
-                    for v in H.edges[e]:
-                        if v in curr_active and v != u:
-                            active_neighbors += 1
+    All users of a signature class (same set of hyperedges, see
+    CSRHypergraph.signature_classes) have the same number of active neighbours, so the
+    per-user counters are kept once per class: C (classes x edges) maps per-hyperedge
+    active counts to per-class counts, and class_members/class_ptr list the users of
+    every class (CSR).
+    """
+    from scipy import sparse
+    node_class, class_edges = Hc.signature_classes()
+    n_classes = len(class_edges)
+    sizes = [len(sig) for sig in class_edges]
+    C = sparse.csr_matrix((np.ones(sum(sizes), dtype=np.int64),
+                           (np.repeat(np.arange(n_classes), sizes),
+                            np.concatenate(class_edges) if class_edges else np.empty(0, dtype=np.int32))),
+                          shape=(n_classes, Hc.n_edges))
+    class_members = np.argsort(node_class, kind="stable")
+    class_ptr = np.zeros(n_classes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(node_class, minlength=n_classes), out=class_ptr[1:])
+    return C, class_members, class_ptr
+
+
+def _lt_run(Hc: CSRHypergraph, seeds, n_outside, thr_value, index):
+    """
+    Spread of one LT simulation with absolute threshold `thr_value`.
 
-                if active_neighbors > thr_value:
-                    newly_added.append(u)
+    Incremental: per-hyperedge active counts are updated from the new frontier only, and
+    the active-neighbour counters (one per signature class, `_lt_index`) are derived from
+    them. Counters only grow, so a class crosses the threshold at most once, and then all
+    its inactive users activate together. A round costs O(frontier incidences + classes)
+    instead of a rescan of every incidence.
+    """
+    C, class_members, class_ptr = index
+    n = Hc.n_nodes
+    if len(seeds) + n_outside == 0:
+        return 0
+    if thr_value < 0:
+        # every user already has more than thr_value (>= 0) active neighbours
+        return n + n_outside
+
+    active = np.zeros(n, dtype=bool)
+    edge_active = np.zeros(Hc.n_edges, dtype=np.int64)
+    opened = np.zeros(C.shape[0], dtype=bool)
+    frontier = np.unique(np.asarray(seeds, dtype=np.int64))
+    active[frontier] = True
+    count = len(frontier)
+
+    while frontier.size:
+        # new active members per hyperedge, then active neighbours per class
+        edge_active += np.bincount(Hc.node_edges[csr_slots(Hc.node_ptr, frontier)], minlength=Hc.n_edges)
+        class_active = C @ edge_active
+
+        # classes crossing the threshold: activate their inactive users
+        crossing = np.flatnonzero(~opened & (class_active > thr_value))
+        opened[crossing] = True
+        frontier = class_members[csr_slots(class_ptr, crossing)]
+        frontier = frontier[~active[frontier]]
+        active[frontier] = True
+        count += len(frontier)
+
+    return count + n_outside
 
-            new_active = newly_added
-            curr_active.update(newly_added)
 
-        spread.append(len(curr_active))
+#Independent Cascade Model Hypergraphs
 
-    return np.mean(spread)
+import numpy as np
 
+def _bernoulli_positions(rng, m, p):
+    """
+    Sorted positions in range(m), each kept independently with probability p.
 
-#Independent Cascade Model Hypergraphs
+    Geometric skip-sampling: jumps straight from one success to the next, so the cost is
+    O(m*p) instead of O(m). `rng` is a np.random.RandomState or np.random.Generator.
+    """
+    if m <= 0 or p <= 0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(m, dtype=np.int64)
+
+    expected = m * p
+    block = int(expected + 4 * np.sqrt(expected) + 16)
+    positions = np.cumsum(rng.geometric(p, size=block)) - 1
+    while positions[-1] < m:
+        more = np.cumsum(rng.geometric(p, size=block)) + positions[-1]
+        positions = np.concatenate([positions, more])
+    return positions[:np.searchsorted(positions, m)]
 
-import numpy as np
 
-def IC_hypergraph(H, S, p=0.01, mc=10):
+def _incidence_keys(Hc: CSRHypergraph):
+    """Sorted keys e * n + u of every incidence, for vectorized "u in edge e" tests."""
+    return np.sort(Hc.slot_edges.astype(np.int64) * Hc.n_nodes + Hc.edge_members)
+
+
+def _in_edges(keys, n, e, v):
+    """Elementwise: is node id v[i] a member of edge id e[i]?"""
+    q = e.astype(np.int64) * n + v
+    pos = np.searchsorted(keys, q)
+    pos[pos == len(keys)] = 0
+    return keys[pos] == q
+
+
+def _ic_cascade(Hc: CSRHypergraph, seeds, p, rng, keys, active=None):
+    """
+    One IC cascade on the 2-section of Hc, without materializing the 2-section.
+
+    Every newly active u gets one chance (probability p) to activate every user v it shares
+    at least one hyperedge with. Attempts are sampled per (frontier user, incident hyperedge)
+    by skip-sampling over the edge's member array, and a pair (u, v) is only kept on the
+    first hyperedge (in u's incidence order) that both belong to, so users sharing several
+    hyperedges still get exactly one attempt. Memory stays linear in the incidence count.
+
+    `active` is an optional all-False boolean scratch array of length n; it is reset before
+    returning, so callers running many small cascades avoid an O(n) allocation each time.
+
+    Returns the ids of all activated users (seeds included).
+    """
+    n = Hc.n_nodes
+    if active is None:
+        active = np.zeros(n, dtype=bool)
+    frontier = np.unique(np.asarray(seeds, dtype=np.int64))
+    active[frontier] = True
+    reached_all = [frontier]
+
+    while frontier.size:
+        # (u, e, j): frontier user u, its j-th incident hyperedge e
+        starts = Hc.node_ptr[frontier]
+        degs = Hc.node_ptr[frontier + 1] - starts
+        inc_u = np.repeat(frontier, degs)
+        inc_j = np.arange(degs.sum()) - np.repeat(np.cumsum(degs) - degs, degs)
+        inc_e = Hc.node_edges[np.repeat(starts, degs) + inc_j]
+
+        order = np.argsort(inc_e, kind="stable")
+        inc_u, inc_j, inc_e = inc_u[order], inc_j[order], inc_e[order]
+        bounds = np.flatnonzero(np.diff(inc_e)) + 1
+
+        reached = []
+        for grp_u, grp_j, grp_e in zip(np.split(inc_u, bounds), np.split(inc_j, bounds), np.split(inc_e, bounds)):
+            members = Hc.members(grp_e[0])
+            m = len(members)
+
+            # all (frontier user, member) attempts of this hyperedge at once
+            hits = _bernoulli_positions(rng, len(grp_u) * m, p)
+            if not hits.size:
+                continue
+            us, js, vs = grp_u[hits // m], grp_j[hits // m], members[hits % m]
+
+            keep = ~active[vs]
+            us, js, vs = us[keep], js[keep], vs[keep]
+
+            # drop pairs that already had their attempt on an earlier shared hyperedge of u
+            later = np.flatnonzero(js > 0)
+            if later.size:
+                rep = js[later]
+                pair = np.repeat(np.arange(later.size), rep)
+                k = np.arange(rep.sum()) - np.repeat(np.cumsum(rep) - rep, rep)
+                earlier_e = Hc.node_edges[Hc.node_ptr[us[later]][pair] + k]
+                shared = _in_edges(keys, n, earlier_e, vs[later][pair])
+                dup = np.bincount(pair, weights=shared, minlength=later.size) > 0
+                keep = np.ones(len(vs), dtype=bool)
+                keep[later[dup]] = False
+                vs = vs[keep]
+
+            reached.append(vs)
+
+        if not reached:
+            break
+        new_active = np.unique(np.concatenate(reached))
+        new_active = new_active[~active[new_active]]
+        active[new_active] = True
+        reached_all.append(new_active)
+        frontier = new_active
+
+    reached_all = np.concatenate(reached_all)
+    active[reached_all] = False
+    return reached_all
+
+
+# ---------- Batched Monte Carlo: many runs advanced together ----------
+
+# runs simulated together per batch; bounds the (n x runs) work arrays
+BATCH_RUNS = 256
+
+
+def _run_batches(mc):
+    """Split mc runs into batches of at most BATCH_RUNS: yields (batch index, runs)."""
+    for b, start in enumerate(range(0, mc, BATCH_RUNS)):
+        yield b, min(BATCH_RUNS, mc - start)
+
+
+def _class_index(Hc: CSRHypergraph):
+    """
+    Signature-class operators for the batched IC kernel.
+
+    P (classes x n) sums node rows per class; M (classes x classes) is 1 where two class
+    signatures share a hyperedge, so (M @ P @ F)[class(v)] counts the frontier users that
+    are 2-section neighbours of v (plus v itself if it is in the frontier).
+    """
+    from scipy import sparse
+    node_class, class_edges = Hc.signature_classes()
+    n, n_classes = Hc.n_nodes, len(class_edges)
+    P = sparse.csr_matrix((np.ones(n, dtype=np.int32), (node_class, np.arange(n))), shape=(n_classes, n))
+    sizes = [len(sig) for sig in class_edges]
+    Bs = sparse.csr_matrix((np.ones(sum(sizes), dtype=np.int32),
+                            (np.repeat(np.arange(n_classes), sizes),
+                             np.concatenate(class_edges) if class_edges else np.empty(0, dtype=np.int32))),
+                           shape=(n_classes, Hc.n_edges))
+    M = ((Bs @ Bs.T) > 0).astype(np.int32)
+    return node_class, P, M
+
+
+def _ic_batch(Hc: CSRHypergraph, seeds, p, n_runs, rng, index):
+    """
+    `n_runs` IC cascades at once; the state is a dense (n, n_runs) boolean array.
+
+    In every round an inactive user v with c distinct frontier neighbours (in a given run)
+    is activated with probability 1 - (1 - p)^c, which is exactly the chance that at least
+    one of the c independent attempts succeeds. c comes from the signature classes
+    (`_class_index`), so nothing quadratic in the hyperedge sizes is ever built. A round
+    costs two sparse products with the (n, n_runs) frontier for all runs together,
+    instead of one Python-level cascade step per run.
+
+    Returns the activated-user count of every run (length n_runs).
+    """
+    node_class, P, M = index
+    active = np.zeros((Hc.n_nodes, n_runs), dtype=bool)
+    active[seeds] = True
+    frontier = active.copy()
+    log_q = np.log1p(-p) if p < 1 else -np.inf
+
+    while frontier.any():
+        F = frontier.astype(np.int32)
+        c = np.asarray(M @ (P @ F))[node_class] - F
+        candidates = (c > 0) & ~active
+        prob = -np.expm1(c[candidates] * log_q)
+        frontier = np.zeros_like(active)
+        frontier[candidates] = rng.random(len(prob)) < prob
+        active |= frontier
+
+    return active.sum(axis=0)
+
+
+def _lt_batch(Hc: CSRHypergraph, seeds, thr_values):
+    """
+    One LT run per entry of `thr_values` (absolute thresholds), all advanced together on
+    a dense (n, runs) boolean state.
+
+    A user activates in a run once the number of active users it shares hyperedges with
+    (counted once per shared hyperedge, as in LT_hypergraph) exceeds that run's threshold.
+    Returns the activated-user count of every run.
+    """
+    B = Hc.incidence_matrix()
+    thr = np.asarray(thr_values, dtype=float)
+    if len(seeds) == 0:
+        return np.zeros(len(thr), dtype=np.int64)
+    active = np.zeros((Hc.n_nodes, len(thr)), dtype=bool)
+    active[seeds] = True
+
+    while True:
+        active_neighbors = np.asarray(B @ (B.T @ active.astype(np.int32)))
+        newly_added = (active_neighbors > thr) & ~active
+        if not newly_added.any():
+            break
+        active |= newly_added
+
+    return active.sum(axis=0)
+
+
+def IC_hypergraph(H, S, p=0.01, mc=10, batched=False, n_jobs=None, seed=0, rel_error=None, confidence=0.95):
     """
     Independent Cascade (IC) model on a hypergraph.
 
     Parameters
     ----------
-    H  : hypernetx.Hypergraph
+    H  : hypernetx.Hypergraph, CSRHypergraph or edge dict
          Nodes = users, hyperedges = opinion categories.
     S  : iterable
          Initial active seed nodes (user ids).
@@ -266,20 +797,60 @@ def IC_hypergraph(H, S, p=0.01, mc=10):
          Activation probability on each user–user influence attempt.
     mc : int
          Number of Monte Carlo simulations.
+    batched : bool
+         If True, advance batches of simulations together as one boolean (n, runs)
+         state (see `_ic_batch`) instead of one after another.
+    n_jobs : int, optional
+         If given, run the simulations as fixed-size shards on n_jobs worker processes
+         (n_jobs <= 0: all cores), each shard with its own SeedSequence stream spawned
+         from `seed`. The result is identical for every n_jobs, including 1.
+    seed : int
+         Root seed of the shard streams (only used with n_jobs or rel_error).
+    rel_error : float, optional
+         If given, sample adaptively: shards of simulations (streams as with n_jobs) are
+         run until the `confidence` interval of the mean is within rel_error of it, with
+         mc as the cap.
+    confidence : float
+         Confidence level for rel_error.
 
     Returns
     -------
     float
         Average spread (number of activated nodes).
+    SpreadEstimate
+        With rel_error: (mean, stderr, ci, n_sims).
+
+    Works on the incidence arrays (see `_ic_cascade`): memory is linear in the number of
+    (user, hyperedge) incidences instead of quadratic in the hyperedge sizes.
     """
 
-    # ---------- Build 2-section neighbors: users sharing a hyperedge ----------
-    neighbors = {u: set() for u in H.nodes}
+    if rel_error is not None:
+        return SpreadEstimator(H, p=p, mc=mc, batched=batched, seed=seed).estimate_adaptive(S, rel_error, confidence)
 
-    for e in H.edges:          # e is hyperedge name
-        users_in_e = set(H.edges[e])
-        for u in users_in_e:
-            neighbors[u].update(users_in_e - {u})
+    if n_jobs is not None:
+        with SpreadEstimator(H, p=p, mc=mc, batched=batched, n_jobs=n_jobs, seed=seed) as estimator:
+            return estimator.estimate(S)
+
+    Hc = as_csr(H)
+    S, n_outside = Hc.seed_ids(S)
+    if batched:
+        spreads = _ic_spreads(Hc, S, n_outside, p, mc, class_index=_class_index(Hc))
+    else:
+        spreads = _ic_spreads(Hc, S, n_outside, p, mc, keys=_incidence_keys(Hc))
+    return float(np.mean(spreads))
+
+
+def _ic_spreads(Hc: CSRHypergraph, S, n_outside, p, mc, keys=None, class_index=None):
+    """
+    Spread of each of the mc IC simulations of IC_hypergraph (seeds given as node ids).
+
+    Pass `keys` (from `_incidence_keys`) for sequential cascades, or `class_index`
+    (from `_class_index`) for the batched kernel.
+    """
+    if class_index is not None:
+        spreads = [_ic_batch(Hc, S, p, runs, np.random.RandomState(b), class_index)
+                   for b, runs in _run_batches(mc)]
+        return np.concatenate(spreads) + n_outside
 
     spreads = []
 
@@ -287,28 +858,330 @@ def IC_hypergraph(H, S, p=0.01, mc=10):
         # For reproducibility per simulation
         rng = np.random.RandomState(i)
 
-        curr_active = set(S)        # all active so far
-        new_active = set(S)         # frontier in this step
+        # each active u gets ONE chance to activate each neighbor v
+        curr_active = _ic_cascade(Hc, S, p, rng, keys)
 
-        while new_active:
-            next_active = set()
+        spreads.append(len(curr_active) + n_outside)
 
-            for u in new_active:
-                for v in neighbors[u]:
-                    if v in curr_active:
-                        continue
+    return spreads
 
-                    # each active u gets ONE chance to activate each neighbor v
-                    if rng.uniform(0, 1) <= p:
-                        next_active.add(v)
 
-            # new frontier: those just activated and not previously active
-            new_active = next_active - curr_active
-            curr_active |= new_active
+# ---------- Process-pool Monte Carlo (see parallelMC.py) ----------
+# Workers receive the index once (ShardPool state) and then only small tasks. Every shard
+# draws from its own SeedSequence stream, so the results do not depend on how shards are
+# spread over workers.
 
-        spreads.append(len(curr_active))
 
-    return float(np.mean(spreads))
+def _spread_shard(state, task):
+    """Spreads of one shard of simulations; task = (seed ids, n_outside, runs, SeedSequence)."""
+    Hc = state["Hc"]
+    seeds, n_outside, runs, stream = task
+    rng = np.random.default_rng(stream)
+
+    if state["model"] == "LT":
+        thresholds = rng.uniform(state["th_low"], state["th_high"], runs) * Hc.n_nodes
+        if state["batched"]:
+            return _lt_batch(Hc, seeds, thresholds) + n_outside
+        return np.array([_lt_run(Hc, seeds, n_outside, thr, state["lt_index"]) for thr in thresholds])
+
+    if state["batched"]:
+        return _ic_batch(Hc, seeds, state["p"], runs, rng, state["class_index"]) + n_outside
+    return np.array([len(_ic_cascade(Hc, seeds, state["p"], rng, state["keys"]))
+                     for _ in range(runs)]) + n_outside
+
+
+def _extension_shard(state, task):
+    """Mean spread of S + [c] for every candidate c; task = (seed ids, n_outside, candidate ids, streams)."""
+    S, n_outside, candidates, streams = task
+    means = []
+    for c in candidates:
+        seeds = np.append(S, c)
+        spreads = [_spread_shard(state, (seeds, n_outside, runs, stream)) for runs, stream in streams]
+        means.append(float(np.mean(np.concatenate(spreads))))
+    return means
+
+
+class SpreadEstimator:
+    """
+    Reusable, stateful spread oracle for one hypergraph.
+
+    The incidence index (CSR arrays, incidence keys or signature classes) is built on the
+    first call and kept, keyed by the hypergraph's identity and structural version (see
+    csrHypergraph.as_csr), so a CELF run pays the preprocessing once instead of on every
+    spread evaluation. Results are exactly those of IC_hypergraph / LT_hypergraph with the
+    same parameters.
+
+    Parameters
+    ----------
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
+    p : float
+        IC activation probability.
+    mc : int
+        Monte Carlo simulations per estimate.
+    model : "IC" or "LT"
+    th_low, th_high : float
+        LT threshold range (see LT_hypergraph).
+    batched : bool
+        Use the batched kernels.
+    n_jobs : int, optional
+        Run the simulations as sharded SeedSequence streams on a process pool of n_jobs
+        workers (see IC_hypergraph). The pool is started on first use and kept until
+        `close()` (or the end of a `with` block).
+    seed : int
+        Root seed of the shard streams (only used with n_jobs).
+    """
+
+    def __init__(self, H, p=0.01, mc=10, model="IC", th_low=0.0, th_high=0.1, batched=False,
+                 n_jobs=None, seed=0):
+        if model not in ("IC", "LT"):
+            raise ValueError(f"unknown diffusion model {model!r}, expected 'IC' or 'LT'")
+        self.H = H
+        self.p = p
+        self.mc = mc
+        self.model = model
+        self.th_low = th_low
+        self.th_high = th_high
+        self.batched = batched
+        self.n_jobs = n_jobs
+        self.seed = seed
+        self.n_calls = 0
+        self._Hc = None
+        self._keys = None
+        self._class_index = None
+        self._lt_index = None
+        self._pool = None
+
+    def index(self) -> CSRHypergraph:
+        """The CSR form of H, (re)building the cached index if H changed."""
+        Hc = as_csr(self.H)
+        if Hc is not self._Hc:
+            self._Hc = Hc
+            self._keys = _incidence_keys(Hc) if self.model == "IC" and not self.batched else None
+            self._class_index = _class_index(Hc) if self.model == "IC" and self.batched else None
+            self._lt_index = Hc.derived("lt_index", _lt_index) if self.model == "LT" and not self.batched else None
+            self.close()
+        return Hc
+
+    def pool(self) -> ShardPool:
+        """The worker pool for the current index (n_jobs mode only)."""
+        if self._pool is None:
+            self._pool = ShardPool(self.n_jobs, self._state())
+        return self._pool
+
+    def _state(self):
+        """Shard-worker state (see `_spread_shard`) for the current index."""
+        Hc = self.index()
+        return {"Hc": Hc, "model": self.model, "p": self.p, "th_low": self.th_low,
+                "th_high": self.th_high, "batched": self.batched,
+                "keys": self._keys, "class_index": self._class_index,
+                "lt_index": self._lt_index}
+
+    def shard_size(self) -> int:
+        return BATCH_RUNS if self.batched else MC_SHARD_SIZE
+
+    def streams(self):
+        """(runs, SeedSequence) of every shard; the same streams are reused by every estimate."""
+        return shard_streams(self.mc, self.seed, self.shard_size())
+
+    def estimate(self, S) -> float:
+        """Expected spread of seed set S (user labels)."""
+        Hc = self.index()
+        seeds, n_outside = Hc.seed_ids(S)
+        self.n_calls += 1
+        if self.n_jobs is not None:
+            tasks = [(seeds, n_outside, runs, stream) for runs, stream in self.streams()]
+            return float(np.mean(np.concatenate(self.pool().map(_spread_shard, tasks))))
+        if self.model == "LT":
+            return float(np.mean(_lt_spreads(Hc, seeds, n_outside, self.th_low, self.th_high,
+                                             self.mc, self.batched, self._lt_index)))
+        return float(np.mean(_ic_spreads(Hc, seeds, n_outside, self.p, self.mc,
+                                         self._keys, self._class_index)))
+
+    def estimate_adaptive(self, S, rel_error=0.05, confidence=0.95, min_mc=None) -> SpreadEstimate:
+        """
+        Spread of S with confidence-interval stopping (see parallelMC.adaptive_mc).
+
+        Simulates shard after shard until the confidence interval is within rel_error of
+        the mean, with self.mc as the cap. The shards use the streams of `streams()`, so
+        the mean equals the n_jobs estimate with mc = n_sims. Runs in this process.
+        """
+        state = self._state()
+        seeds, n_outside = state["Hc"].seed_ids(S)
+        self.n_calls += 1
+        shard_size = self.shard_size()
+        return adaptive_mc(lambda runs, stream: _spread_shard(state, (seeds, n_outside, runs, stream)),
+                           rel_error, confidence, min_mc=2 * shard_size if min_mc is None else min_mc,
+                           max_mc=self.mc, seed=self.seed, shard_size=shard_size)
+
+    def estimate_many(self, seed_sets) -> List[float]:
+        """estimate(S) for every S in seed_sets, sharing one index lookup."""
+        self.index()
+        return [self.estimate(S) for S in seed_sets]
+
+    def estimate_extensions(self, S, candidates) -> List[float]:
+        """
+        estimate(S + [c]) for every candidate c (user labels, not in S).
+
+        With n_jobs the candidates are spread over the workers, each evaluating its
+        candidates on all shards; the values equal those of `estimate`.
+        """
+        candidates = list(candidates)
+        if self.n_jobs is None:
+            return [self.estimate(list(S) + [c]) for c in candidates]
+
+        Hc = self.index()
+        pool = self.pool()
+        seeds, n_outside = Hc.seed_ids(S)
+        ids = [Hc.node_index[c] for c in candidates]
+        streams = self.streams()
+        chunk = max(1, -(-len(ids) // (4 * pool.n_jobs)))
+        tasks = [(seeds, n_outside, ids[i:i + chunk], streams) for i in range(0, len(ids), chunk)]
+        self.n_calls += len(ids)
+        return [value for values in pool.map(_extension_shard, tasks) for value in values]
+
+    def close(self):
+        """Shut down the worker pool, if any (it is restarted on the next estimate)."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    __call__ = estimate
+
+
+# ---------- Common random numbers: marginal gains against fixed live-edge worlds ----------
+
+def _slot_rank(Hc: CSRHypergraph):
+    """Position of every incidence slot in its user's incidence list (ascending edge ids)."""
+    rank = np.empty(len(Hc.node_slots), dtype=np.int64)
+    degs = np.diff(Hc.node_ptr)
+    rank[Hc.node_slots] = np.arange(len(Hc.node_slots)) - np.repeat(Hc.node_ptr[:-1], degs)
+    return rank
+
+
+def _ic_world(Hc: CSRHypergraph, p, rng, keys, slot_rank):
+    """
+    One live-edge world of IC on the 2-section of Hc, as a sparse n x n matrix of live arcs.
+
+    Every ordered pair (u, v) of users sharing a hyperedge is live independently with
+    probability p; as in `_ic_cascade` the pair is drawn on its first shared hyperedge only,
+    so users sharing several hyperedges still get a single attempt. The spread of any seed
+    set in this world is the number of users reachable from it.
+
+    The arcs are explicit: O(p * sum_e |e|^2) time and memory per world, the 2-section
+    density that the cascade kernels avoid. Only use it where all-pairs reachability is
+    needed (`_crn_gains`).
+    """
+    from scipy import sparse
+    n = Hc.n_nodes
+    arcs_u, arcs_v = [], []
+    for e in range(Hc.n_edges):
+        lo = Hc.edge_ptr[e]
+        members = Hc.edge_members[lo:Hc.edge_ptr[e + 1]]
+        m = len(members)
+        hits = _bernoulli_positions(rng, m * m, p)
+        a, b = hits // m, hits % m
+        keep = a != b
+        a, b = a[keep], b[keep]
+        us, vs, js = members[a], members[b], slot_rank[lo + a]
+
+        # drop pairs that already had their attempt on an earlier shared hyperedge of u
+        later = np.flatnonzero(js > 0)
+        if later.size:
+            rep = js[later]
+            pair = np.repeat(np.arange(later.size), rep)
+            k = np.arange(rep.sum()) - np.repeat(np.cumsum(rep) - rep, rep)
+            earlier_e = Hc.node_edges[Hc.node_ptr[us[later]][pair] + k]
+            shared = _in_edges(keys, n, earlier_e, vs[later][pair])
+            dup = np.bincount(pair, weights=shared, minlength=later.size) > 0
+            keep = np.ones(len(vs), dtype=bool)
+            keep[later[dup]] = False
+            us, vs = us[keep], vs[keep]
+        arcs_u.append(us)
+        arcs_v.append(vs)
+
+    us = np.concatenate(arcs_u) if arcs_u else np.empty(0, dtype=np.int64)
+    vs = np.concatenate(arcs_v) if arcs_v else np.empty(0, dtype=np.int64)
+    return sparse.csr_matrix((np.ones(len(us), dtype=np.int8), (us, vs)), shape=(n, n))
+
+
+def _world_reach(G, seeds):
+    """Boolean mask of the users reachable from `seeds` (node ids) in world G."""
+    reached = np.zeros(G.shape[0], dtype=bool)
+    frontier = np.unique(np.asarray(seeds, dtype=np.int64))
+    reached[frontier] = True
+    while frontier.size:
+        targets = G.indices[csr_slots(G.indptr, frontier)]
+        frontier = np.unique(targets[~reached[targets]])
+        reached[frontier] = True
+    return reached
+
+
+def _crn_gains(Hc: CSRHypergraph, seeds, p, mc, rng, keys, slot_rank):
+    """
+    Spread of `seeds` and marginal gain of every user, all on the same mc worlds.
+
+    In each world the gain of a user v is the number of users v reaches that the seeds do
+    not (0 for users already reached: everything they reach is reached too). All gains of
+    a world come from one condensation of it (csrGraph.reach_sums with the unreached users
+    weighted 1). Returns (mean spread of seeds, mean gain per node id).
+    """
+    n = Hc.n_nodes
+    base = 0.0
+    gains = np.zeros(n)
+    for _ in range(mc):
+        G = _ic_world(Hc, p, rng, keys, slot_rank)
+        reached = _world_reach(G, seeds)
+        base += reached.sum()
+        gains += reach_sums(G, ~reached)
+    return base / mc, gains / mc
+
+
+def ic_marginal_gains(H, S, p=0.01, mc=100, seed=0):
+    """
+    IC marginal gains sigma(S + [v]) - sigma(S) of every user v, with common random numbers.
+
+    All gains are measured on the same mc sampled live-edge worlds (and against the same
+    users already reached by S), so differences between candidates are not swamped by
+    the noise of independent estimates: no gain is ever negative, and the ranking of
+    candidates is stable at much smaller mc than separate IC_hypergraph calls need.
+
+    Size limit: every gain needs the reachability of the whole world, so each world is
+    materialized as its live arcs (`_ic_world`), about p * sum_e |e|^2 of them, built
+    one world at a time. That is fine up to a few million arcs, but one 50k-member
+    hyperedge at p = 0.01 already gives 25M arcs per world. Past that, use
+    CELF_quotient_hypergraph or IMM_IC_hypergraph, whose cost is linear in the
+    incidences (or classes).
+
+    Parameters
+    ----------
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
+    S : iterable
+        Current seed set (user labels).
+    p : float
+        Activation probability in IC.
+    mc : int
+        Number of sampled worlds.
+    seed : int or np.random.SeedSequence
+        Seed of the np.random.Generator drawing the worlds.
+
+    Returns
+    -------
+    spread : float
+        Estimated spread of S (users of S outside H included).
+    gains : np.ndarray of float
+        Estimated marginal gain of every user, in Hc.nodes order (0 for users in S).
+    """
+    Hc = as_csr(H)
+    seeds, n_outside = Hc.seed_ids(S)
+    spread, gains = _crn_gains(Hc, seeds, p, mc, np.random.default_rng(seed),
+                               _incidence_keys(Hc), Hc.derived("slot_rank", _slot_rank))
+    return spread + n_outside, gains
 
 
 import time
@@ -380,13 +1253,13 @@ import time
 import time
 import numpy as np
 
-def greedyIC_hypergraph(H, k, p=0.1, mc=1000):
+def greedyIC_hypergraph(H, k, p=0.1, mc=1000, batched=False, n_jobs=None, seed=0, crn=False, epsilon=None):
     """
     Greedy hill-climbing seed selection under IC diffusion on a hypergraph.
 
     Parameters
     ----------
-    H  : hypernetx.Hypergraph
+    H  : hypernetx.Hypergraph, CSRHypergraph or edge dict
          Nodes = users; hyperedges = opinion categories.
     k  : int
          Number of seeds to pick.
@@ -394,6 +1267,26 @@ def greedyIC_hypergraph(H, k, p=0.1, mc=1000):
          Activation probability in IC model.
     mc : int
          Monte Carlo simulations.
+    batched : bool
+         If True, every spread estimate runs its mc simulations batched (see `_ic_batch`).
+    n_jobs : int, optional
+         If given, evaluate the candidates of each round on n_jobs worker processes,
+         every estimate using the same sharded SeedSequence streams (spawned from `seed`,
+         see SpreadEstimator). The selection is identical for every n_jobs.
+    seed : int
+         Root seed of the shard streams (only used with n_jobs) and of the worlds of crn.
+    crn : bool
+         If True, each round samples mc live-edge worlds once and measures the gain of
+         every candidate on those same worlds (`ic_marginal_gains`) instead of running
+         independent simulations per candidate; gains are then never negative and far
+         less noisy, so a much smaller mc gives the same ranking. batched and n_jobs are
+         ignored in this mode. Every world holds about p * sum_e |e|^2 live arcs (see the
+         size limit in `ic_marginal_gains`), so this suits hyperedges up to a few
+         thousand members at p = 0.01.
+    epsilon : float, optional
+         Stochastic greedy: each round evaluates only a random sample of
+         ceil((n / k) * ln(1 / epsilon)) candidates (see `stochastic_greedy`), drawn
+         with np.random.default_rng(seed). 0 < epsilon < 1.
 
     Returns
     -------
@@ -402,38 +1295,37 @@ def greedyIC_hypergraph(H, k, p=0.1, mc=1000):
     spread    : list of best spread after each iteration
     timeLapse : elapsed time after each iteration
     """
+    if epsilon is not None and not 0 < epsilon < 1:
+        raise ValueError(f"epsilon must be in (0, 1), got {epsilon}")
 
-    # ---- Precompute 2-section neighbors once (same as in IC_hypergraph) ----
-    neighbors = {u: set() for u in H.nodes}
+    # ---- Precompute the incidence index once (same as in IC_hypergraph) ----
+    Hc = as_csr(H)
     print("Computing initial marginal gains...")
-    for e in H.edges:
-        users_in_e = set(H.edges[e])
-        for u in users_in_e:
-            neighbors[u].update(users_in_e - {u})
-
-    # ---- IC function using precomputed neighbors ----
+    keys = _incidence_keys(Hc)
+    index = _class_index(Hc) if batched else None
+    estimator = None
+    if epsilon is not None:
+        sample_rng = np.random.default_rng(seed)
+        sample_size = stochastic_sample_size(Hc.n_nodes, k, epsilon)
+    if crn:
+        slot_rank = Hc.derived("slot_rank", _slot_rank)
+        round_seeds = np.random.SeedSequence(seed).spawn(k)
+    elif n_jobs is not None:
+        estimator = SpreadEstimator(Hc, p=p, mc=mc, batched=batched, n_jobs=n_jobs, seed=seed)
+
+    # ---- IC function on the incidence form ----
     def IC_fast(seed_set):
+        if estimator is not None:
+            return estimator.estimate([Hc.nodes[u] for u in seed_set])
         spreads = []
+        seeds = np.asarray(seed_set, dtype=np.int64)
+        if batched:
+            for b, runs in _run_batches(mc):
+                spreads.append(_ic_batch(Hc, seeds, p, runs, np.random.RandomState(b), index))
+            return np.mean(np.concatenate(spreads))
         for sim in range(mc):
             rng = np.random.RandomState(sim)
-
-            curr_active = set(seed_set)
-            new_active = set(seed_set)
-
-            while new_active:
-                next_active = set()
-
-                for u in new_active:
-                    for v in neighbors[u]:
-                        if v in curr_active:
-                            continue
-                        if rng.uniform(0, 1) <= p:
-                            next_active.add(v)
-
-                new_active = next_active - curr_active
-                curr_active |= new_active
-
-            spreads.append(len(curr_active))
+            spreads.append(len(_ic_cascade(Hc, seeds, p, rng, keys)))
 
         return np.mean(spreads)
 
@@ -447,11 +1339,26 @@ def greedyIC_hypergraph(H, k, p=0.1, mc=1000):
         bestSpread = 0
         bestNode = None
 
-        currentSpread = IC_fast(S)
-        print(currentSpread)
-        for candidate in set(H.nodes) - set(S):
+        candidates = sorted(set(range(Hc.n_nodes)) - set(S))
+        if epsilon is not None:
+            candidates = sorted(sample_rng.choice(candidates, size=min(sample_size, len(candidates)),
+                                                  replace=False).tolist())
+        if crn:
+            # one set of worlds per round, shared by S and every candidate
+            currentSpread, gains = _crn_gains(Hc, S, p, mc, np.random.default_rng(round_seeds[i]), keys, slot_rank)
+            print(currentSpread)
+            newSpreads = currentSpread + gains[candidates]
+        elif estimator is not None:
+            currentSpread = IC_fast(S)
+            print(currentSpread)
+            newSpreads = estimator.estimate_extensions([Hc.nodes[u] for u in S],
+                                                       [Hc.nodes[u] for u in candidates])
+        else:
+            currentSpread = IC_fast(S)
+            print(currentSpread)
+            newSpreads = (IC_fast(S + [candidate]) for candidate in candidates)
+        for candidate, newSpread in zip(candidates, newSpreads):
 
-            newSpread = IC_fast(S + [candidate])
             marginalSpread = newSpread - currentSpread
             print(marginalSpread)
             if marginalSpread > bestSpread:
@@ -464,22 +1371,265 @@ def greedyIC_hypergraph(H, k, p=0.1, mc=1000):
         spread.append(bestSpread)
         timeLapse.append(time.time() - startTime)
 
-    return S, spread, timeLapse
+    if estimator is not None:
+        estimator.close()
 
+    return [Hc.nodes[u] for u in S], spread, timeLapse
 
 
-##CELF Independent Cascade
 
+## Lazy greedy (CELF / CELF++) over any spread oracle
+
+import heapq
+import math
 import time
 import numpy as np
 
-def CELF_IC_hypergraph(H, k, p=0.01, mc=10, spread_func=None):
+
+def lazy_greedy(spread_func, candidates, k, method="celf", verbose=True, tag="CELF", initial_gains=None,
+                next_candidate=None):
+    """
+    Heap-based lazy greedy seed selection (CELF, or CELF++ with look-ahead).
+
+    Parameters
+    ----------
+    spread_func : callable
+        Spread oracle: spread_func(list of seeds) -> expected spread.
+    candidates : iterable
+        Candidate seeds (e.g. H.nodes).
+    k : int
+        Number of seeds to select.
+    method : "celf" or "celfpp"
+        "celfpp" keeps, per candidate u, mg1 = gain w.r.t. S, prev_best = best candidate of
+        the current round when mg1 was computed, mg2 = gain w.r.t. S + [prev_best] and
+        flag = |S| at that time (Goyal, Lu & Lakshmanan 2011). If prev_best became the
+        last seed, mg2 is u's exact new gain and no oracle call is made.
+    verbose : bool
+        Print one progress line per selected seed.
+    tag : str
+        Prefix of the progress lines.
+    initial_gains : sequence of float, optional
+        Singleton spreads of the candidates (same order), e.g. from `influence_table`.
+        Replaces the initial pass of one oracle call per candidate; the spread of the
+        first seed is then re-evaluated with spread_func so later gains are measured
+        against the oracle. CELF++ starts without look-ahead in this case.
+    next_candidate : callable, optional
+        next_candidate(u) -> candidate offered once u is selected, or None. For pools of
+        interchangeable candidates (e.g. the users of one quotient class), only one of
+        which needs to be evaluated at a time: the offered candidate enters the heap with
+        u's marginal gain as a stale bound and is evaluated when it reaches the top.
+
+    Returns
+    -------
+    S : list
+        Selected seeds.
+    timeLapse : list of float
+        Elapsed time (seconds) after each selected seed.
+    current_spread : float
+        Spread of S (sum of the accepted marginal gains).
+    stats : dict
+        oracle_calls   - spread_func calls made
+        greedy_calls   - calls plain (non-lazy) greedy would have made
+        calls_saved    - greedy_calls - oracle_calls
+        lookups        - candidates re-evaluated in each round
+        lookahead_hits - CELF++ gains taken from mg2 without an oracle call
+    """
+    if method not in ("celf", "celfpp"):
+        raise ValueError(f"unknown lazy greedy method {method!r}, expected 'celf' or 'celfpp'")
+    celfpp = method == "celfpp"
+
+    startTime = time.time()
+    cand = list(candidates)
+    n = len(cand)
+    calls = 0
+
+    def f(S):
+        nonlocal calls
+        calls += 1
+        return spread_func(S)
+
+    # per-candidate state table (indexed by candidate position), with room for offered candidates
+    size = n + (k if next_candidate is not None else 0)
+    mg1 = np.zeros(size)
+    mg2 = np.zeros(size)
+    prev_best = np.full(size, -1, dtype=np.int64)
+    flag = np.zeros(size, dtype=np.int64)
+
+    # ---------- 1. Initial marginal gains (with S = ∅) ----------
+    cur_best = -1
+    if initial_gains is not None:
+        mg1[:n] = initial_gains
+        mg2[:n] = mg1[:n]
+    for i, u in enumerate(cand if initial_gains is None else ()):
+        mg1[i] = f([u])
+        if celfpp:
+            prev_best[i] = cur_best
+            mg2[i] = f([cand[cur_best], u]) - mg1[cur_best] if cur_best >= 0 else mg1[i]
+            if cur_best < 0 or mg1[i] > mg1[cur_best]:
+                cur_best = i
+
+    # max-heap on gain; ties go to the earlier candidate
+    heap = [(-mg1[i], i) for i in range(n)]
+    heapq.heapify(heap)
+
+    S, timeLapse, lookups = [], [], []
+    current_spread = 0.0
+    last_seed = -1
+    cur_best = -1
+    lookahead_hits = 0
+    greedy_calls = 0
+
+    # ---------- 2. Main lazy loop ----------
+    while len(S) < k and heap:
+        round_lookups = 0
+        greedy_calls += len(cand) - len(S)
+        while True:
+            _, i = heapq.heappop(heap)
+
+            # gain is up to date for the current S: it is the true best
+            if flag[i] == len(S):
+                break
+
+            round_lookups += 1
+            if celfpp and last_seed >= 0 and prev_best[i] == last_seed and flag[i] == len(S) - 1:
+                # look-ahead: gain w.r.t. S_old + [last_seed] was already computed
+                mg1[i] = mg2[i]
+                lookahead_hits += 1
+            else:
+                mg1[i] = f(S + [cand[i]]) - current_spread
+                if celfpp:
+                    prev_best[i] = cur_best
+                    if cur_best >= 0:
+                        base = current_spread + mg1[cur_best]
+                        mg2[i] = f(S + [cand[cur_best], cand[i]]) - base
+                    else:
+                        mg2[i] = mg1[i]
+            flag[i] = len(S)
+            if cur_best < 0 or mg1[i] > mg1[cur_best]:
+                cur_best = i
+            heapq.heappush(heap, (-mg1[i], i))
+
+        # add this node to the seed set
+        S.append(cand[i])
+        current_spread += mg1[i]
+        if initial_gains is not None and len(S) == 1:
+            # warm start: anchor later gains on the oracle, not on the table estimate
+            current_spread = f(S)
+        last_seed = i
+        cur_best = -1
+        lookups.append(round_lookups)
+        timeLapse.append(time.time() - startTime)
+
+        offered = next_candidate(cand[i]) if next_candidate is not None else None
+        if offered is not None:
+            # submodularity bounds its gain by the seed's; flag -1 forces an evaluation
+            j = len(cand)
+            cand.append(offered)
+            mg1[j] = mg2[j] = mg1[i]
+            flag[j] = -1
+            heapq.heappush(heap, (-mg1[j], j))
+
+        if verbose:
+            print(f"[{tag}] selected seed {len(S)}: {cand[i]}, marginal gain = {mg1[i]:.4f}, "
+                  f"spread ≈ {current_spread:.4f}, lookups = {round_lookups}, "
+                  f"elapsed = {timeLapse[-1]:.1f}s")
+
+    stats = {"oracle_calls": calls,
+             "greedy_calls": greedy_calls,
+             "calls_saved": greedy_calls - calls,
+             "lookups": lookups,
+             "lookahead_hits": lookahead_hits}
+    return S, timeLapse, float(current_spread), stats
+
+
+
+## Stochastic greedy ("lazier than lazy greedy") over any spread oracle
+
+def stochastic_sample_size(n, k, epsilon):
+    """Candidates evaluated per round: ceil((n / k) * ln(1 / epsilon)), at most n."""
+    return min(n, int(math.ceil(n / max(k, 1) * math.log(1 / epsilon))))
+
+
+def stochastic_greedy(spread_func, candidates, k, epsilon=0.1, seed=0, verbose=True, tag="SG"):
+    """
+    Stochastic greedy (Mirzasoleiman et al. 2015) over any spread oracle.
+
+    Each round evaluates only a random sample of `stochastic_sample_size(n, k, epsilon)`
+    remaining candidates and adds the best of them. For a monotone submodular spread this
+    is a (1 - 1/e - epsilon)-approximation in expectation, with about n * ln(1/epsilon)
+    oracle calls in total whatever k is (plain greedy needs about n * k).
+
+    Parameters
+    ----------
+    spread_func : callable
+        spread_func(S) -> expected spread of seed list S, e.g. SpreadEstimator(H).estimate,
+        or lambda S: IM.IC(G, S, p, mc) for the graph models.
+    candidates : iterable
+        Candidate seeds.
+    k : int
+        Number of seeds to select.
+    epsilon : float
+        Approximation slack, 0 < epsilon < 1 (smaller: larger samples).
+    seed : int
+        Seed of the np.random.Generator drawing the samples.
+    verbose : bool
+        Print one progress line per selected seed.
+    tag : str
+        Prefix of the progress lines.
+
+    Returns
+    -------
+    S : list
+    timeLapse : list of float
+    current_spread : float
+        spread_func(S) of the final seed set.
+    stats : dict
+        oracle_calls, greedy_calls (see `lazy_greedy`) and sample_size.
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError(f"epsilon must be in (0, 1), got {epsilon}")
+    startTime = time.time()
+    rng = np.random.default_rng(seed)
+    cand = list(candidates)
+    n = len(cand)
+    k = min(k, n)
+    s = stochastic_sample_size(n, k, epsilon)
+
+    remaining = np.arange(n)
+    S, timeLapse = [], []
+    current_spread = 0.0
+    calls = 0
+    for _ in range(k):
+        sample = np.sort(rng.choice(remaining, size=min(s, len(remaining)), replace=False))
+        values = [spread_func(S + [cand[i]]) for i in sample]
+        calls += len(sample)
+        best = int(np.argmax(values))
+        i = sample[best]
+        gain = values[best] - current_spread
+        S.append(cand[i])
+        current_spread = values[best]
+        remaining = remaining[remaining != i]
+        timeLapse.append(time.time() - startTime)
+
+        if verbose:
+            print(f"[{tag}] selected seed {len(S)}: {cand[i]}, marginal gain = {gain:.4f}, "
+                  f"spread ≈ {current_spread:.4f}, sampled = {len(sample)}, "
+                  f"elapsed = {timeLapse[-1]:.1f}s")
+
+    stats = {"oracle_calls": calls,
+             "greedy_calls": sum(n - j for j in range(len(S))),
+             "sample_size": s}
+    return S, timeLapse, float(current_spread), stats
+
+##CELF Independent Cascade
+
+def CELF_IC_hypergraph(H, k, p=0.01, mc=10, spread_func=None, return_stats=False, warm_start=False):
     """
     CELF optimization for Independent Cascade on a hypergraph.
 
     Parameters
     ----------
-    H : hypernetx.Hypergraph
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
         Your opinionated hypergraph (nodes = users, edges = opinion hyperedges).
     k : int
         Number of seeds to select.
@@ -489,7 +1639,14 @@ def CELF_IC_hypergraph(H, k, p=0.01, mc=10, spread_func=None):
         Number of Monte Carlo simulations for IC.
     spread_func : callable or None
         Function that returns expected spread for a given seed set.
-        If None, defaults to IC_hypergraph(H, S, p, mc).
+        If None, defaults to SpreadEstimator(H, p, mc).estimate, i.e. IC_hypergraph(H, S, p, mc)
+        with the hypergraph index built only once.
+    return_stats : bool
+        Also return the oracle-call statistics of `lazy_greedy`.
+    warm_start : bool
+        Take the initial (singleton) gains from `influence_table(H, p)` instead of one
+        oracle call per user. Only meaningful when the oracle is IC with the same p; the
+        table is a heuristic starting order, not upper bounds (see influence_table).
 
     Returns
     -------
@@ -499,89 +1656,333 @@ def CELF_IC_hypergraph(H, k, p=0.01, mc=10, spread_func=None):
         timeLapse[i] = elapsed time (seconds) after selecting (i+1)-th seed.
     final_mean_spread : float
         Expected spread (mean over mc runs) for final seed set S.
+    stats : dict (only if return_stats)
+        See `lazy_greedy`.
     """
 
     # Use IC on hypergraph as default spread function
+    H = as_csr(H)
     if spread_func is None:
-        def spread_func(S):
-            return IC_hypergraph(H, S, p=p, mc=mc)
+        # index built once, reused by every spread evaluation below
+        spread_func = SpreadEstimator(H, p=p, mc=mc).estimate
+
+    # warm start: singleton gains from one shared pool of RR sets instead of n oracle calls
+    initial_gains = influence_table(H, p=p) if warm_start else None
+    if initial_gains is None:
+        print("Computing initial marginal gains...")
+    S, timeLapse, final_mean_spread, stats = lazy_greedy(spread_func, H.nodes, k, method="celf", tag="CELF",
+                                                         initial_gains=initial_gains)
+    print(f"[CELF] oracle calls = {stats['oracle_calls']}, saved vs greedy = {stats['calls_saved']}")
+
+    if return_stats:
+        return S, timeLapse, final_mean_spread, stats
+    return S, timeLapse, final_mean_spread
 
-    startTime = time.time()
 
-    # Current seed set, spread and time history
-    S = []
-    timeLapse = []
-    current_spread = 0.0
+def CELFPP_IC_hypergraph(H, k, p=0.01, mc=10, spread_func=None, return_stats=False, warm_start=False):
+    """
+    CELF++ (lazy greedy with look-ahead) for Independent Cascade on a hypergraph.
 
-    # CELF priority queue: list of [node, marginal_gain, last_updated_seed_set_size]
-    Q = []
+    Parameters
+    ----------
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
+        Your opinionated hypergraph (nodes = users, hyperedges = opinions).
+    k : int
+        Number of seeds to select.
+    p : float
+        Activation probability in IC.
+    mc : int
+        Number of Monte Carlo simulations for IC.
+    spread_func : callable or None
+        Function taking a seed list S and returning expected spread.
+        If None, uses SpreadEstimator(H, p, mc).estimate, i.e. IC_hypergraph(H, S, p, mc)
+        with the hypergraph index built only once.
+    return_stats : bool
+        Also return the oracle-call statistics of `lazy_greedy`.
+    warm_start : bool
+        Take the initial (singleton) gains from `influence_table(H, p)` instead of one
+        oracle call per user. Only meaningful when the oracle is IC with the same p; the
+        table is a heuristic starting order, not upper bounds (see influence_table).
 
-    # ---------- 1. Initial marginal gains (with S = ∅) ----------
-    print("Computing initial marginal gains...")
-    for u in H.nodes:
-        # gain = spread({u}) - spread(∅) = spread({u})
-        mg = spread_func([u])
-        Q.append([u, mg, 0])
-        print(Q)
+    Returns
+    -------
+    S : list
+        Final seed set of size k.
+    timeLapse : list of float
+        timeLapse[i] = elapsed time (seconds) after selecting (i+1)-th seed.
+    final_mean_spread : float
+        Expected spread for the final seed set S.
+    stats : dict (only if return_stats)
+        See `lazy_greedy`.
+    """
 
-    # sort by marginal gain descending
-    Q.sort(key=lambda x: x[1], reverse=True)
+    # Default spread function: IC on your hypergraph
+    H = as_csr(H)
+    if spread_func is None:
+        # index built once, reused by every spread evaluation below
+        spread_func = SpreadEstimator(H, p=p, mc=mc).estimate
+
+    # warm start: singleton gains from one shared pool of RR sets instead of n oracle calls
+    initial_gains = influence_table(H, p=p) if warm_start else None
+    if initial_gains is None:
+        print("CELF++: computing initial marginal gains...")
+    S, timeLapse, final_mean_spread, stats = lazy_greedy(spread_func, H.nodes, k, method="celfpp", tag="CELF++",
+                                                         initial_gains=initial_gains)
+    print(f"[CELF++] oracle calls = {stats['oracle_calls']}, saved vs greedy = {stats['calls_saved']}, "
+          f"look-ahead hits = {stats['lookahead_hits']}")
+
+    if return_stats:
+        return S, timeLapse, final_mean_spread, stats
+    return S, timeLapse, final_mean_spread
 
-    # ---------- 2. Main CELF loop ----------
-    for i in range(k):
-        print(S)
-        while True:
-            v, mg, last = Q[0]
 
-            # if this node's marginal gain was computed for the current S, accept it
-            if last == len(S):
-                break
+## IMM (reverse influence sampling) Independent Cascade
 
-            # otherwise, recompute its marginal gain w.r.t. current S
-            new_spread = spread_func(S + [v])
-            new_mg = new_spread - current_spread
+import math
+import time
+import numpy as np
 
-            # update top element and re-sort
-            Q[0] = [v, new_mg, len(S)]
-            Q.sort(key=lambda x: x[1], reverse=True)
 
-        # now Q[0] has the true best marginal node for current S
-        v, mg, last = Q.pop(0)
+def _sample_rr_sets(Hc: CSRHypergraph, p, count, rng, keys, scratch, rr_nodes, rr_sizes):
+    """
+    Append `count` reverse-reachable (RR) sets for IC on the 2-section of Hc.
 
-        # add this node to the seed set
-        S.append(v)
-        current_spread += mg
+    The 2-section is symmetric and every directed attempt u -> v is an independent
+    Bernoulli(p), so the users that can reach a random root v in a sampled world have the
+    same law as the users a forward cascade from v reaches: `_ic_cascade` is reused as is.
+    """
+    roots = rng.randint(Hc.n_nodes, size=count)
+    for v in roots:
+        rr = _ic_cascade(Hc, [v], p, rng, keys, scratch)
+        rr_nodes.append(rr)
+        rr_sizes.append(len(rr))
 
-        # record time
-        timeLapse.append(time.time() - startTime)
 
-        print(f"Selected seed {len(S)}: {v}, marginal gain = {mg:.4f}, "
-              f"current spread ≈ {current_spread:.4f}")
-        print("Time Elapsed: ",time.time()-startTime)
-    final_mean_spread = current_spread
-    return S, timeLapse, final_mean_spread
+def _rr_node_selection(n, rr_nodes, rr_sizes, k, on_pick=None):
+    """
+    Greedy maximum coverage of the RR sets.
 
+    Returns (seed ids, fraction of RR sets covered). Ties go to the lowest node id.
+    """
+    members = np.concatenate(rr_nodes) if rr_nodes else np.empty(0, dtype=np.int64)
+    rr_ptr = np.zeros(len(rr_sizes) + 1, dtype=np.int64)
+    np.cumsum(rr_sizes, out=rr_ptr[1:])
+    rr_of_slot = np.repeat(np.arange(len(rr_sizes)), rr_sizes)
+
+    # node -> RR sets containing it
+    order = np.argsort(members, kind="stable")
+    node_rr = rr_of_slot[order]
+    node_ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(members, minlength=n), out=node_ptr[1:])
+
+    counts = np.diff(node_ptr).astype(np.int64)
+    covered = np.zeros(len(rr_sizes), dtype=bool)
+    seeds = []
+    n_covered = 0
+    for _ in range(min(k, n)):
+        u = int(np.argmax(counts))
+        seeds.append(u)
+        rrs = node_rr[node_ptr[u]:node_ptr[u + 1]]
+        rrs = rrs[~covered[rrs]]
+        covered[rrs] = True
+        n_covered += len(rrs)
+        if rrs.size:
+            starts, ends = rr_ptr[rrs], rr_ptr[rrs + 1]
+            lengths = ends - starts
+            idx = np.repeat(starts, lengths) + (np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths))
+            counts -= np.bincount(members[idx], minlength=n)
+        counts[u] = -1
+        if on_pick is not None:
+            on_pick(u)
+    return seeds, n_covered / max(len(rr_sizes), 1)
+
+
+def _log_binom(n, k):
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+
+def _imm_select(Hc: CSRHypergraph, k, epsilon, ell, sample, rr_nodes, rr_sizes, startTime, timeLapse):
+    """
+    IMM (Tang, Shi & Xiao 2015) driver around an RR-set sampler.
 
-import time
-import numpy as np
+    `sample(count)` must append `count` RR sets to rr_nodes / rr_sizes. Returns
+    (seed ids, estimated spread); the seed set is a (1 - 1/e - epsilon)-approximation
+    with probability at least 1 - n^-ell.
 
-def CELFPP_IC_hypergraph(H, k, p=0.01, mc=10, spread_func=None):
+    The RR sets drawn while estimating the lower bound are discarded before the final
+    theta are sampled, so node selection runs on sets independent of the choice of theta
+    (Chen 2018, "An Issue in the Martingale Analysis of the IMM Algorithm"). On return
+    rr_nodes / rr_sizes hold exactly those theta sets.
+    """
+    n = Hc.n_nodes
+    k = min(k, n)
+    if n <= 1:
+        return list(range(n)), float(n)
+
+    ell = ell * (1 + math.log(2) / math.log(n))
+    log_cnk = _log_binom(n, k)
+
+    # ---------- 1. lower bound on OPT (sampling phase) ----------
+    eps_p = math.sqrt(2) * epsilon
+    lambda_p = (2 + 2 * eps_p / 3) * (log_cnk + ell * math.log(n) + math.log(max(math.log2(n), 1))) * n / eps_p ** 2
+    LB = 1.0
+    for i in range(1, max(int(math.log2(n)), 2)):
+        x = n / 2 ** i
+        theta_i = int(math.ceil(lambda_p / x))
+        if theta_i > len(rr_sizes):
+            sample(theta_i - len(rr_sizes))
+        _, frac = _rr_node_selection(n, rr_nodes, rr_sizes, k)
+        if n * frac >= (1 + eps_p) * x:
+            LB = n * frac / (1 + eps_p)
+            break
+
+    # ---------- 2. final number of RR sets ----------
+    alpha = math.sqrt(ell * math.log(n) + math.log(2))
+    beta = math.sqrt((1 - 1 / math.e) * (log_cnk + ell * math.log(n) + math.log(2)))
+    lambda_star = 2 * n * ((1 - 1 / math.e) * alpha + beta) ** 2 / epsilon ** 2
+    theta = int(math.ceil(lambda_star / LB))
+    print(f"IMM: LB = {LB:.2f}, theta = {theta} RR sets")
+    # fresh batch: reusing the phase-1 sets breaks the martingale argument
+    del rr_nodes[:], rr_sizes[:]
+    sample(theta)
+
+    # ---------- 3. node selection ----------
+    S, frac = _rr_node_selection(n, rr_nodes, rr_sizes, k,
+                                 on_pick=lambda u: timeLapse.append(time.time() - startTime))
+    return S, n * frac
+
+
+def IMM_IC_hypergraph(H, k, p=0.01, epsilon=0.5, ell=1, seed=0):
     """
-    CELF++ (lazy greedy) for Independent Cascade on a hypergraph.
+    IMM (reverse influence sampling) seed selection for Independent Cascade on a hypergraph.
+
+    Drop-in alternative to CELF_IC_hypergraph: no Monte Carlo spread evaluation at all,
+    seeds are chosen by greedy maximum coverage over reverse-reachable sets sampled through
+    the hyperedges (incidence form, see `_ic_cascade`).
 
     Parameters
     ----------
-    H : hypernetx.Hypergraph
-        Your opinionated hypergraph (nodes = users, hyperedges = opinions).
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
+        Your opinionated hypergraph (nodes = users, edges = opinion hyperedges).
     k : int
         Number of seeds to select.
     p : float
         Activation probability in IC.
+    epsilon : float
+        Approximation slack: the result is a (1 - 1/e - epsilon)-approximation.
+    ell : float
+        Confidence: the guarantee holds with probability at least 1 - n^-ell.
+    seed : int
+        Seed of the np.random.RandomState used for sampling.
+
+    Returns
+    -------
+    S : list
+        Final seed set of size k.
+    timeLapse : list of float
+        timeLapse[i] = elapsed time (seconds) after selecting (i+1)-th seed.
+    final_mean_spread : float
+        Expected spread of S estimated from the RR sets (n * covered fraction).
+    """
+    Hc = as_csr(H)
+    startTime = time.time()
+    rng = np.random.RandomState(seed)
+    keys = _incidence_keys(Hc)
+    scratch = np.zeros(Hc.n_nodes, dtype=bool)
+    rr_nodes, rr_sizes = [], []
+    timeLapse = []
+
+    def sample(count):
+        _sample_rr_sets(Hc, p, count, rng, keys, scratch, rr_nodes, rr_sizes)
+
+    S, final_mean_spread = _imm_select(Hc, k, epsilon, ell, sample, rr_nodes, rr_sizes, startTime, timeLapse)
+
+    print(f"[IMM] selected {len(S)} seeds, spread ≈ {final_mean_spread:.4f}, "
+          f"elapsed = {time.time() - startTime:.1f}s")
+    return [Hc.nodes[u] for u in S], timeLapse, final_mean_spread
+
+
+def influence_table(H, p=0.01, n_samples=None, epsilon=0.5, ell=1, seed=0) -> np.ndarray:
+    """
+    Expected IC spread of every singleton seed set {u}, all from one batch of RR sets.
+
+    A user's singleton spread is n times the probability that it lies in a random RR set
+    (Borgs et al. 2014), so one shared pool of reverse-reachable sets prices all n
+    candidates at once instead of n separate Monte Carlo runs. By default the pool is
+    sized by IMM's bound for k = 1 (`_imm_select`): it grows with n and shrinks as the
+    best singleton spread grows, and the top entry is a (1 - 1/e - epsilon)-approximate
+    best singleton with probability at least 1 - n^-ell. The other entries are unbiased
+    but noisy (standard error about sqrt(n * spread / theta) for theta RR sets).
+
+    The table is a heuristic ordering for warm-starting lazy greedy
+    (`lazy_greedy(..., initial_gains=table)`), not a set of upper bounds: a candidate
+    whose entry underestimates its gain may never be re-evaluated. Cached on the CSR copy
+    of H (per p, sample size and seed).
+
+    Parameters
+    ----------
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
+    p : float
+        Activation probability in IC.
+    n_samples : int, optional
+        Fixed number of RR sets instead of the IMM-sized pool.
+    epsilon, ell : float
+        Accuracy and confidence of the IMM sizing (see IMM_IC_hypergraph).
+    seed : int
+        Seed of the np.random.RandomState used for sampling.
+
+    Returns
+    -------
+    np.ndarray of float, shape (n_nodes,)
+        Estimated spread of {u} for every node id u (Hc.nodes order). Shared with the
+        cache: copy before modifying.
+    """
+    Hc = as_csr(H)
+
+    def build(Hc):
+        rng = np.random.RandomState(seed)
+        keys = _incidence_keys(Hc)
+        scratch = np.zeros(Hc.n_nodes, dtype=bool)
+        rr_nodes, rr_sizes = [], []
+
+        def sample(count):
+            _sample_rr_sets(Hc, p, count, rng, keys, scratch, rr_nodes, rr_sizes)
+
+        if n_samples is None:
+            _imm_select(Hc, 1, epsilon, ell, sample, rr_nodes, rr_sizes, time.time(), [])
+        else:
+            sample(n_samples)
+        counts = np.bincount(np.concatenate(rr_nodes), minlength=Hc.n_nodes) if rr_nodes else np.zeros(Hc.n_nodes)
+        return Hc.n_nodes * counts / max(len(rr_sizes), 1)
+
+    size = f"imm:{epsilon}:{ell}" if n_samples is None else n_samples
+    return Hc.derived(f"influence_table:{p}:{size}:{seed}", build)
+
+
+## Polarity-aware influence maximization
+
+def CELF_polarity_hypergraph(H, k, polarity, theta=0.5, mc=100, seed=0, method="celf", return_stats=False):
+    """
+    Lazy greedy seed selection for polarity-aware diffusion (polarity_aware_diffusion).
+
+    Parameters
+    ----------
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
+    k : int
+        Number of seeds to select.
+    polarity : callable, mapping or np.ndarray
+        As in polarity_aware_diffusion, e.g. `edge_name_polarity(H)` or IMatrix2's polarity_dict.
+    theta : float in [0,1]
+        Probability that an attempt across differing polarities fails.
     mc : int
-        Number of Monte Carlo simulations for IC.
-    spread_func : callable or None
-        Function taking a seed list S and returning expected spread.
-        If None, uses IC_hypergraph(H, S, p, mc).
+        Cascades per spread estimate (batched, see polarity_diffusion_mc). Every estimate
+        replays the same random stream (np.random.default_rng(seed)), so marginal gains
+        compare seed sets on equal terms.
+    seed : int
+    method : "celf" or "celfpp"
+        See `lazy_greedy`.
+    return_stats : bool
+        Also return the oracle-call statistics of `lazy_greedy`.
 
     Returns
     -------
@@ -590,67 +1991,368 @@ def CELFPP_IC_hypergraph(H, k, p=0.01, mc=10, spread_func=None):
     timeLapse : list of float
         timeLapse[i] = elapsed time (seconds) after selecting (i+1)-th seed.
     final_mean_spread : float
-        Expected spread for the final seed set S.
+        Expected polarity-aware spread of S.
+    stats : dict (only if return_stats)
     """
+    Hc = as_csr(H)
+    groups = _polarity_groups(Hc, polarity_slots(Hc, polarity))
 
-    # Default spread function: IC on your hypergraph
-    if spread_func is None:
-        def spread_func(S):
-            return IC_hypergraph(H, S, p=p, mc=mc)
-
-    start_time = time.time()
-
-    # ----------------------------
-    # Data structures for CELF++
-    # ----------------------------
-    # For each node v we keep:
-    #   [v, marginal_gain, last_updated_seed_set_size]
-    # This is the "lazy" part; we only recompute when needed.
-    Q = []
-    S = []                # final seed set
+    # batched kernel of polarity_diffusion_mc, polarity resolved once
+    def spread_func(S):
+        seeds, n_outside = Hc.seed_ids(S)
+        return float(np.mean(_polarity_mc(Hc, seeds, n_outside, theta, mc, seed, groups)[0]))
+
+    tag = "CELF++ pol" if method == "celfpp" else "CELF pol"
+    S, timeLapse, final_mean_spread, stats = lazy_greedy(spread_func, Hc.nodes, k, method=method, tag=tag)
+    print(f"[{tag}] oracle calls = {stats['oracle_calls']}, saved vs greedy = {stats['calls_saved']}")
+
+    if return_stats:
+        return S, timeLapse, final_mean_spread, stats
+    return S, timeLapse, final_mean_spread
+
+
+def IMM_polarity_hypergraph(H, k, polarity, theta=0.5, epsilon=0.5, ell=1, seed=0):
+    """
+    IMM (reverse influence sampling) seed selection for polarity-aware diffusion.
+
+    An attempt of u on v through hyperedge e succeeds for certain if u and v have the same
+    polarity in e and with probability 1 - theta otherwise; this is symmetric in u and v and
+    every ordered attempt is independent, so the users that reach a random root in a sampled
+    world have the law of a forward cascade from the root. RR sets are therefore sampled
+    with `_polarity_cascade`, same-polarity co-members of a reached user always included.
+
+    Parameters
+    ----------
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
+    k : int
+        Number of seeds to select.
+    polarity : callable, mapping or np.ndarray
+        As in polarity_aware_diffusion.
+    theta : float in [0,1]
+        Probability that an attempt across differing polarities fails.
+    epsilon, ell : float
+        Approximation slack and confidence, as in IMM_IC_hypergraph.
+    seed : int
+        Seed of the np.random.Generator used for sampling.
+
+    Returns
+    -------
+    S : list
+        Final seed set of size k.
+    timeLapse : list of float
+        timeLapse[i] = elapsed time (seconds) after selecting (i+1)-th seed.
+    final_mean_spread : float
+        Expected spread of S estimated from the RR sets (n * covered fraction).
+    """
+    Hc = as_csr(H)
+    startTime = time.time()
+    rng = np.random.default_rng(seed)
+    slot_pol = polarity_slots(Hc, polarity)
+    scratch = np.zeros(Hc.n_nodes, dtype=bool)
+    rr_nodes, rr_sizes = [], []
     timeLapse = []
-    current_spread = 0.0  # F(S)
-
-    # 1) Initial marginal gain with empty seed set
-    print("CELF++: computing initial marginal gains...")
-    for v in H.nodes:
-        mg = spread_func([v])  # F({v}) - F(∅) = F({v})
-        Q.append([v, mg, 0])
-        print(Q);
-
-    # sort by marginal_gain descending
-    Q.sort(key=lambda x: x[1], reverse=True)
-
-    # ----------------------------
-    # 2) CELF++ main loop
-    # ----------------------------
-    while len(S) < k:
-        while True:
-            v, mg, last = Q[0]
 
-            # if this marginal gain is already computed for current |S|,
-            # we accept it as the true best
-            if last == len(S):
-                break
+    def sample(count):
+        for v in rng.integers(Hc.n_nodes, size=count):
+            rr = _polarity_cascade(Hc, [v], slot_pol, theta, rng, scratch)
+            rr_nodes.append(rr)
+            rr_sizes.append(len(rr))
+
+    S, final_mean_spread = _imm_select(Hc, k, epsilon, ell, sample, rr_nodes, rr_sizes, startTime, timeLapse)
+
+    print(f"[IMM pol] selected {len(S)} seeds, spread ≈ {final_mean_spread:.4f}, "
+          f"elapsed = {time.time() - startTime:.1f}s")
+    return [Hc.nodes[u] for u in S], timeLapse, final_mean_spread
+
+
+## Node-equivalence compression (quotient hypergraph)
+
+from quotientHypergraph import QuotientHypergraph
+
+
+def _quotient_runs(Q: QuotientHypergraph, seed_counts, mc, rng, p=None, theta=None):
+    """
+    `mc` cascades on the quotient at once; returns the (mc, classes) active-user counts.
+
+    Within a round the users of a class are interchangeable and decide independently,
+    so the newly active users of class c are Binomial(inactive users of c, q_c):
+      IC (p given):           q_c = 1 - (1 - p)^f, f = frontier users sharing a hyperedge
+                              with c (same law as IC_hypergraph on the 2-section);
+      polarity (theta given): q_c = 1 if a frontier user has c's polarity in one of c's
+                              hyperedges, else 1 - theta^d, d = frontier memberships of
+                              c's hyperedges (same law as polarity_aware_diffusion).
+    """
+    active = np.tile(np.asarray(seed_counts, dtype=np.int64), (mc, 1))
+    frontier = active.copy()
+    # the class operators are tiny (classes x edges): dense float products (BLAS) are fastest
+    if p is not None:
+        M = ((Q.B @ Q.B.T) > 0).toarray().astype(np.float64)
+        log_q = np.log1p(-p) if p < 1 else -np.inf
+    else:
+        A, B = Q.polarity_keys.toarray().astype(np.float64), Q.B.toarray().astype(np.float64)
+        log_theta = np.log(theta) if theta > 0 else -np.inf
+
+    while frontier.any():
+        F = frontier.astype(np.float64)
+        if p is not None:
+            exposure = F @ M
+            reach = exposure > 0
+            log_fail = exposure * log_q
+        else:
+            same = ((F @ A.T > 0) @ A) > 0
+            d = (F @ B) @ B.T
+            reach = same | (d > 0)
+            log_fail = np.where(same, -np.inf, d * log_theta)
+
+        # binomial draws only where someone can still be reached
+        inactive = Q.sizes - active
+        draw = reach & (inactive > 0)
+        frontier = np.zeros_like(active)
+        frontier[draw] = rng.binomial(inactive[draw], -np.expm1(log_fail[draw]))
+        active += frontier
+
+    return active
+
+
+class _QuotientWorlds:
+    """
+    `mc` sampled worlds of a quotient diffusion, shared by every seed set evaluated on them.
+
+    In IC a user activates once the number of active users sharing a hyperedge with it
+    reaches its own threshold G ~ Geometric(p) (each of them makes one attempt, so this is
+    the law of `_quotient_runs`); in the polarity model once a same-polarity user is
+    active, or the active memberships of its hyperedges reach G ~ Geometric(1 - theta).
+    The thresholds are drawn once, so in every world the final active set is the least
+    fixed point from the seeds and grows with the seed counts: marginal gains measured on
+    the worlds are never negative.
+
+    Seeds of a class take its first positions (the users `Q.lift` returns), whose k
+    thresholds are kept per position. The other users of a class are interchangeable and
+    only their count below the exposure matters, kept in whichever layout is smaller:
+
+      large classes: counts[E, w, c] users of class c with threshold <= E in world w.
+          Column E + 1 adds Binomial(users still above E, success), the exact law of the
+          order statistics (geometric thresholds are memoryless). Columns are drawn
+          lazily, in order from one stream, up to the largest exposure queried (or until
+          no user is left): about ln(mc |c|) / success columns, whatever |c| is;
+      small classes: the sorted thresholds of every world, O(|c|) each.
+
+    Memory O(mc * sum_c min(|c|, ln(mc |c|) / success)) plus O(mc * classes * k), never
+    more than per-user thresholds: e.g. 100k users in 63 classes, p = 0.01, mc = 1000
+    take about 0.2 GB instead of 0.8 GB, and the polarity model (success 1 - theta) far
+    less; for p well below 1 / |c| the classes keep per-user thresholds.
+    """
+
+    _NEVER = np.uint32(2 ** 32 - 1)
+    _KEY_BYTES = 8
+
+    def __init__(self, Q: QuotientHypergraph, mc, k, seed=0, p=None, theta=None):
+        self.Q, self.mc, self.p = Q, mc, p
+        K = len(Q.sizes)
+        self.success = min(p if p is not None else 1.0 - theta, 1.0)
+        self.rng = np.random.default_rng(seed)
+        self.first_k = int(min(k, Q.sizes.max())) if K else 0
+        self.first = np.full((mc, K, self.first_k), self._NEVER, dtype=np.uint32)
+        rest = np.maximum(Q.sizes - self.first_k, 0)
+        for c in range(K):
+            size = min(self.first_k, int(Q.sizes[c]))
+            if self.success > 0:
+                G = self.rng.geometric(self.success, size=(mc, size))
+                self.first[:, c, :size] = np.minimum(G, int(self._NEVER) - 1)
+
+        count_dtype = np.min_scalar_type(max(int(rest.max()) if K else 0, 1))
+        if self.success <= 0:
+            self.dense = np.ones(K, dtype=bool)  # nobody is ever reached: empty count tables
+        elif self.success >= 1:
+            self.dense = rest > 0
+        else:
+            columns = np.log(mc * np.maximum(rest, 1.0)) / -np.log1p(-self.success) + 1
+            self.dense = columns * count_dtype.itemsize < rest * self._KEY_BYTES
+        self.dense_ids = np.flatnonzero(self.dense)
+        self.sparse_ids = np.flatnonzero(~self.dense)
+
+        # large classes: count tables, column 0 all zeros (no threshold is 0)
+        self.above = np.tile(rest[self.dense_ids], (mc, 1))  # users above the last drawn column
+        self.counts = np.zeros((64, mc, len(self.dense_ids)), dtype=count_dtype)
+        self.n_cols = 1
+
+        # small classes: one sorted key range per (world, class), key = (world * K + c) << 32 | threshold
+        lens = np.zeros((mc, K), dtype=np.int64)
+        lens[:, self.sparse_ids] = rest[self.sparse_ids]
+        self.starts = np.concatenate([[0], np.cumsum(lens.ravel())[:-1]]).reshape(mc, K)
+        self.cell = (np.arange(mc, dtype=np.uint64)[:, None] * np.uint64(K) + np.arange(K, dtype=np.uint64)) << np.uint64(32)
+        self.keys = np.empty(int(lens.sum()), dtype=np.uint64)
+        for c in self.sparse_ids:
+            G = np.minimum(self.rng.geometric(self.success, size=(mc, int(rest[c]))), int(self._NEVER) - 1)
+            G.sort(axis=1)
+            self.keys[self.starts[:, c, None] + np.arange(rest[c])] = self.cell[:, c, None] | G.astype(np.uint64)
+
+        if p is not None:
+            self.M = ((Q.B @ Q.B.T) > 0).toarray().astype(np.float64)
+        else:
+            self.A, self.B = Q.polarity_keys.toarray().astype(np.float64), Q.B.toarray().astype(np.float64)
+
+    def _extend(self, E_max):
+        """Draw the count columns up to exposure E_max (or until no users are left)."""
+        while self.n_cols <= E_max and self.success > 0 and self.above.any():
+            if self.n_cols == len(self.counts):
+                grown = np.zeros((len(self.counts) * 3 // 2,) + self.counts.shape[1:], dtype=self.counts.dtype)
+                grown[:self.n_cols] = self.counts
+                self.counts = grown
+            left = np.flatnonzero(self.above)
+            hit = np.zeros(self.above.size, dtype=np.int64)
+            hit[left] = self.rng.binomial(self.above.ravel()[left], self.success)
+            hit = hit.reshape(self.above.shape)
+            self.above -= hit
+            self.counts[self.n_cols] = self.counts[self.n_cols - 1] + hit
+            self.n_cols += 1
+
+    def _activated(self, rows, exposure, seed_counts):
+        """Active users per (world, class) of worlds `rows` for the given exposures."""
+        E = np.minimum(np.rint(exposure), float(self._NEVER - 1)).astype(np.int64)
+        hits = np.zeros(E.shape, dtype=np.int64)
+        if self.dense_ids.size:
+            Ed = E[:, self.dense_ids]
+            self._extend(int(Ed.max()) if Ed.size else 0)
+            # beyond the drawn columns no class has users left, so the last column is final
+            cols = np.minimum(Ed, self.n_cols - 1)
+            hits[:, self.dense_ids] = self.counts[cols, rows[:, None], np.arange(len(self.dense_ids))]
+        if self.sparse_ids.size:
+            sp = self.sparse_ids
+            found = np.searchsorted(self.keys, self.cell[rows][:, sp] | E[:, sp].astype(np.uint64), side="right")
+            hits[:, sp] = found - self.starts[rows][:, sp]
+        free = np.arange(self.first_k) >= seed_counts[:, None]
+        hits += ((self.first[rows] <= E[:, :, None]) & free).sum(axis=2)
+        return seed_counts + hits
+
+    def spread(self, seed_counts):
+        """Active users per (world, class) at the end of the cascade from `seed_counts`."""
+        seed_counts = np.asarray(seed_counts, dtype=np.int64)
+        active = np.tile(seed_counts, (self.mc, 1))
+        rows = np.arange(self.mc)
+        # iterate to the fixed point, only in the worlds that still changed
+        while rows.size:
+            F = active[rows].astype(np.float64)
+            if self.p is not None:
+                new = self._activated(rows, F @ self.M, seed_counts)
+            else:
+                same = ((F @ self.A.T > 0) @ self.A) > 0
+                new = np.where(same, self.Q.sizes, self._activated(rows, (F @ self.B) @ self.B.T, seed_counts))
+            moved = (new != active[rows]).any(axis=1)
+            active[rows] = new
+            rows = rows[moved]
+        return active
+
+
+def _quotient_for(H, model, polarity):
+    Hc = as_csr(H)
+    if model == "IC":
+        return Hc.derived("quotient", QuotientHypergraph)
+    if model == "polarity":
+        if polarity is None:
+            raise ValueError("model 'polarity' needs a polarity argument")
+        return QuotientHypergraph(Hc, polarity_slots(Hc, polarity))
+    raise ValueError(f"unknown diffusion model {model!r}, expected 'IC' or 'polarity'")
+
+
+def quotient_diffusion_mc(H, S, model="IC", p=0.01, polarity=None, theta=0.5, mc=1000, seed=0, Q=None):
+    """
+    Monte Carlo spread on the node-equivalence quotient of H, lifted back to users.
+
+    Parameters
+    ----------
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
+    S : iterable
+        Seed users.
+    model : "IC" or "polarity"
+        IC_hypergraph's model (probability p) or polarity_aware_diffusion's (polarity, theta).
+    mc : int
+        Number of cascades; each costs O(rounds * classes^2), independent of the user count.
+    seed : int
+        Seed of the np.random.Generator.
+    Q : QuotientHypergraph, optional
+        Reuse a compression built earlier (must match `model`/`polarity`).
+
+    Returns
+    -------
+    mean_spread : float
+    variance : float
+        Sample variance of the spread over the mc cascades.
+    frequency : np.ndarray of float
+        Activation frequency of every user, in `as_csr(H).nodes` order.
+    """
+    if Q is None:
+        Q = _quotient_for(H, model, polarity)
+    seeds, n_outside = Q.Hc.seed_ids(S)
+    rng = np.random.default_rng(seed)
+    active = _quotient_runs(Q, Q.class_counts(seeds), mc, rng,
+                            p=p if model == "IC" else None, theta=theta if model == "polarity" else None)
+    spreads = active.sum(axis=1) + n_outside
+    variance = float(np.var(spreads, ddof=1)) if mc > 1 else 0.0
+    return float(np.mean(spreads)), variance, Q.lift_frequency(active.mean(axis=0), seeds)
+
+
+def CELF_quotient_hypergraph(H, k, model="IC", p=0.01, polarity=None, theta=0.5, mc=1000, seed=0,
+                             method="celf", return_stats=False):
+    """
+    Lazy greedy seed selection over user classes instead of users.
+
+    Users with the same hyperedges (and polarities) have the same marginal gain, so the
+    candidates are "one more seed from class c" - one per class in the heap, the next slot
+    offered once it is taken (`lazy_greedy(next_candidate=...)`) - and the spread of a
+    seed set only depends on its per-class counts (`_quotient_runs`).
+    The chosen counts are lifted back to concrete users (lowest ids of each class).
+
+    Parameters
+    ----------
+    H : hypernetx.Hypergraph, CSRHypergraph or edge dict
+    k : int
+        Number of seeds to select.
+    model, p, polarity, theta :
+        Diffusion model, see quotient_diffusion_mc.
+    mc : int
+        Number of sampled worlds (`_QuotientWorlds`, drawn from np.random.default_rng(seed));
+        every spread estimate is evaluated on the same worlds, so no marginal gain is negative.
+        Memory grows with mc times the per-class threshold tables (see `_QuotientWorlds`).
+    method : "celf" or "celfpp"
+        See `lazy_greedy`.
+    return_stats : bool
+        Also return the oracle-call statistics of `lazy_greedy`.
+
+    Returns
+    -------
+    S : list
+        Final seed set of size k.
+    timeLapse : list of float
+        timeLapse[i] = elapsed time (seconds) after selecting (i+1)-th seed.
+    final_mean_spread : float
+        Expected spread of S.
+    stats : dict (only if return_stats)
+    """
+    Q = _quotient_for(H, model, polarity)
+    print(f"{Q.Hc.n_nodes} users in {Q.n_classes} classes")
 
-            # otherwise recompute gain w.r.t. current S
-            new_spread = spread_func(S + [v])
-            new_mg = new_spread - current_spread
+    # candidate (c, j): the j-th seed taken from class c. The slots of a class are
+    # interchangeable, so only its next free slot is in the heap at any time
+    candidates = [(c, 0) for c in range(Q.n_classes) if Q.sizes[c] > 0]
 
-            # update top element and resort
-            Q[0] = [v, new_mg, len(S)]
-            Q.sort(key=lambda x: x[1], reverse=True)
+    def next_slot(cand):
+        c, j = cand
+        return (c, j + 1) if j + 1 < min(int(Q.sizes[c]), k) else None
 
-        # now Q[0] is the best node with up-to-date marginal gain
-        v, mg, last = Q.pop(0)
+    worlds = _QuotientWorlds(Q, mc, k, seed, p=p if model == "IC" else None,
+                             theta=theta if model == "polarity" else None)
 
-        # add v to seed set
-        S.append(v)
-        current_spread += mg
-        timeLapse.append(time.time() - start_time)
+    def spread_func(S):
+        counts = np.bincount([c for c, _ in S], minlength=Q.n_classes)
+        return float(worlds.spread(counts).sum(axis=1).mean())
 
-        print(f"[CELF++] selected seed {len(S)}: {v}, "
-              f"marginal gain = {mg:.4f}, spread ≈ {current_spread:.4f}")
+    tag = "CELF++ quotient" if method == "celfpp" else "CELF quotient"
+    S, timeLapse, final_mean_spread, stats = lazy_greedy(spread_func, candidates, k, method=method, tag=tag,
+                                                         next_candidate=next_slot)
+    print(f"[{tag}] oracle calls = {stats['oracle_calls']}, saved vs greedy = {stats['calls_saved']}")
 
-    final_mean_spread = current_spread
+    S = Q.lift(np.bincount([c for c, _ in S], minlength=Q.n_classes))
+    if return_stats:
+        return S, timeLapse, final_mean_spread, stats
     return S, timeLapse, final_mean_spread
@@ -5,65 +5,247 @@ import time;
 import networkx as nx;
 import heapq;
 import random;
+from parallelMC import ShardPool,shard_streams,adaptive_mc;
+from csrBase import csr_slots;
+from csrGraph import as_csr_graph,reach_sums;
 
 #spread process(LT)
 
-def LT(DG,I,th=0.1,mc=1000):
+def LT(DG,I,th=0.1,mc=1000,n_jobs=None,seed=0,relError=None,confidence=0.95):
+    # n_jobs: run the simulations as SeedSequence-seeded shards on a process pool (see _parallelSpread)
+    # relError: stop once the confidence interval is within relError of the mean (mc is the cap);
+    # returns a SpreadEstimate (mean, stderr, ci, n_sims) instead of the mean
+    if relError is not None:
+        return _adaptiveSpread(DG,I,"LT",th,mc,seed,relError,confidence);
+    if n_jobs is not None:
+        return _parallelSpread(DG,I,"LT",th,mc,n_jobs,seed);
+    # array kernel on the cached CSR copy of DG; simulation i keeps the legacy threshold
+    # (first draw of np.random.seed(i)), so results are unchanged
+    G=as_csr_graph(DG);
+    seeds,_=G.seed_ids(I);
     spread=[];
     for i in range(mc):
-        newInfected, currInfectedSet=I[:],I[:];
-        while newInfected:
-            #print(newInfected);
-            nowInfected=[];
-            for node in DG.nodes():
-                if node in currInfectedSet:
-                    continue;
-                np.random.seed(i);
-                th=np.random.uniform(0,0.1);#threshhold
-                #print("th",th);
-                thNodes=(th)*DG.number_of_nodes();
-                cnt=0;
-                for adjNode in DG.neighbors(node):
-                    if adjNode in currInfectedSet:
-                        cnt+=1;
-                if cnt>thNodes:
-                    nowInfected.append(node);
-            newInfected=nowInfected;
-            #print(nowInfected);
-            currInfectedSet+=(newInfected);
-        spread.append(len(currInfectedSet));
-        #print(spread);
+        th=np.random.RandomState(i).uniform(0,0.1);#threshhold
+        spread.append(len(I)+_ltNew(G,seeds,th*G.n_nodes));
     return np.mean(spread);
 # spread process(IC)
-def IC(DG,S,p=0.5,mc=1000):
+def IC(DG,S,p=0.5,mc=1000,n_jobs=None,seed=0,relError=None,confidence=0.95):
+    # n_jobs: run the simulations as SeedSequence-seeded shards on a process pool (see _parallelSpread)
+    # relError: adaptive sampling as in LT
+    if relError is not None:
+        return _adaptiveSpread(DG,S,"IC",p,mc,seed,relError,confidence);
+    if n_jobs is not None:
+        return _parallelSpread(DG,S,"IC",p,mc,n_jobs,seed);
+    # array kernel on the cached CSR copy of DG. The legacy loop reseeded with np.random.seed(i)
+    # before every node, so in simulation i the j-th successor of any node fires iff the j-th
+    # uniform of RandomState(i) is < p: one draw vector per simulation gives the same results
+    G=as_csr_graph(DG);
+    seeds,_=G.seed_ids(S);
+    maxDeg=int(G.out_degrees().max()) if G.n_arcs else 0;
     spread=[];
     for i in range(mc):
-        newActive, currSeedSet = S[:], S[:];
-        while newActive:
-            newInfluenced=[];
-            for node in newActive:
-                np.random.seed(i);
-                #success = np.random.uniform(0, 1, len(DG.neighbors(node,mode="out")));#igraph version
-                #success = np.random.uniform(0, 1, len(DG.neighbors(node)));
-                success = np.random.uniform(0, 1, len(list(DG.successors(node))))#0.1 instead of 1
-                #newInfluenced+=list(np.extract(success,DG.neighbors(node,mode="out")));
-                newInfluenced += list(np.extract(success,list(DG.successors(node))));
-            newActive=list(set(newInfluenced)-set(currSeedSet));
-            currSeedSet+=newActive;
-            #print(currSeedSet);
-        spread.append(len(currSeedSet));
+        live=np.random.RandomState(i).uniform(0,1,maxDeg)<p;#each edge fires with probability p
+        spread.append(len(S)+_icNew(G,seeds,lambda slots,pos:live[pos]));
     return np.mean(spread);
 
+# array kernels: number of nodes activated besides the seeds (node ids)
+def _icNew(G,seeds,fire):
+    # fire(slots,pos): which out-arcs (positions in G.out_nbrs, and within their row) succeed
+    active=np.zeros(G.n_nodes,dtype=bool);
+    active[seeds]=True;
+    frontier,count=seeds,0;
+    while frontier.size:
+        slots=csr_slots(G.out_ptr,frontier);
+        pos=slots-np.repeat(G.out_ptr[frontier],G.out_ptr[frontier+1]-G.out_ptr[frontier]);
+        targets=G.out_nbrs[slots[fire(slots,pos)]];
+        frontier=np.unique(targets[~active[targets]]);
+        active[frontier]=True;
+        count+=len(frontier);
+    return count;
+
+def _ltNew(G,seeds,thNodes):
+    # synchronous rounds: a node activates once more than thNodes of its successors are active
+    active=np.zeros(G.n_nodes,dtype=bool);
+    active[seeds]=True;
+    cnt=np.zeros(G.n_nodes,dtype=np.int64);
+    new,count=seeds,0;
+    while new.size:
+        cnt+=np.bincount(G.in_nbrs[csr_slots(G.in_ptr,new)],minlength=G.n_nodes);
+        new=np.flatnonzero((cnt>thNodes)&~active);
+        active[new]=True;
+        count+=len(new);
+    return count;
+
+# weighted LT (per-node uniform thresholds, incoming weights summing to <= 1) through the live-edge
+# equivalence (Kempe et al. 2003): in a sample every node v keeps at most one incoming arc u->v,
+# chosen with probability w(u,v) (none with 1-sum w), and the LT spread of S has the law of the
+# number of nodes reachable from S in the sampled forest. The samples come from one seeded stream,
+# so every seed set evaluated with the same (mc,seed) sees the same forests.
+def _ltWeights(DG,G,weight):
+    # weight of every arc (G.out_nbrs order): 1/in-degree of its head, or the edge attribute (read on
+    # every call, so edited weights are never served from a cache)
+    if weight is None:
+        return 1.0/G.in_degrees()[G.out_nbrs];
+    w=np.fromiter((DG[G.nodes[u]][G.nodes[v]].get(weight,0.0) for u,v in zip(G.arc_src,G.out_nbrs)),dtype=float,count=G.n_arcs);
+    if (w<0).any():
+        arc=int(np.flatnonzero(w<0)[0]);
+        raise ValueError(f"LT weights must be >= 0 (edge {G.nodes[G.arc_src[arc]]!r} -> {G.nodes[G.out_nbrs[arc]]!r}: {w[arc]:.4f})");
+    total=np.bincount(G.out_nbrs,weights=w,minlength=G.n_nodes);
+    if (total>1+1e-9).any():
+        bad=int(np.argmax(total));
+        raise ValueError(f"LT weights must sum to <= 1 over the incoming edges of every node (node {G.nodes[bad]!r}: {total[bad]:.4f})");
+    return w;
+
+_FOREST_BATCH=1<<22;#node slots (samples x nodes) per batch of forests
+def liveEdgeForests(DG,mc=1000,weight=None,seed=0):
+    # the mc live-edge samples, generated in batches of at most _FOREST_BATCH node slots (memory per
+    # batch, nothing is cached). Yields (runs,ptr,children): node v of the r-th sample of the batch has
+    # the int32 id r*n+v and its children (the nodes that kept an arc from it) are children[ptr[id]:ptr[id+1]]
+    G=as_csr_graph(DG);
+    n=G.n_nodes;
+    w=_ltWeights(DG,G,weight)[G.in_arcs];
+    cw=np.cumsum(w);
+    base=np.concatenate([[0.0],cw])[G.in_ptr[:-1]];
+    rng=np.random.default_rng(seed);
+    batch=max(1,_FOREST_BATCH//max(n,1));
+    for first in range(0,mc,batch):
+        runs=min(batch,mc-first);
+        parents=np.full(runs*n,-1,dtype=np.int32);
+        for r in range(runs):
+            idx=np.searchsorted(cw,base+rng.random(n),side="right");#first arc whose cumulative weight passes the draw
+            kept=np.flatnonzero(idx<G.in_ptr[1:]);
+            parents[r*n+kept]=r*n+G.in_nbrs[idx[kept]];
+        hasParent=np.flatnonzero(parents>=0).astype(np.int32);
+        children=hasParent[np.argsort(parents[hasParent],kind="stable")];
+        ptr=np.zeros(runs*n+1,dtype=np.int64);
+        np.cumsum(np.bincount(parents[hasParent],minlength=runs*n),out=ptr[1:]);
+        yield runs,ptr,children;
+
+def LTWeighted(DG,S,mc=1000,weight=None,seed=0):
+    # weighted LT spread of S: mean reachability from S over the live-edge forests;
+    # weight=None gives w(u,v)=1/in-degree(v), otherwise the named edge attribute is used
+    G=as_csr_graph(DG);
+    seeds,nOutside=G.seed_ids(S);
+    count=0;
+    for runs,ptr,children in liveEdgeForests(DG,mc,weight,seed):
+        frontier=(np.arange(runs)[:,None]*G.n_nodes+seeds).ravel();
+        reached=np.zeros(runs*G.n_nodes,dtype=bool);
+        reached[frontier]=True;
+        count+=len(frontier);
+        while frontier.size:
+            frontier=children[csr_slots(ptr,frontier)];
+            frontier=frontier[~reached[frontier]];#a forest can close a cycle back onto a seed
+            reached[frontier]=True;
+            count+=len(frontier);
+    return count/mc+nOutside;
+
+# parallel Monte Carlo: the mc runs are split into fixed-size shards, each with its own
+# np.random.SeedSequence stream, so the result is the same for any number of workers
+def _icRun(G,S,p,rng):
+    seeds,_=G.seed_ids(S);
+    return len(S)+_icNew(G,seeds,lambda slots,pos:rng.random(len(slots))<p);
+
+def _ltRun(G,I,rng):
+    th=rng.uniform(0,0.1);#threshhold, one per simulation as in LT
+    seeds,_=G.seed_ids(I);
+    return len(I)+_ltNew(G,seeds,th*G.n_nodes);
+
+def _spreadShard(state,task):
+    # task: (model, seed set, p, runs, SeedSequence) -> spread of every run of the shard
+    model,S,p,runs,stream=task;
+    rng=np.random.default_rng(stream);
+    if model=="LT":
+        return [_ltRun(state["G"],S,rng) for _ in range(runs)];
+    return [_icRun(state["G"],S,p,rng) for _ in range(runs)];
+
+def _extensionShard(state,task):
+    # task: (model, seed set, candidates, p, streams) -> mean spread of S+[j] for every candidate j
+    model,S,candidates,p,streams=task;
+    return [np.mean([x for runs,stream in streams for x in _spreadShard(state,(model,S+[j],p,runs,stream))]) for j in candidates];
+
+def _parallelSpread(DG,S,model,p,mc,n_jobs,seed):
+    with ShardPool(n_jobs,{"G":as_csr_graph(DG)}) as pool:
+        tasks=[(model,list(S),p,runs,stream) for runs,stream in shard_streams(mc,seed)];
+        return np.mean([x for spreads in pool.map(_spreadShard,tasks) for x in spreads]);
+
+def _adaptiveSpread(DG,S,model,p,mc,seed,relError,confidence):
+    # shards in this process until the CI is tight enough; same streams as _parallelSpread
+    state={"G":as_csr_graph(DG)};
+    return adaptive_mc(lambda runs,stream:_spreadShard(state,(model,list(S),p,runs,stream)),relError,confidence,max_mc=mc,seed=seed);
+
+def _checkEpsilon(epsilon):
+    if epsilon is not None and not 0<epsilon<1:
+        raise ValueError(f"epsilon must be in (0, 1), got {epsilon}");
+
+def _candidates(DG,S,k,epsilon,rng):
+    # nodes not in S, in graph order (ties go to the earlier node in both modes); with epsilon, a
+    # random sample of ceil((n/k)*ln(1/epsilon)) of them
+    chosen=set(S);
+    candidates=[node for node in DG.nodes() if node not in chosen];
+    if epsilon is None:
+        return candidates;
+    size=min(len(candidates),int(np.ceil(DG.number_of_nodes()/k*np.log(1/epsilon))));
+    return [candidates[i] for i in sorted(rng.choice(len(candidates),size=size,replace=False))];
+
+def _parallelGreedy(DG,k,model,p,mc,n_jobs,seed,epsilon=None):
+    # greedy/greedyLT with the candidates of every round evaluated on a process pool;
+    # every estimate uses the same shard streams, so the selection does not depend on n_jobs
+    S,spread,timeLapse,startTime=[],[],[],time.time();
+    streams=shard_streams(mc,seed);
+    sampleRng=np.random.default_rng(seed);
+    with ShardPool(n_jobs,{"G":as_csr_graph(DG)}) as pool:
+        for i in range(k):
+            bestSpread=0;
+            node=None;
+            candidates=_candidates(DG,S,k,epsilon,sampleRng);
+            spreadSeedSet=np.mean([x for runs,stream in streams for x in _spreadShard(pool.state,(model,S,p,runs,stream))]);
+            chunk=max(1,-(-len(candidates)//(4*pool.n_jobs)));
+            tasks=[(model,S,candidates[c:c+chunk],p,streams) for c in range(0,len(candidates),chunk)];
+            newSpreads=[x for spreads in pool.map(_extensionShard,tasks) for x in spreads];
+            for j,newSpread in zip(candidates,newSpreads):
+                marginalSpread=newSpread-spreadSeedSet;
+                if marginalSpread>bestSpread:
+                    bestSpread,node=newSpread,j;
+            if node!=None:
+                S.append(node);
+            spread.append(bestSpread);
+            timeLapse.append(time.time()-startTime);
+    return (S,spread,timeLapse);
+
+# all-singletons influence table: IC(DG,[u],p,mc) of every node u at once. Simulation i of IC is the
+# live-edge world where the j-th out-arc of every node is live iff the j-th uniform of RandomState(i) is
+# < p, and {u} activates exactly the nodes reachable from u in it; reach counts come from one condensation
+# of each world (csrGraph.reach_sums). Same worlds as IC, so the table equals the per-node IC calls.
+# Cached on the CSR copy of DG.
+def influenceTable(DG,p=0.1,mc=1000):
+    G=as_csr_graph(DG);
+    def build(G):
+        from scipy import sparse;
+        maxDeg=int(G.out_degrees().max()) if G.n_arcs else 0;
+        pos=np.arange(G.n_arcs)-G.out_ptr[G.arc_src];#position of every arc within its row
+        total=np.zeros(G.n_nodes);
+        for i in range(mc):
+            live=np.flatnonzero((np.random.RandomState(i).uniform(0,1,maxDeg)<p)[pos]);
+            world=sparse.csr_matrix((np.ones(len(live)),(G.arc_src[live],G.out_nbrs[live])),shape=(G.n_nodes,G.n_nodes));
+            total+=reach_sums(world);
+        return dict(zip(G.nodes,(total/mc).tolist()));
+    return G.derived(f"influenceTable:{p}:{mc}",build);
+
 # greedy algotithm seed selection
-def greedy(DG,k,p=0.1,mc=1000):
+def greedy(DG,k,p=0.1,mc=1000,n_jobs=None,seed=0,epsilon=None):
+    # epsilon: stochastic greedy, only a random sample of (n/k)*ln(1/epsilon) candidates per round
+    _checkEpsilon(epsilon);
+    if n_jobs is not None:
+        return _parallelGreedy(DG,k,"IC",p,mc,n_jobs,seed,epsilon);
     S,spread,timeLapse,startTime=[],[],[],time.time();
+    sampleRng=np.random.default_rng(seed);
     for i in range(k):
         bestSpread=0;
         node=None;
-        for j in set(DG.nodes())-set(S):
+        spreadSeedSet=IC(DG,S,p,mc);#seeded per simulation, so the same for every candidate
+        for j in _candidates(DG,S,k,epsilon,sampleRng):
             #print("j: ",j);
             newSpread=IC(DG,S+[j],p,mc);
-            spreadSeedSet=IC(DG,S,p,mc);
             marginalSpread=newSpread-spreadSeedSet;
             #print("j: ",j,"newSpread: ",newSpread,"bestSpread: ",bestSpread,"seedset: ",S+[j]);
             if marginalSpread>bestSpread:
@@ -77,15 +259,20 @@ def greedy(DG,k,p=0.1,mc=1000):
     return (S,spread,timeLapse);
 
 # greedy LT
-def greedyLT(DG,k,p=0.1,mc=1000):
+def greedyLT(DG,k,p=0.1,mc=1000,n_jobs=None,seed=0,epsilon=None):
+    # epsilon: stochastic greedy, only a random sample of (n/k)*ln(1/epsilon) candidates per round
+    _checkEpsilon(epsilon);
+    if n_jobs is not None:
+        return _parallelGreedy(DG,k,"LT",p,mc,n_jobs,seed,epsilon);
     S,spread,timeLapse,startTime=[],[],[],time.time();
+    sampleRng=np.random.default_rng(seed);
     for i in range(k):
         bestSpread=0;
         node=None;
-        for j in set(DG.nodes())-set(S):
+        spreadSeedSet=LT(DG,S,p,mc);#seeded per simulation, so the same for every candidate
+        for j in _candidates(DG,S,k,epsilon,sampleRng):
             #print("j: ",j);
             newSpread=LT(DG,S+[j],p,mc);
-            spreadSeedSet=LT(DG,S,p,mc);
             marginalSpread=newSpread-spreadSeedSet;
             #print("j: ",j,"newSpread: ",newSpread,"bestSpread: ",bestSpread,"seedset: ",S+[j]);
             if marginalSpread>bestSpread:
@@ -98,9 +285,10 @@ def greedyLT(DG,k,p=0.1,mc=1000):
         timeLapse.append(time.time()-startTime);
     return (S,spread,timeLapse);
 #CELF seed selection
-def CELF(DG,k,p=0.1,mc=1000):
+def CELF(DG,k,p=0.1,mc=1000,table=None):
+    # table: singleton spreads (influenceTable(DG,p,mc) equals the first n IC calls) used instead of them
     startTime=time.time();
-    marginalGain=[IC(DG,[node],p,mc) for node in DG.nodes()];
+    marginalGain=[IC(DG,[node],p,mc) if table is None else table[node] for node in DG.nodes()];
     Q=sorted(zip(DG.nodes(),marginalGain),key=lambda x:x[1],reverse=True);
     S,spread,SPREAD=[Q[0][0]],Q[0][1],[Q[0][1]];
     Q,lookUps=Q[1:],[DG.number_of_nodes()];
@@ -148,89 +336,109 @@ def CELF_LT(DG,k,p=0.1,mc=1000):
     return (S, SPREAD,timelapse, lookUps);
 
 
-# CELF++
-class NodeData:
-    def __init__(self,node):
-        self.node=node;
-        self.mg1=0;
-        self.flag=0;
-        self.mg2=0;
-        self.prevBest=None;
-def CELFpp(DG,k,p=0.1,mc=1000):
-    startTime = time.time();
-    S,currentBest,node_data,heap,SPREAD=[],None,{},[],[];
-    for node in DG.nodes():
-        nodeDataObj=NodeData(node);
-        nodeDataObj.mg1=IC(DG,[node],p,mc);
-        nodeDataObj.prevBest=currentBest;
-        nodeDataObj.mg2=IC(DG,[node,currentBest],p,mc)-IC(DG,[currentBest],p,mc) if currentBest else nodeDataObj.mg1;
-        node_data[node]=nodeDataObj;
-        heapq.heappush(heap, (-nodeDataObj.mg1, node));
-        if currentBest is None or nodeDataObj.mg1 > node_data[currentBest].mg1:
-            currentBest = node;
-            print(currentBest);
-    lastSeed=None;
-    while len(S) < k:
-        _,node=heapq.heappop(heap);
-        nd=NodeData(node);
-        if nd.flag==len(S):
-            S.append(node);
-            lastSeed=node;
-            print(S);
-            continue;
-        if nd.prevBest==lastSeed:
-            nd.mg1=nd.mg2;
-        else:
-            nd.mg1=IC(DG,S+[node],p,mc)-IC(DG,S,p,mc);
-            nd.prevBest=currentBest;
-            if currentBest:
-                nd.mg2 = IC(DG, S + [currentBest, node], p, mc)- IC(DG, S + [currentBest], p, mc);
-            else:
-                nd.mg2=nd.mg1;
-        nd.flag=len(S);
-        node_data[node]=nd;############not there
-        if currentBest is None or nd.mg1 > node_data[currentBest].mg1:
-            currentBest = node;
-        heapq.heappush(heap, (-nd.mg1, node));
-    timeLapse=time.time()-startTime;
-    return (S,timeLapse);
-
-
-# zachary's karate club graph (testing)
-
-degree_data = {
-    0: 16, 1: 9, 2: 10, 3: 6, 4: 3, 5: 4, 6: 4, 7: 4, 8: 5,
-    9: 2, 10: 3, 11: 1, 12: 2, 13: 5, 14: 2, 15: 2, 16: 2,
-    17: 2, 18: 2, 19: 3, 20: 2, 21: 2, 22: 2, 23: 5, 24: 3,
-    25: 3, 26: 2, 27: 4, 28: 3, 29: 4, 30: 4, 31: 6, 32: 12, 33: 17
-}
-G = nx.DiGraph();
-G.add_nodes_from(degree_data.keys());
-nodes = list(degree_data.keys());
-for node, out_deg in degree_data.items():
-    possible_targets = list(set(nodes) - {node});
-    targets = random.sample(possible_targets, min(out_deg, len(possible_targets)));
-    for target in targets:
-        G.add_edge(node, target);
-print(f"Created DiGraph with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges.");
-print("spreadIC: ",IC(G,[0,5,9],0.1,1000));
-print("spreadLT: ",LT(G,[0,5,9],0.1,1000));
-greedy_output=greedy(G,4,0.1,10);
-print("greedy output: " + str(greedy_output[0]));
-greedy_output=greedyLT(G,4,0.1,10);
-print("greedy output(LT): " + str(greedy_output[0]));
-CELF_output=CELF(G,4,0.1,10);
-print("CELF output: "+str(CELF_output[0]));
-CELF_output=CELF_LT(G,4,0.1,10);
-print("CELF output(LT): "+str(CELF_output[0]));
-CELFpp_output=CELFpp(G,4,0.1,10);
-print("CELFpp output: "+str(CELF_output[0]));
-
-
-
+# CELF++ with a persistent array state table (Goyal et al. 2011): per node id, mg1 = gain w.r.t. S,
+# mg2 = gain w.r.t. S+[prevBest], prevBest = best node seen when mg1/mg2 were computed, flag = |S| at
+# that time. A node whose prevBest was the last seed picked gets its new gain from mg2 for free.
+def _icBatch(G,seedSets,p,mc):
+    # IC spread of several seed sets (node ids) on one shared simulation batch: simulation i draws
+    # the legacy live-edge vector of IC once and runs every cascade on it
+    maxDeg=int(G.out_degrees().max()) if G.n_arcs else 0;
+    seedSets=[np.unique(np.asarray(s,dtype=np.int64)) for s in seedSets];
+    total=np.zeros(len(seedSets));
+    for i in range(mc):
+        live=np.random.RandomState(i).uniform(0,1,maxDeg)<p;
+        for j,seeds in enumerate(seedSets):
+            total[j]+=len(seeds)+_icNew(G,seeds,lambda slots,pos:live[pos]);
+    return total/mc;
 
+def CELFpp(DG,k,p=0.1,mc=1000,table=None):
+    # table: singleton spreads (influenceTable(DG,p,mc)); skips the initial pass and its look-ahead
+    # returns (S, SPREAD, timelapse, lookUps) like CELF; lookUps[i] = simulation batches run in round i
+    startTime=time.time();
+    G=as_csr_graph(DG);
+    n=G.n_nodes;
+    k=min(k,n);
+    mg1,mg2=np.zeros(n),np.zeros(n);
+    prevBest,flag=np.full(n,-1),np.zeros(n,dtype=np.int64);
+    S,SPREAD,lookUps=[],[],[];
+    if k<=0:
+        return ([],SPREAD,time.time()-startTime,lookUps);
 
+    #initial gains (S empty), mg2 against the best node seen so far
+    currentBest=-1;
+    for u in range(n):
+        if table is not None:
+            mg1[u]=mg2[u]=table[G.nodes[u]];
+            continue;
+        if currentBest<0:
+            mg1[u]=mg2[u]=_icBatch(G,[[u]],p,mc)[0];
+        else:
+            mg1[u],withBest=_icBatch(G,[[u],[currentBest,u]],p,mc);
+            mg2[u]=withBest-mg1[currentBest];
+            prevBest[u]=currentBest;
+        if currentBest<0 or mg1[u]>mg1[currentBest]:
+            currentBest=u;
+    heap=[(-mg1[u],u) for u in range(n)];
+    heapq.heapify(heap);
 
+    spread,lastSeed,currentBest,nodeLookup=0.0,-1,-1,(0 if table is not None else n);
+    while len(S)<k:
+        _,u=heapq.heappop(heap);
+        if flag[u]==len(S):
+            #gain is up to date: u is the best node
+            S.append(u);
+            spread+=mg1[u];
+            SPREAD.append(spread);
+            lookUps.append(nodeLookup);
+            lastSeed,currentBest,nodeLookup=u,-1,0;
+            continue;
+        if prevBest[u]==lastSeed and flag[u]==len(S)-1:
+            mg1[u]=mg2[u];#look-ahead hit
+        else:
+            nodeLookup+=1;
+            if currentBest>=0:
+                withU,withBest=_icBatch(G,[S+[u],S+[currentBest,u]],p,mc);
+                mg1[u]=withU-spread;
+                mg2[u]=withBest-(spread+mg1[currentBest]);
+            else:
+                mg1[u]=mg2[u]=_icBatch(G,[S+[u]],p,mc)[0]-spread;
+            prevBest[u]=currentBest;
+        flag[u]=len(S);
+        if currentBest<0 or mg1[u]>mg1[currentBest]:
+            currentBest=u;
+        heapq.heappush(heap,(-mg1[u],u));
+    return ([G.nodes[u] for u in S],SPREAD,time.time()-startTime,lookUps);
 
 
+# zachary's karate club graph (testing); guarded so that worker processes of the
+# parallel mode can import this module without running it
 
+if __name__ == "__main__":
+    degree_data = {
+        0: 16, 1: 9, 2: 10, 3: 6, 4: 3, 5: 4, 6: 4, 7: 4, 8: 5,
+        9: 2, 10: 3, 11: 1, 12: 2, 13: 5, 14: 2, 15: 2, 16: 2,
+        17: 2, 18: 2, 19: 3, 20: 2, 21: 2, 22: 2, 23: 5, 24: 3,
+        25: 3, 26: 2, 27: 4, 28: 3, 29: 4, 30: 4, 31: 6, 32: 12, 33: 17
+    }
+    G = nx.DiGraph();
+    G.add_nodes_from(degree_data.keys());
+    nodes = list(degree_data.keys());
+    for node, out_deg in degree_data.items():
+        possible_targets = list(set(nodes) - {node});
+        targets = random.sample(possible_targets, min(out_deg, len(possible_targets)));
+        for target in targets:
+            G.add_edge(node, target);
+    print(f"Created DiGraph with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges.");
+    print("spreadIC: ",IC(G,[0,5,9],0.1,1000));
+    print("spreadLT: ",LT(G,[0,5,9],0.1,1000));
+    print("spreadLT(weighted): ",LTWeighted(G,[0,5,9],1000));
+    greedy_output=greedy(G,4,0.1,10);
+    print("greedy output: " + str(greedy_output[0]));
+    greedy_output=greedyLT(G,4,0.1,10);
+    print("greedy output(LT): " + str(greedy_output[0]));
+    CELF_output=CELF(G,4,0.1,10);
+    print("CELF output: "+str(CELF_output[0]));
+    CELF_output=CELF_LT(G,4,0.1,10);
+    print("CELF output(LT): "+str(CELF_output[0]));
+    CELFpp_output=CELFpp(G,4,0.1,10);
+    print("CELFpp output: "+str(CELFpp_output[0]));
@@ -8,6 +8,8 @@ import ast
 import hypernetx as hnx
 import pandas as pd
 import matplotlib.pyplot as plt
+from keywordMatcher import KeywordMatcher
+from tweetPipeline import opinion_edges
 
 df = pd.read_csv(r"C:\Users\sahas\Downloads\february_1.csv")  #uploaded file
 df = pd.read_csv(r"C:\Users\sahas\Downloads\february_2.csv")  #uploaded file
@@ -46,31 +48,9 @@ negative_words = ["remove","down with","against","hate","bad","bjpdestroysdemocr
                   "neverforgetneverforgive","bjpgoonsattackingfarmers","rishiganga","wearewithutearakhand","prayforuttarakhand",
                   "propoganda","glaciar_burst","chamoli","flood","pmmodibusy","bhaipo","releasenodeepkaur"]
 
-edges = {opinion_classes[i]: set() for i in range(1, 7)}
-for _, row in df.iterrows():
-    text = str(row['tweet']).lower() # extracting tweet and userid in each row
-    for party, keywords in party_keywords.items():
-        if any(k in text for k in keywords): # for identifying party
-            if any(w in text for w in positive_words): #for identifying sentiments
-                if party == "bjp":
-                    edges["support_bjp"].add(row['user_id']) #users are nodes in this hypergraph
-                    #edges["against_tmc"].add(row["user_id"])
-                    #edges["against_leftfront"].add(row["user_id"])
-                elif party == "tmc":
-                    edges["support_tmc"].add(row["user_id"])
-                    # edges["against_bjp"].add(row['user_id'])
-                    # edges["against_leftfront"].add(row["user_id"])
-                elif party == "leftfront":
-                    edges["support_leftfront"].add(row["user_id"])
-                    # edges["against_bjp"].add(row['user_id'])
-                    # edges["against_tmc"].add(row["user_id"])
-            elif any(w in text for w in negative_words):
-                if party == "bjp":
-                    edges["against_bjp"].add(row['user_id'])
-                elif party == "tmc":
-                    edges["against_tmc"].add(row["user_id"])
-                elif party == "leftfront":
-                    edges["against_leftfront"].add(row["user_id"])
+# whole-column classification; this scheme only adds support/against edges for the mentioned party
+matcher = KeywordMatcher({**party_keywords, "positive": positive_words, "negative": negative_words})
+edges = opinion_edges(df, matcher, parties=list(party_keywords), cross_party=False)
 
 H = hnx.Hypergraph(edges);
 print("Nodes (users):", len(H.nodes))
@@ -7,12 +7,12 @@ import random
 import hypernetx as hnx
 import pandas as pd
 import matplotlib.pyplot as plt
-import os
-from polarityParty import positive_words, negative_words
-from partyKeywords import party_keywords
+from tweetPipeline import iter_tweet_chunks, build_opinion_edges
+from csrHypergraph import CSRHypergraph
 from HG_IM import (opinion_based_seed_selection,relevance_based_seed_selection,
                    polarity_aware_diffusion,LT_hypergraph,IC_hypergraph,greedyIC_hypergraph,CELF_IC_hypergraph
-                   ,CELFPP_IC_hypergraph)
+                   ,CELFPP_IC_hypergraph,IMM_IC_hypergraph,edge_name_polarity
+                   ,CELF_polarity_hypergraph,IMM_polarity_hypergraph,CELF_quotient_hypergraph)
 
 folder_path = r"C:\Users\sahas\Downloads"
 
@@ -26,16 +26,11 @@ filenames = [
     "april_2.csv"
 ]
 
-# Read and combine all files into one DataFrame
-dfs = []
-for file in filenames:
-    file_path = os.path.join(folder_path, file)
-    # file_path = "C:\Users\sahas\Downloads\mar_1.csv.xlsx"
-    df_temp = pd.read_csv(file_path, dtype=str)
-    dfs.append(df_temp)
-
-df = pd.concat(dfs, ignore_index=True)
-print(f"Loaded {len(df)} total tweets from {len(filenames)} files.")
+# Stream all files in bounded chunks of only the needed columns (tweet, user_id);
+# the combined DataFrame is never materialised.
+chunksize = 100_000
+edges, n_tweets = build_opinion_edges(iter_tweet_chunks(folder_path, filenames, chunksize=chunksize))
+print(f"Loaded {n_tweets} total tweets from {len(filenames)} files.")
 
 
 # party_keywords = {
@@ -52,14 +47,6 @@ print(f"Loaded {len(df)} total tweets from {len(filenames)} files.")
 #     "leftfront": ["left", "cpi", "marxist","leftlibgang"]
 # }
 
-opinion_classes = {    #each opinion class represents a hyperedge in the graph.
-    1: "support_bjp",
-    2: "support_tmc",
-    3: "support_leftfront",
-    4: "against_bjp",
-    5: "against_tmc",
-    6: "against_leftfront"
-}
 
 # positive_words = ["support", "vote for", "win", "love", "good", "indiawithmodi", "bengalwithnamo", "bengalwithbjp", "bengalwelcomesmodi",
 #                   "mamtabanerjeekojaishriram","jaishriram","dhekiajuliwelcomesmodi","bjpgorbesonarbangla","atmanirbharpurvibharat",
@@ -72,51 +59,15 @@ opinion_classes = {    #each opinion class represents a hyperedge in the graph.
 #                   "neverforgetneverforgive","bjpgoonsattackingfarmers","rishiganga","wearewithutearakhand","prayforuttarakhand",
 #                   "propoganda","glaciar_burst","chamoli","flood","pmmodibusy","bhaipo","releasenodeepkaur"]
 
-edges = {opinion_classes[i]: set() for i in range(1, 7)}
-for _, row in df.iterrows():
-    text = str(row['tweet']).lower() # extracting tweet and userid in each row
-    for party, keywords in party_keywords.items():
-        if any(k in text for k in keywords): # for identifying party
-            if any(w in text for w in positive_words): #for identifying sentiments
-                if party == "bjp":
-                    edges["support_bjp"].add(row['user_id']) #users are nodes in this hypergraph
-                    edges["against_tmc"].add(row["user_id"])
-                    edges["against_leftfront"].add(row["user_id"])
-                elif party == "tmc":
-                    edges["support_tmc"].add(row["user_id"])
-                    edges["against_bjp"].add(row['user_id'])
-                    edges["against_leftfront"].add(row["user_id"])
-                elif party == "leftfront":
-                    edges["support_leftfront"].add(row["user_id"])
-                    edges["against_bjp"].add(row['user_id'])
-                    edges["against_tmc"].add(row["user_id"])
-            elif any(w in text for w in negative_words):
-                if party == "bjp":
-                    edges["against_bjp"].add(row['user_id'])
-                elif party == "tmc":
-                    edges["against_tmc"].add(row["user_id"])
-                elif party == "leftfront":
-                    edges["against_leftfront"].add(row["user_id"])
-
 H = hnx.Hypergraph(edges);
 print("Nodes (users):", len(H.nodes))
 print("Opinion categories (hyperedges):", len(H.edges))
 
-#polarity_dict
-polarity_dict = {}
-
-for e in H.edges:                  # e = edge_name
-    users = H.edges[e]             # set of users
+# array-backed copy (int32 ids + node<->edge CSR indexes) shared by all HG_IM calls below
+Hc = CSRHypergraph.from_hypernetx(H)
 
-    if e.startswith("support"):
-        pol = 1
-    elif e.startswith("against"):
-        pol = -1
-    else:
-        continue
-
-    for u in users:
-        polarity_dict[(u, e)] = pol
+#polarity of every (user, opinion edge) incidence: +1 in support_*, -1 in against_* (one byte each)
+polarity = edge_name_polarity(Hc)
 
 
 # HG_IM
@@ -129,6 +80,10 @@ k = 5
 # seed_set = relevance_based_seed_selection(H, T_prime, r, k)
 # print("Seed Set:", seed_set)
 
+# hypergraph centralities of the users (hyperdegree, eigenvector, s-closeness, s-betweenness) as seed heuristics
+# from hypergraphCentrality import centrality_suite
+# print(centrality_suite(Hc, s=1, betweenness_k=2000))
+
 # theta=0.6
 
 #LT_HG
@@ -147,7 +102,9 @@ mc = 10
 
 # S, timeLapse, mean_spread = CELF_IC_hypergraph(H, k, p=p, mc=mc)
 # S, timeLapse, mean_spread = greedyIC_hypergraph(H, k, p=p, mc=mc)
-S, timeLapse, mean_spread = CELFPP_IC_hypergraph(H, k, p=p, mc=mc)
+# S, timeLapse, mean_spread = IMM_IC_hypergraph(Hc, 50, p=p, epsilon=0.5)
+# S, timeLapse, mean_spread = CELF_quotient_hypergraph(Hc, k, p=p, mc=mc)   # over user classes, <= 63 with six edges
+S, timeLapse, mean_spread = CELFPP_IC_hypergraph(Hc, k, p=p, mc=mc)
 
 print("Final CELF++ seed set:", S)
 print("Time lapse after each seed:", timeLapse)
@@ -159,9 +116,13 @@ print("Final mean spread:", mean_spread)
 
 
 #IMPORTANT!!!!!
-# activated=polarity_aware_diffusion(H,seed_set,polarity_dict,theta,rng=random.Random(42))
+# activated=polarity_aware_diffusion(Hc,seed_set,polarity,theta,rng=random.Random(42))
 # print("Activated users:", activated)
 
+# seeds chosen for the polarity-aware model itself
+# S, timeLapse, mean_spread = IMM_polarity_hypergraph(Hc, k, polarity, theta=theta, epsilon=0.5)
+# S, timeLapse, mean_spread = CELF_polarity_hypergraph(Hc, k, polarity, theta=theta, mc=mc)
+
 
 
 # Draw
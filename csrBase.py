@@ -0,0 +1,111 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple
+
+import numpy as np
+
+
+def csr_slots(ptr, rows) -> np.ndarray:
+    """Positions ptr[r]:ptr[r+1] of every row r in `rows`, concatenated."""
+    starts = ptr[rows]
+    lens = ptr[np.asarray(rows) + 1] - starts
+    return np.repeat(starts - np.cumsum(lens) + lens, lens) + np.arange(lens.sum())
+
+
+class InternedNodes:
+    """
+    Node labels interned as dense ids, shared by CSRGraph and CSRHypergraph.
+
+    Keeps `nodes` (id -> label) and `node_index` (label -> id), maps seed sets to ids and
+    holds the lazily built indexes of the container (`derived`).
+
+    Parameters
+    ----------
+    nodes : iterable, optional
+        Labels interned first, in this order (duplicates ignored).
+    """
+
+    def __init__(self, nodes: Iterable[Any] = ()):
+        self.nodes: List[Any] = []
+        self.node_index: Dict[Any, int] = {}
+        for u in nodes:
+            self._intern(u)
+        self._derived: Dict[str, Any] = {}
+
+    def _intern(self, u) -> int:
+        """Id of label `u`, appended if new."""
+        i = self.node_index.get(u)
+        if i is None:
+            i = self.node_index[u] = len(self.nodes)
+            self.nodes.append(u)
+        return i
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def derived(self, key: str, build):
+        """
+        Index `build(self)` computed on first request and kept with the container.
+
+        For model-specific preprocessing (e.g. LT edge weights in IM.py, the LT class
+        index in HG_IM) that should be paid once per graph, not once per spread call.
+        """
+        if key not in self._derived:
+            self._derived[key] = build(self)
+        return self._derived[key]
+
+    def seed_ids(self, S: Iterable[Any]) -> Tuple[np.ndarray, int]:
+        """
+        Map seed labels to node ids.
+
+        Returns
+        -------
+        ids : np.ndarray of int32
+            Distinct ids of the seeds that are nodes of the container, ascending.
+        n_outside : int
+            Number of distinct seeds that are not nodes (they count as active but cannot
+            influence anyone).
+        """
+        ids = set()
+        n_outside = 0
+        for u in set(S):
+            i = self.node_index.get(u)
+            if i is None:
+                n_outside += 1
+            else:
+                ids.add(i)
+        return np.fromiter(sorted(ids), dtype=np.int32, count=len(ids)), n_outside
+
+
+class ConversionCache:
+    """
+    Conversions of recently used input objects (e.g. networkx graph -> CSRGraph).
+
+    Entries are keyed by id(obj) and reused while `fingerprint(obj)` is unchanged, so an
+    object edited in place is converted again. The input object itself is kept in the
+    entry so its id cannot be recycled while cached; beyond `size` entries the least
+    recently used one is dropped.
+    """
+
+    def __init__(self, fingerprint: Callable[[Any], Hashable], build: Callable[[Any], Any], size: int = 8):
+        self.fingerprint = fingerprint
+        self.build = build
+        self.size = size
+        self._entries: "OrderedDict[int, Tuple[Any, Hashable, Any]]" = OrderedDict()
+
+    def get(self, obj):
+        version = self.fingerprint(obj)
+        cached = self._entries.get(id(obj))
+        if cached is not None and cached[0] is obj and cached[1] == version:
+            self._entries.move_to_end(id(obj))
+            return cached[2]
+
+        converted = self.build(obj)
+        self._entries[id(obj)] = (obj, version, converted)
+        self._entries.move_to_end(id(obj))
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+        return converted
@@ -0,0 +1,162 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from csrBase import ConversionCache, InternedNodes, csr_slots
+
+
+def reach_sums(A, weights=None) -> np.ndarray:
+    """
+    Sum of `weights` (default 1) over the nodes reachable from every node, itself included.
+
+    A is a sparse n x n matrix of arcs (e.g. the live arcs of one sampled IC world). It is
+    condensed once into strongly connected components, whose members share one reach set.
+    On the condensation DAG, processed sinks first, a component with a single successor
+    adds its successor's sum; only components with several successors (whose reach sets
+    may overlap) run a BFS over the DAG. Nothing quadratic in n is allocated.
+    """
+    from scipy import sparse
+    from scipy.sparse.csgraph import breadth_first_order, connected_components
+    n = A.shape[0]
+    w = np.ones(n) if weights is None else np.asarray(weights, dtype=float)
+    if n == 0:
+        return np.zeros(0)
+    A = sparse.csr_matrix(A, dtype=float, copy=True)
+    n_comp, label = connected_components(A, directed=True, connection="strong")
+    comp_w = np.bincount(label, weights=w, minlength=n_comp)
+
+    A = A.tocoo()
+    src, dst = label[A.row], label[A.col]
+    keep = src != dst
+    D = sparse.csr_matrix((np.ones(int(keep.sum())), (src[keep], dst[keep])),
+                          shape=(n_comp, n_comp))
+    D.sum_duplicates()
+    out_deg = np.diff(D.indptr)
+    DT = D.T.tocsr()
+
+    # peel the DAG from the sinks up: a component is ready once all its successors are done
+    reach = np.zeros(n_comp)
+    remaining = out_deg.copy()
+    ready = np.flatnonzero(remaining == 0)
+    while ready.size:
+        single = ready[out_deg[ready] == 1]
+        reach[single] = comp_w[single] + reach[D.indices[D.indptr[single]]]
+        for c in ready[out_deg[ready] > 1]:
+            reach[c] = comp_w[breadth_first_order(D, c, directed=True, return_predecessors=False)].sum()
+        sinks = ready[out_deg[ready] == 0]
+        reach[sinks] = comp_w[sinks]
+        preds = DT.indices[csr_slots(DT.indptr, ready)]
+        remaining -= np.bincount(preds, minlength=n_comp)
+        ready = np.unique(preds[remaining[preds] == 0])
+    return reach[label]
+
+
+class CSRGraph(InternedNodes):
+    """
+    Array-backed directed graph with interned int32 node ids (networkx adapter for IM.py).
+
+    Two compressed-sparse-row indexes over the same arcs:
+
+        out :  out_nbrs[out_ptr[u]:out_ptr[u+1]]   (successor ids, in DG.successors order)
+        in  :  in_nbrs[in_ptr[v]:in_ptr[v+1]]      (predecessor ids, ascending)
+               in_arcs[...] gives the matching position in out_nbrs
+
+    An undirected graph is stored with both arcs of every edge, so `out` is then
+    `DG.neighbors`. Memory is O(#arcs) and neighbour lookups are array slices.
+
+    Parameters
+    ----------
+    DG : nx.DiGraph or nx.Graph
+        Nodes are interned in DG.nodes() order.
+    """
+
+    def __init__(self, DG):
+        super().__init__(DG.nodes())
+        self.directed = DG.is_directed()
+        n = len(self.nodes)
+
+        index = self.node_index
+        targets: List[int] = []
+        degs = np.zeros(n, dtype=np.int64)
+        for i, u in enumerate(self.nodes):
+            nbrs = DG.successors(u) if self.directed else DG.neighbors(u)
+            start = len(targets)
+            targets.extend(index[v] for v in nbrs)
+            degs[i] = len(targets) - start
+
+        self.out_nbrs = np.asarray(targets, dtype=np.int32)
+        self.out_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degs, out=self.out_ptr[1:])
+        # source id of every arc
+        self.arc_src = np.repeat(np.arange(n, dtype=np.int32), degs)
+
+        # in-view: stable sort by target keeps each node's predecessors ascending
+        self.in_arcs = np.argsort(self.out_nbrs, kind="stable")
+        self.in_nbrs = self.arc_src[self.in_arcs]
+        self.in_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.out_nbrs, minlength=n), out=self.in_ptr[1:])
+
+        # lazily built derived indexes
+        self._adjacency = None
+
+    # ---------- sizes ----------
+
+    @property
+    def n_arcs(self) -> int:
+        return len(self.out_nbrs)
+
+    def out_degrees(self) -> np.ndarray:
+        return np.diff(self.out_ptr)
+
+    def in_degrees(self) -> np.ndarray:
+        return np.diff(self.in_ptr)
+
+    # ---------- lookups (ids) ----------
+
+    def successors(self, u: int) -> np.ndarray:
+        """Successor ids of node id `u`, in DG order."""
+        return self.out_nbrs[self.out_ptr[u]:self.out_ptr[u + 1]]
+
+    def predecessors(self, v: int) -> np.ndarray:
+        """Predecessor ids of node id `v`, ascending."""
+        return self.in_nbrs[self.in_ptr[v]:self.in_ptr[v + 1]]
+
+    def adjacency_matrix(self):
+        """Sparse n x n matrix A[u, v] = 1 for every arc u -> v (scipy CSR, int32), built once."""
+        if self._adjacency is None:
+            from scipy import sparse
+            self._adjacency = sparse.csr_matrix(
+                (np.ones(self.n_arcs, dtype=np.int32), self.out_nbrs, self.out_ptr),
+                shape=(self.n_nodes, self.n_nodes))
+        return self._adjacency
+
+
+def graph_version(DG) -> int:
+    """
+    Content fingerprint of a networkx graph: a hash of its nodes and of every adjacency
+    list, in order.
+
+    Used to notice that a cached conversion is stale because the graph was edited in
+    place: adding or removing any edge changes it, even when the node and edge counts
+    stay the same. Edge attributes are not part of it, as CSRGraph stores none (IM.py
+    reads LT weights from the graph on every call). O(#nodes + #edges) in C-level tuple
+    builds, about a tenth of a conversion.
+    """
+    return hash((tuple(DG), tuple(tuple(nbrs) for _, nbrs in DG.adjacency())))
+
+
+# conversions of recently used graphs
+_csr_cache = ConversionCache(graph_version, CSRGraph)
+
+
+def as_csr_graph(DG) -> CSRGraph:
+    """
+    Return `DG` as a CSRGraph.
+
+    Accepts a CSRGraph (returned as is) or a networkx graph. Conversions are cached per
+    input object and reused while its `graph_version` is unchanged, so the spread
+    functions of IM.py convert a graph only once across all their calls.
+    """
+    if isinstance(DG, CSRGraph):
+        return DG
+    return _csr_cache.get(DG)
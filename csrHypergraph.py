@@ -0,0 +1,206 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from csrBase import ConversionCache, InternedNodes
+
+
+class _EdgeView:
+    """Read-only `H.edges`-style view: iterate edge names, `H.edges[e]` -> set of member labels."""
+
+    def __init__(self, Hc: "CSRHypergraph"):
+        self._Hc = Hc
+
+    def __iter__(self):
+        return iter(self._Hc.edge_names)
+
+    def __len__(self):
+        return len(self._Hc.edge_names)
+
+    def __contains__(self, e):
+        return e in self._Hc.edge_index
+
+    def __getitem__(self, e):
+        Hc = self._Hc
+        return {Hc.nodes[v] for v in Hc.members(Hc.edge_index[e])}
+
+
+class CSRHypergraph(InternedNodes):
+    """
+    Array-backed hypergraph with interned int32 node ids.
+
+    Two compressed-sparse-row indexes over the same incidences ("slots"):
+
+        edge -> members :  edge_members[edge_ptr[e]:edge_ptr[e+1]]   (node ids, in input order)
+        node -> edges   :  node_edges[node_ptr[u]:node_ptr[u+1]]     (edge ids, ascending)
+                           node_slots[...] gives the matching slot in edge_members
+
+    so incidence lookups are O(degree) and memory is O(#incidences).
+    `H.nodes` and `H.edges[e]` behave like their HyperNetX counterparts, so code written
+    for an hnx.Hypergraph keeps working on this object.
+
+    Parameters
+    ----------
+    edges : dict
+        edge name -> iterable of node labels (e.g. the `edges` dict built in IMatrix2.py).
+    nodes : iterable, optional
+        Node labels in the order they should be interned (e.g. `H.nodes`), isolated nodes
+        included. Labels that only appear in `edges` are appended in order of appearance.
+    """
+
+    def __init__(self, edges: Dict[Any, Iterable[Any]], nodes: Iterable[Any] = None):
+        super().__init__(nodes if nodes is not None else ())
+
+        self.edge_names: List[Any] = list(edges)
+        self.edge_index: Dict[Any, int] = {e: i for i, e in enumerate(self.edge_names)}
+
+        members: List[int] = []
+        sizes: List[int] = []
+        for e in self.edge_names:
+            start = len(members)
+            seen = set()
+            for u in edges[e]:
+                if u in seen:
+                    continue
+                seen.add(u)
+                members.append(self._intern(u))
+            sizes.append(len(members) - start)
+
+        n, m = len(self.nodes), len(self.edge_names)
+        self.edge_members = np.asarray(members, dtype=np.int32)
+        self.edge_ptr = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(sizes, out=self.edge_ptr[1:])
+        # edge id of every slot
+        self.slot_edges = np.repeat(np.arange(m, dtype=np.int32), sizes)
+
+        # node-major view: stable sort by node keeps each node's edges ascending
+        self.node_slots = np.argsort(self.edge_members, kind="stable")
+        self.node_edges = self.slot_edges[self.node_slots]
+        self.node_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.edge_members, minlength=n), out=self.node_ptr[1:])
+
+        self.edges = _EdgeView(self)
+
+        # lazily built derived indexes
+        self._incidence = None
+        self._classes = None
+
+    @classmethod
+    def from_hypernetx(cls, H) -> "CSRHypergraph":
+        """Build from an hnx.Hypergraph, keeping the order of H.nodes and H.edges."""
+        incidence = getattr(H, "incidence_dict", None)
+        if incidence is None:
+            incidence = {e: H.edges[e] for e in H.edges}
+        return cls(incidence, nodes=H.nodes)
+
+    # ---------- sizes ----------
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.edge_names)
+
+    @property
+    def n_incidences(self) -> int:
+        return len(self.edge_members)
+
+    def edge_sizes(self) -> np.ndarray:
+        return np.diff(self.edge_ptr)
+
+    def degrees(self) -> np.ndarray:
+        """Hyperdegree (number of incident edges) of every node id."""
+        return np.diff(self.node_ptr)
+
+    # ---------- incidence lookups (ids) ----------
+
+    def members(self, e: int) -> np.ndarray:
+        """Node ids of edge id `e`."""
+        return self.edge_members[self.edge_ptr[e]:self.edge_ptr[e + 1]]
+
+    def incident_edges(self, u: int) -> np.ndarray:
+        """Edge ids incident on node id `u`, ascending."""
+        return self.node_edges[self.node_ptr[u]:self.node_ptr[u + 1]]
+
+    def incidence_matrix(self):
+        """Sparse n x m user x hyperedge incidence matrix (scipy CSR, int32 ones), built once."""
+        if self._incidence is None:
+            from scipy import sparse
+            self._incidence = sparse.csr_matrix(
+                (np.ones(self.n_incidences, dtype=np.int32), self.node_edges, self.node_ptr),
+                shape=(self.n_nodes, self.n_edges))
+        return self._incidence
+
+    def signature_classes(self):
+        """
+        Group nodes by incidence signature (the exact set of hyperedges they belong to).
+
+        Nodes with the same signature are interchangeable (swapping them is an automorphism
+        of the hypergraph). With the six opinion hyperedges there are at most 63 classes.
+
+        Returns
+        -------
+        node_class : np.ndarray of int32
+            Class id of every node id (classes numbered by first appearance).
+        class_edges : list of np.ndarray
+            Edge ids (ascending) of every class signature.
+        """
+        if self._classes is None:
+            index: Dict[bytes, int] = {}
+            class_edges: List[np.ndarray] = []
+            node_class = np.empty(self.n_nodes, dtype=np.int32)
+            for u in range(self.n_nodes):
+                sig = self.incident_edges(u)
+                c = index.setdefault(sig.tobytes(), len(index))
+                if c == len(class_edges):
+                    class_edges.append(sig)
+                node_class[u] = c
+            self._classes = (node_class, class_edges)
+        return self._classes
+
+
+def hypergraph_version(H) -> int:
+    """
+    Content fingerprint of a hypergraph input: a hash of its node order and of every
+    edge name with its member list, in order.
+
+    Used to notice that a cached conversion is stale because the hypergraph was edited
+    in place: swapping one member of an edge for another changes it, even when all edge
+    sizes stay the same. O(#incidences), a small fraction of a conversion.
+    """
+    if isinstance(H, tuple):
+        V, E = H
+        return hash((tuple(V), tuple((e, tuple(E[e])) for e in E)))
+    if isinstance(H, dict):
+        return hash(tuple((e, tuple(members)) for e, members in H.items()))
+    incidence = getattr(H, "incidence_dict", None)
+    if incidence is None:
+        incidence = {e: H.edges[e] for e in H.edges}
+    return hash((tuple(H.nodes), tuple((e, tuple(members)) for e, members in incidence.items())))
+
+
+def _to_csr(H) -> CSRHypergraph:
+    if isinstance(H, tuple):
+        V, E = H
+        return CSRHypergraph({e: E[e] for e in E}, nodes=V)
+    if isinstance(H, dict):
+        return CSRHypergraph(H)
+    if hasattr(H, "nodes") and hasattr(H, "edges"):
+        return CSRHypergraph.from_hypernetx(H)
+    raise TypeError(f"cannot build a CSRHypergraph from {type(H).__name__}")
+
+
+# conversions of recently used hypergraphs
+_csr_cache = ConversionCache(hypergraph_version, _to_csr)
+
+
+def as_csr(H) -> CSRHypergraph:
+    """
+    Return `H` as a CSRHypergraph.
+
+    Accepts a CSRHypergraph (returned as is), an hnx.Hypergraph (or anything with
+    `.nodes` and `.edges[e]`), an edge dict {edge name: members}, or a (V, E) tuple.
+    Conversions are cached per input object and reused while its `hypergraph_version`
+    is unchanged, so repeated calls on the same hypergraph convert it only once.
+    """
+    if isinstance(H, CSRHypergraph):
+        return H
+    return _csr_cache.get(H)
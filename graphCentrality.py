@@ -0,0 +1,215 @@
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from csrBase import csr_slots
+from csrGraph import CSRGraph, as_csr_graph
+
+# result of a power iteration: scores (CSRGraph node order), iterations run, final L1 change
+# between iterates and whether it fell below the tolerance
+PowerIteration = namedtuple("PowerIteration", ["values", "iterations", "residual", "converged"])
+
+# result of sampled betweenness: scores (CSRGraph node order), the additive error bound that
+# holds for all nodes at once with probability 1 - delta, and the number of BFS sources used
+SampledBetweenness = namedtuple("SampledBetweenness", ["values", "error_bound", "n_sources"])
+
+
+def degree_centrality(DG, mode="all") -> np.ndarray:
+    """
+    Degree centrality of every node: degree / (n - 1), as nx.degree_centrality.
+
+    mode : "all" (in + out for directed graphs), "in" or "out".
+    """
+    G = as_csr_graph(DG)
+    n = G.n_nodes
+    if mode == "in":
+        deg = G.in_degrees()
+    elif mode == "out" or not G.directed:
+        deg = G.out_degrees()
+    elif mode == "all":
+        deg = G.in_degrees() + G.out_degrees()
+    else:
+        raise ValueError(f"unknown degree mode {mode!r}, expected 'all', 'in' or 'out'")
+    return deg / (n - 1) if n > 1 else np.ones(n)
+
+
+def _brandes_source(G: CSRGraph, s):
+    """Dependencies delta_s(v) of every node on shortest paths from s (unweighted Brandes)."""
+    n = G.n_nodes
+    dist = np.full(n, -1, dtype=np.int64)
+    sigma = np.zeros(n)
+    dist[s] = 0
+    sigma[s] = 1.0
+    levels = [np.array([s], dtype=np.int64)]
+
+    # forward: BFS levels and shortest-path counts, one level per step
+    d = 0
+    while True:
+        slots = csr_slots(G.out_ptr, levels[-1])
+        src, dst = G.arc_src[slots], G.out_nbrs[slots].astype(np.int64)
+        new = np.unique(dst[dist[dst] < 0])
+        if not new.size:
+            break
+        dist[new] = d + 1
+        on_path = dist[dst] == d + 1
+        sigma += np.bincount(dst[on_path], weights=sigma[src[on_path]], minlength=n)
+        levels.append(new)
+        d += 1
+
+    # backward: accumulate dependencies from the deepest level up
+    delta = np.zeros(n)
+    for level in reversed(levels[1:]):
+        slots = csr_slots(G.in_ptr, level)
+        v = G.in_nbrs[slots]
+        w = np.repeat(level, G.in_ptr[level + 1] - G.in_ptr[level])
+        on_path = dist[v] == dist[w] - 1
+        v, w = v[on_path], w[on_path]
+        delta += np.bincount(v, weights=sigma[v] / sigma[w] * (1.0 + delta[w]), minlength=n)
+    delta[s] = 0.0
+    return delta
+
+
+def betweenness_error_bound(n, k, delta) -> float:
+    """
+    Additive error of betweenness sampled from k of n sources, holding for all nodes at
+    once with probability at least 1 - delta (0 when every source is used).
+
+    Every source contributes delta_s(v) / (n - 2) in [0, 1] per node, so by Hoeffding and
+    a union bound over the n nodes all estimates are within
+
+        n / (n - 1) * sqrt(ln(2 n / delta) / (2 k))
+
+    of the exact values.
+    """
+    if k >= n:
+        return 0.0
+    return n / (n - 1) * math.sqrt(math.log(2 * n / delta) / (2 * k))
+
+
+def betweenness_sample_size(n, epsilon, delta) -> int:
+    """Smallest number of sources whose `betweenness_error_bound` is at most epsilon."""
+    return int(math.ceil(math.log(2 * n / delta) / (2 * (epsilon * (n - 1) / n) ** 2)))
+
+
+def betweenness_centrality(DG, k=None, epsilon=None, delta=0.1, seed=0) -> SampledBetweenness:
+    """
+    Normalized betweenness centrality, exact or from sampled BFS sources.
+
+    Exact Brandes costs one BFS per node (O(n m)); with k sources drawn uniformly without
+    replacement the estimate is rescaled by n / k (as nx.betweenness_centrality(k=...)).
+    All estimates are within `betweenness_error_bound(n, k, delta)` of the exact values
+    with probability at least 1 - delta.
+
+    Parameters
+    ----------
+    DG : nx.DiGraph, nx.Graph or CSRGraph
+    k : int, optional
+        Number of BFS sources. Default: all nodes (exact), or enough for `epsilon`.
+    epsilon : float, optional
+        Target error bound; sets k (ignored when k is given).
+    delta : float
+        Failure probability of the bound.
+    seed : int
+        Seed of the np.random.Generator choosing the sources.
+    """
+    G = as_csr_graph(DG)
+    n = G.n_nodes
+    if n <= 2:
+        return SampledBetweenness(np.zeros(n), 0.0, n)
+    if k is None and epsilon is not None:
+        k = betweenness_sample_size(n, epsilon, delta)
+    if k is None or k >= n:
+        sources = np.arange(n)
+    else:
+        sources = np.sort(np.random.default_rng(seed).choice(n, size=k, replace=False))
+
+    bc = np.zeros(n)
+    for s in sources:
+        bc += _brandes_source(G, s)
+
+    bc *= 1.0 / ((n - 1) * (n - 2)) * n / len(sources)
+    return SampledBetweenness(bc, betweenness_error_bound(n, len(sources), delta), len(sources))
+
+
+def eigenvector_centrality(DG, max_iter=100, tol=1e-6) -> PowerIteration:
+    """
+    Eigenvector centrality by sparse power iteration, as nx.eigenvector_centrality.
+
+    Iterates x <- (I + A^T) x / ||.||_2 (a node is central when its in-neighbours are; the
+    identity shift avoids oscillation on periodic graphs) from the uniform vector, until
+    the L1 change drops below n * tol. Does not raise on non-convergence: check
+    `converged`.
+    """
+    G = as_csr_graph(DG)
+    n = G.n_nodes
+    if n == 0:
+        return PowerIteration(np.zeros(0), 0, 0.0, True)
+    AT = G.adjacency_matrix().T.tocsr()
+    x = np.full(n, 1.0 / n)
+    residual = float("inf")
+    for it in range(1, max_iter + 1):
+        x_last = x
+        x = x_last + AT @ x_last
+        norm = np.linalg.norm(x) or 1.0
+        x = x / norm
+        residual = float(np.abs(x - x_last).sum())
+        if residual < n * tol:
+            return PowerIteration(x, it, residual, True)
+    return PowerIteration(x, max_iter, residual, False)
+
+
+def pagerank(DG, alpha=0.85, max_iter=100, tol=1e-6) -> PowerIteration:
+    """
+    PageRank by sparse power iteration, as nx.pagerank (uniform teleport; dangling nodes
+    spread their mass uniformly). Stops when the L1 change drops below n * tol.
+    """
+    from scipy import sparse
+    G = as_csr_graph(DG)
+    n = G.n_nodes
+    if n == 0:
+        return PowerIteration(np.zeros(0), 0, 0.0, True)
+    out_deg = G.out_degrees()
+    dangling = out_deg == 0
+    # row-stochastic transition matrix, transposed for x <- W^T x
+    WT = (sparse.diags(1.0 / np.where(dangling, 1, out_deg)) @ G.adjacency_matrix()).T.tocsr()
+    x = np.full(n, 1.0 / n)
+    residual = float("inf")
+    for it in range(1, max_iter + 1):
+        x_last = x
+        x = alpha * (WT @ x_last + x_last[dangling].sum() / n) + (1 - alpha) / n
+        residual = float(np.abs(x - x_last).sum())
+        if residual < n * tol:
+            return PowerIteration(x, it, residual, True)
+    return PowerIteration(x, max_iter, residual, False)
+
+
+def centrality_table(DG, betweenness_k=None, betweenness_epsilon=None, max_iter=1000, with_pagerank=False,
+                     seed=0, verbose=True):
+    """
+    Degree, betweenness and eigenvector centrality of every node as a DataFrame indexed by
+    "Node" (rounded to 3 decimals), the layout of the table printed in main.py.
+
+    betweenness_k / betweenness_epsilon switch betweenness to sampled sources (see
+    `betweenness_centrality`); with_pagerank adds a "PageRank" column. With verbose, the
+    betweenness error bound and power-iteration convergence are printed.
+    """
+    import pandas as pd
+    G = as_csr_graph(DG)
+    bet = betweenness_centrality(G, k=betweenness_k, epsilon=betweenness_epsilon, seed=seed)
+    eig = eigenvector_centrality(G, max_iter=max_iter)
+    columns = {
+        "Node": G.nodes,
+        "Degree Centrality": degree_centrality(G),
+        "Betweenness Centrality": bet.values,
+        "Eigenvector Centrality": eig.values,
+    }
+    if verbose:
+        print(f"betweenness: {bet.n_sources} BFS sources, error bound {bet.error_bound:.4f}")
+        print(f"eigenvector: {eig.iterations} iterations, residual {eig.residual:.2e}, converged = {eig.converged}")
+    if with_pagerank:
+        pr = pagerank(G, max_iter=max_iter)
+        columns["PageRank"] = pr.values
+        if verbose:
+            print(f"pagerank: {pr.iterations} iterations, residual {pr.residual:.2e}, converged = {pr.converged}")
+    return pd.DataFrame(columns).set_index("Node").round(3)
@@ -0,0 +1,233 @@
+from typing import Dict, List
+
+import numpy as np
+
+from csrHypergraph import CSRHypergraph, as_csr
+from graphCentrality import SampledBetweenness, betweenness_error_bound, betweenness_sample_size
+
+
+def _edge_weight_vector(Hc: CSRHypergraph, edge_weights) -> np.ndarray:
+    """Per edge id weights from None (all 1), a dict {edge name: weight} or an array."""
+    if edge_weights is None:
+        return np.ones(Hc.n_edges)
+    if isinstance(edge_weights, dict):
+        return np.array([float(edge_weights.get(e, 0.0)) for e in Hc.edge_names])
+    return np.asarray(edge_weights, dtype=float)
+
+
+def weighted_hyperdegree(H, edge_weights=None) -> np.ndarray:
+    """
+    Weighted hyperdegree sum_e w_e [u in e] of every user (Hc.nodes order).
+
+    One sparse mat-vec with the incidence matrix; with edge_weights=None this is the plain
+    hyperdegree used by HG_IM.opinion_based_seed_selection.
+    """
+    Hc = as_csr(H)
+    return Hc.incidence_matrix() @ _edge_weight_vector(Hc, edge_weights)
+
+
+def hypergraph_eigenvector_centrality(H, edge_weights=None, tol=0.0) -> np.ndarray:
+    """
+    Eigenvector centrality of the users from the incidence-based Laplacian.
+
+    With incidence matrix B and edge weights W, the Laplacian of the weighted clique
+    expansion is L = D - A with A = B W B^T - D and D = diag(weighted hyperdegree). The
+    centrality is the leading eigenvector of A (Perron vector, unit L2 norm, non-negative),
+    found by sparse Lanczos (scipy eigsh) on the operator x -> B (W (B^T x)) - D x, so the
+    n x n matrix A, dense within every large hyperedge, is never built.
+    """
+    from scipy.sparse.linalg import LinearOperator, eigsh
+    Hc = as_csr(H)
+    n = Hc.n_nodes
+    B = Hc.incidence_matrix().astype(float)
+    w = _edge_weight_vector(Hc, edge_weights)
+    d = B @ w
+
+    def matvec(x):
+        x = np.ravel(x)
+        return B @ (w * (B.T @ x)) - d * x
+
+    if n == 0:
+        return np.zeros(0)
+    if n < 3:
+        A = np.column_stack([matvec(col) for col in np.eye(n)])
+        vals, vecs = np.linalg.eigh(A)
+        x = vecs[:, -1]
+    else:
+        op = LinearOperator((n, n), matvec=matvec, dtype=float)
+        vals, vecs = eigsh(op, k=1, which="LA", tol=tol)
+        x = vecs[:, 0]
+    x = x if x.sum() >= 0 else -x
+    return np.abs(x) / (np.linalg.norm(x) or 1.0)
+
+
+# ---------- s-line-graph centralities through signature classes ----------
+#
+# In the s-line graph of the users (edges=False) two users are adjacent when they share at least s
+# hyperedges. Users with the same hyperedge set ("class", see CSRHypergraph.signature_classes) have
+# the same neighbours, so shortest paths are computed on the class graph and counted with class
+# sizes as multiplicities; the (possibly quadratic) line graph itself is never built. edges=True
+# does the same for the hyperedges (adjacent when sharing at least s users) on the transposed
+# incidence matrix, as HyperNetX's s-centralities do by default.
+
+
+def _s_classes(Hc: CSRHypergraph, s, edges):
+    """
+    Class graph of the s-line graph.
+
+    Returns (item_class, sizes, adj, self_adj): class of every item, class sizes, CSR
+    adjacency between distinct classes, and whether two distinct items of a class are
+    adjacent.
+    """
+    from scipy import sparse
+    M = Hc.incidence_matrix()
+    M = (M.T if edges else M).tocsr()
+    M.sort_indices()
+    index: Dict[bytes, int] = {}
+    sigs: List[np.ndarray] = []
+    item_class = np.empty(M.shape[0], dtype=np.int64)
+    for i in range(M.shape[0]):
+        sig = M.indices[M.indptr[i]:M.indptr[i + 1]]
+        c = index.setdefault(sig.tobytes(), len(index))
+        if c == len(sigs):
+            sigs.append(sig)
+        item_class[i] = c
+    n_classes = len(sigs)
+    sizes = np.bincount(item_class, minlength=n_classes)
+
+    lens = [len(sig) for sig in sigs]
+    C = sparse.csr_matrix((np.ones(sum(lens)), (np.repeat(np.arange(n_classes), lens),
+                                                 np.concatenate(sigs) if sigs else np.empty(0, dtype=np.int64))),
+                          shape=(n_classes, M.shape[1]))
+    overlap = (C @ C.T).tocsr()
+    self_adj = (overlap.diagonal() >= s) & (sizes > 1)
+    overlap.setdiag(0)
+    overlap.eliminate_zeros()
+    adj = (overlap >= s).astype(np.int8).tocsr()
+    return item_class, sizes, adj, self_adj
+
+
+def _class_sweep(adj, sizes, self_adj, c):
+    """
+    BFS from one item of class c over the class graph, with Brandes dependencies.
+
+    Returns (reach, total_dist, delta): the number of other items reachable, the sum of
+    their distances, and the dependency of one item of every class on the shortest paths
+    from the source (0 for class c).
+    """
+    K = len(sizes)
+    dist = np.full(K, -1, dtype=np.int64)
+    sigma = np.zeros(K)
+    dist[c] = 0
+    sigma[c] = 1.0
+    mult = sizes.astype(float)
+    mult[c] = 1.0  # paths leave the source item itself, not any item of its class
+    levels = [np.array([c])]
+    while True:
+        frontier = levels[-1]
+        rows = [adj.indices[adj.indptr[p]:adj.indptr[p + 1]] for p in frontier]
+        if not rows or not sum(len(r) for r in rows):
+            break
+        src = np.repeat(frontier, [len(r) for r in rows])
+        dst = np.concatenate(rows)
+        new = np.unique(dst[dist[dst] < 0])
+        if not new.size:
+            break
+        dist[new] = len(levels)
+        on_path = dist[dst] == len(levels)
+        sigma += np.bincount(dst[on_path], weights=mult[src[on_path]] * sigma[src[on_path]], minlength=K)
+        levels.append(new)
+
+    delta = np.zeros(K)
+    for level in reversed(levels[1:]):
+        for e in level:
+            preds = adj.indices[adj.indptr[e]:adj.indptr[e + 1]]
+            preds = preds[dist[preds] == dist[e] - 1]
+            delta[preds] += sizes[e] * sigma[preds] / sigma[e] * (1.0 + delta[e])
+    delta[c] = 0.0
+
+    others = np.flatnonzero(dist > 0)
+    reach = int(sizes[others].sum())
+    total_dist = float((sizes[others] * dist[others]).sum())
+
+    # the other items of class c: adjacent to the source, or two steps away through any neighbour
+    same = sizes[c] - 1
+    if same and self_adj[c]:
+        reach += same
+        total_dist += same
+    elif same and len(levels) > 1:
+        reach += same
+        total_dist += 2 * same
+        first = levels[1]
+        delta[first] += same / sizes[first].sum()
+    return reach, total_dist, delta
+
+
+def s_closeness_centrality(H, s=1, edges=True) -> np.ndarray:
+    """
+    s-closeness of every hyperedge (edges=True) or user (edges=False).
+
+    As hnx.s_closeness_centrality: (r - 1) / (sum of distances to the r - 1 other items of
+    its component in the s-line graph), 0 for singletons. Exact; computed per signature
+    class, so the cost grows with the number of distinct classes, not with the hyperedge
+    sizes. Values follow Hc.edge_names or Hc.nodes order.
+    """
+    Hc = as_csr(H)
+    item_class, sizes, adj, self_adj = Hc.derived(f"s_classes:{s}:{edges}", lambda Hc: _s_classes(Hc, s, edges))
+    closeness = np.zeros(len(sizes))
+    for c in range(len(sizes)):
+        reach, total_dist, _ = _class_sweep(adj, sizes, self_adj, c)
+        if reach:
+            closeness[c] = reach / total_dist
+    return closeness[item_class]
+
+
+def s_betweenness_centrality(H, s=1, edges=True, k=None, epsilon=None, delta=0.1, seed=0) -> SampledBetweenness:
+    """
+    s-betweenness of every hyperedge (edges=True) or user (edges=False), exact or sampled.
+
+    Normalized as hnx.s_betweenness_centrality (pairs counted once, times 2 / ((n-1)(n-2))
+    with n the number of items). With k sources drawn uniformly without replacement the
+    sums are rescaled by n / k, with the error bound of graphCentrality.betweenness_centrality
+    over the n items; `epsilon` picks k for a target bound. Sources of the same signature
+    class share one sweep.
+    """
+    Hc = as_csr(H)
+    item_class, sizes, adj, self_adj = Hc.derived(f"s_classes:{s}:{edges}", lambda Hc: _s_classes(Hc, s, edges))
+    n = len(item_class)
+    if n <= 2:
+        return SampledBetweenness(np.zeros(n), 0.0, n)
+    if k is None and epsilon is not None:
+        k = betweenness_sample_size(n, epsilon, delta)
+    if k is None or k >= n:
+        sources_per_class = sizes
+        k = n
+    else:
+        picked = np.random.default_rng(seed).choice(n, size=k, replace=False)
+        sources_per_class = np.bincount(item_class[picked], minlength=len(sizes))
+
+    bc = np.zeros(len(sizes))
+    for c in np.flatnonzero(sources_per_class):
+        bc += sources_per_class[c] * _class_sweep(adj, sizes, self_adj, c)[2]
+
+    values = bc[item_class] * n / k / ((n - 1) * (n - 2))
+    return SampledBetweenness(values, betweenness_error_bound(n, k, delta), k)
+
+
+def centrality_suite(H, s=1, edge_weights=None, betweenness_k=None, seed=0):
+    """
+    User centralities of the opinion hypergraph as a DataFrame indexed by "User":
+    hyperdegree, weighted hyperdegree, eigenvector (incidence Laplacian), s-closeness and
+    s-betweenness on the user s-line graph. Fast seed heuristics and baselines for CELF;
+    rank a column with HG_IM._top_k.
+    """
+    import pandas as pd
+    Hc = as_csr(H)
+    return pd.DataFrame({
+        "User": Hc.nodes,
+        "Hyperdegree": Hc.degrees(),
+        "Weighted Hyperdegree": weighted_hyperdegree(Hc, edge_weights),
+        "Eigenvector Centrality": hypergraph_eigenvector_centrality(Hc, edge_weights),
+        f"{s}-Closeness": s_closeness_centrality(Hc, s=s, edges=False),
+        f"{s}-Betweenness": s_betweenness_centrality(Hc, s=s, edges=False, k=betweenness_k, seed=seed).values,
+    }).set_index("User")
@@ -0,0 +1,77 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+class KeywordMatcher:
+    """
+    Aho–Corasick multi-pattern matcher over labelled lexicons.
+
+    All keywords of all lexicons are compiled once into a single automaton; a tweet is
+    then scanned in one pass, so the cost per tweet depends on the tweet length and not
+    on the lexicon size.  Matching is plain substring matching (same as `k in text`),
+    overlapping matches included.
+
+    Parameters
+    ----------
+    lexicons : dict
+        label -> iterable of keywords, e.g. {"bjp": [...], "tmc": [...], "positive": [...]}.
+        Each label gets one bit of the mask returned by `match_mask`, in insertion order.
+    """
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]]):
+        self.labels: List[str] = list(lexicons)
+        self.bits: Dict[str, int] = {label: 1 << i for i, label in enumerate(self.labels)}
+        self.full_mask = (1 << len(self.labels)) - 1
+
+        # trie: goto[s] = {char: next_state}, out[s] = bitmask of labels ending in s
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[int] = [0]
+        for label, words in lexicons.items():
+            bit = self.bits[label]
+            for word in words:
+                s = 0
+                for ch in word:
+                    nxt = self._goto[s].get(ch)
+                    if nxt is None:
+                        nxt = len(self._goto)
+                        self._goto.append({})
+                        self._out.append(0)
+                        self._goto[s][ch] = nxt
+                    s = nxt
+                self._out[s] |= bit
+
+        # failure links (BFS); outputs are folded along the failure chain
+        self._fail: List[int] = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            s = queue.popleft()
+            for ch, nxt in self._goto[s].items():
+                queue.append(nxt)
+                if s:
+                    f = self._fail[s]
+                    while f and ch not in self._goto[f]:
+                        f = self._fail[f]
+                    self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def match_mask(self, text: str) -> int:
+        """Bitmask of every label with at least one keyword occurring in `text`."""
+        goto, fail, out = self._goto, self._fail, self._out
+        full = self.full_mask
+        s = 0
+        mask = out[0]
+        for ch in text:
+            nxt = goto[s].get(ch)
+            while nxt is None and s:
+                s = fail[s]
+                nxt = goto[s].get(ch)
+            s = nxt or 0
+            mask |= out[s]
+            if mask == full:
+                break
+        return mask
+
+    def match(self, text: str) -> Set[str]:
+        """Set of labels with at least one keyword occurring in `text`."""
+        mask = self.match_mask(text)
+        return {label for label in self.labels if mask & self.bits[label]}
@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt;
 import networkx as nx;
 import pandas as pd;
+from graphCentrality import centrality_table;
 
 DG=nx.DiGraph();
 
@@ -14,19 +15,10 @@ nx.draw(DG,pos,with_labels=True,node_size=700,node_color="blue",edge_color="gree
 plt.title("Graph Visualisation");
 plt.show();
 
-#centrality
+#centrality (CSR arrays, see graphCentrality.py): for large retweet graphs pass
+#betweenness_k=... or betweenness_epsilon=... to sample the betweenness BFS sources
 
-deg_cen=nx.degree_centrality(DG);
-bet_cen=nx.betweenness_centrality(DG);
-eig_cen=nx.eigenvector_centrality(DG,max_iter=1000);
-
-# printing as a table
-df = pd.DataFrame({
-    "Node": list(DG.nodes()),
-    "Degree Centrality": [deg_cen[n] for n in DG.nodes()],
-    "Betweenness Centrality": [bet_cen[n] for n in DG.nodes()],
-    "Eigenvector Centrality": [eig_cen[n] for n in DG.nodes()]
-}).set_index("Node").round(3)
+df = centrality_table(DG, max_iter=1000)
 
 print(df)
 
@@ -0,0 +1,131 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+# simulations per shard; fixed (not derived from the worker count) so that every shard
+# always gets the same random stream and results are bit-identical for any n_jobs
+MC_SHARD_SIZE = 32
+
+# state shipped once to every worker process by the pool initializer
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(state):
+    _worker_state.clear()
+    _worker_state.update(state)
+
+
+def _call_in_worker(job):
+    func, task = job
+    return func(_worker_state, task)
+
+
+def shard_streams(mc: int, seed=0, shard_size: int = MC_SHARD_SIZE) -> List[Tuple[int, np.random.SeedSequence]]:
+    """
+    Split mc simulations into fixed-size shards with independent random streams.
+
+    Returns
+    -------
+    list of (runs, SeedSequence)
+        One entry per shard, in order; the SeedSequences are spawned from
+        np.random.SeedSequence(seed), so shard i always gets the same stream.
+    """
+    n_shards = -(-mc // shard_size)
+    children = np.random.SeedSequence(seed).spawn(n_shards)
+    return [(min(shard_size, mc - i * shard_size), child) for i, child in enumerate(children)]
+
+
+# result of an adaptive estimate: mean, its standard error, (low, high) confidence
+# interval and the number of simulations actually run
+SpreadEstimate = namedtuple("SpreadEstimate", ["mean", "stderr", "ci", "n_sims"])
+
+
+def adaptive_mc(run_shard: Callable[[int, np.random.SeedSequence], Any], rel_error=0.05, confidence=0.95,
+                min_mc: int = 2 * MC_SHARD_SIZE, max_mc: int = 10000, seed=0,
+                shard_size: int = MC_SHARD_SIZE) -> SpreadEstimate:
+    """
+    Monte Carlo mean with confidence-interval stopping.
+
+    Shards of simulations are run one after another until the normal confidence interval
+    of the mean is within rel_error of it (half-width <= rel_error * |mean|), or max_mc
+    simulations were run. Shard i uses the same stream as in `shard_streams(., seed,
+    shard_size)`, so stopping after N simulations gives exactly the fixed-mc estimate
+    with mc = N.
+
+    Parameters
+    ----------
+    run_shard : callable
+        run_shard(runs, SeedSequence) -> the values of `runs` simulations.
+    rel_error : float
+        Target relative half-width of the confidence interval.
+    confidence : float
+        Confidence level of the interval (0.95: mean +- 1.96 standard errors).
+    min_mc, max_mc : int
+        Simulations run at least / at most.
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    root = np.random.SeedSequence(seed)
+    n, total, total_sq = 0, 0.0, 0.0
+    mean, stderr = 0.0, float("inf")
+    while n < max_mc:
+        values = np.asarray(run_shard(min(shard_size, max_mc - n), root.spawn(1)[0]), dtype=float)
+        n += len(values)
+        total += values.sum()
+        total_sq += np.square(values).sum()
+        mean = total / n
+        if n > 1:
+            stderr = float(np.sqrt(max(total_sq - n * mean * mean, 0.0) / (n - 1) / n))
+        if n >= min_mc and z * stderr <= rel_error * abs(mean):
+            break
+    half = z * stderr
+    return SpreadEstimate(float(mean), stderr, (float(mean - half), float(mean + half)), n)
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """n_jobs <= 0 means "all cores" (like joblib's -1)."""
+    if n_jobs is None or n_jobs <= 0:
+        return os.cpu_count() or 1
+    return n_jobs
+
+
+class ShardPool:
+    """
+    Process pool for Monte Carlo shards, with read-only shared state sent once per worker.
+
+    `map(func, tasks)` returns [func(state, task) for task in tasks] in task order. `func`
+    must be a module-level function (it is pickled by reference). With n_jobs == 1 the
+    tasks run in this process, giving the same results without a pool.
+
+    On Windows (spawn start method) the calling script must keep its top-level work under
+    `if __name__ == "__main__":`, since every worker re-imports the main module.
+    """
+
+    def __init__(self, n_jobs: int, state: Dict[str, Any]):
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.state = state
+        self._executor = None
+        if self.n_jobs > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_jobs,
+                                                 initializer=_init_worker, initargs=(state,))
+
+    def map(self, func: Callable[[Dict[str, Any], Any], Any], tasks: Iterable[Any]) -> List[Any]:
+        tasks = list(tasks)
+        if self._executor is None:
+            return [func(self.state, task) for task in tasks]
+        chunksize = max(1, len(tasks) // (4 * self.n_jobs))
+        return list(self._executor.map(_call_in_worker, [(func, task) for task in tasks], chunksize=chunksize))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
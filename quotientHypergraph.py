@@ -0,0 +1,110 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from csrHypergraph import CSRHypergraph, as_csr
+
+
+class QuotientHypergraph:
+    """
+    Users collapsed into weighted super-nodes ("classes") of interchangeable users.
+
+    Two users fall in the same class when they belong to exactly the same hyperedges and,
+    if polarity codes are given, have the same polarity in each of them. Swapping two such
+    users is an automorphism of the (polarity-annotated) hypergraph, so every diffusion
+    model on it treats them alike: spreads and seed choices can be computed per class and
+    lifted back to concrete users. With the six opinion hyperedges there are at most 63
+    signatures (times the polarity patterns).
+
+    Parameters
+    ----------
+    H : hnx.Hypergraph, CSRHypergraph or edge dict
+    slot_pol : np.ndarray of int8, optional
+        Polarity code of every incidence, aligned with `Hc.edge_members`
+        (see HG_IM.polarity_slots). Omit to group by hyperedge membership only.
+
+    Attributes
+    ----------
+    Hc : CSRHypergraph
+    node_class : np.ndarray of int32
+        Class id of every node id (classes numbered by first appearance).
+    sizes : np.ndarray of int64
+        Number of users per class.
+    class_members, class_ptr : np.ndarray
+        CSR list of the node ids of every class, ascending.
+    B : scipy.sparse.csr_matrix
+        classes x edges 0/1 incidence of the class signatures.
+    polarity_keys : scipy.sparse.csr_matrix
+        (edge, polarity code) pairs x classes: 1 where the class sits in that edge with
+        that polarity. None without polarity.
+    """
+
+    def __init__(self, H, slot_pol: np.ndarray = None):
+        from scipy import sparse
+        Hc = as_csr(H)
+        self.Hc = Hc
+        n, m = Hc.n_nodes, Hc.n_edges
+
+        index: Dict[bytes, int] = {}
+        class_sig: List[Tuple[np.ndarray, np.ndarray]] = []
+        node_class = np.empty(n, dtype=np.int32)
+        for u in range(n):
+            lo, hi = Hc.node_ptr[u], Hc.node_ptr[u + 1]
+            sig = Hc.node_edges[lo:hi]
+            pol = slot_pol[Hc.node_slots[lo:hi]] if slot_pol is not None else np.zeros(hi - lo, dtype=np.int8)
+            c = index.setdefault(sig.tobytes() + b"|" + pol.tobytes(), len(index))
+            if c == len(class_sig):
+                class_sig.append((sig, pol))
+            node_class[u] = c
+        self.node_class = node_class
+
+        n_classes = len(class_sig)
+        self.sizes = np.bincount(node_class, minlength=n_classes).astype(np.int64)
+        self.class_members = np.argsort(node_class, kind="stable").astype(np.int32)
+        self.class_ptr = np.zeros(n_classes + 1, dtype=np.int64)
+        np.cumsum(self.sizes, out=self.class_ptr[1:])
+
+        lens = [len(sig) for sig, _ in class_sig]
+        rows = np.repeat(np.arange(n_classes), lens)
+        cols = np.concatenate([sig for sig, _ in class_sig]) if n_classes else np.empty(0, dtype=np.int32)
+        self.B = sparse.csr_matrix((np.ones(len(cols), dtype=np.int64), (rows, cols)), shape=(n_classes, m))
+
+        self.polarity_keys = None
+        if slot_pol is not None:
+            pols = np.concatenate([pol for _, pol in class_sig]).astype(np.int64) if n_classes else np.empty(0, dtype=np.int64)
+            keys, key_rows = np.unique(cols.astype(np.int64) * 256 + pols + 128, return_inverse=True)
+            self.polarity_keys = sparse.csr_matrix((np.ones(len(cols), dtype=np.int64), (key_rows, rows)),
+                                                   shape=(len(keys), n_classes))
+
+    @property
+    def n_classes(self) -> int:
+        return len(self.sizes)
+
+    def members(self, c: int) -> np.ndarray:
+        """Node ids of class `c`, ascending."""
+        return self.class_members[self.class_ptr[c]:self.class_ptr[c + 1]]
+
+    def class_counts(self, ids: Iterable[int]) -> np.ndarray:
+        """Number of the given (distinct) node ids in every class."""
+        return np.bincount(self.node_class[np.asarray(list(ids), dtype=np.int64)],
+                           minlength=self.n_classes).astype(np.int64)
+
+    def lift(self, counts: np.ndarray) -> List[Any]:
+        """Concrete users for per-class counts: the first counts[c] members (by id) of every class c."""
+        ids = [u for c in np.flatnonzero(counts) for u in self.members(c)[:counts[c]].tolist()]
+        return [self.Hc.nodes[u] for u in ids]
+
+    def lift_frequency(self, expected_active: np.ndarray, seed_ids: np.ndarray) -> np.ndarray:
+        """
+        Per-user activation frequency (Hc.nodes order) from expected active users per class.
+
+        Seeds are always active; the other members of a class share the rest of its
+        expectation evenly (they are interchangeable).
+        """
+        seed_counts = self.class_counts(seed_ids)
+        others = self.sizes - seed_counts
+        share = np.divide(expected_active - seed_counts, others,
+                          out=np.zeros(self.n_classes), where=others > 0)
+        frequency = share[self.node_class]
+        frequency[np.asarray(seed_ids, dtype=np.int64)] = 1.0
+        return frequency
@@ -0,0 +1,44 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+import HG_IM
+import IM
+from parallelMC import MC_SHARD_SIZE, adaptive_mc, shard_streams
+
+
+@pytest.fixture
+def graph():
+    return nx.gnp_random_graph(40, 0.1, seed=3, directed=True)
+
+
+@pytest.fixture
+def edges():
+    rng = np.random.default_rng(0)
+    return {f"e{j}": rng.choice(60, size=int(rng.integers(3, 15)), replace=False).tolist() for j in range(8)}
+
+
+def test_adaptive_mc_equals_fixed_mc_at_its_stopping_point():
+    def run_shard(runs, stream):
+        return np.random.default_rng(stream).exponential(10.0, runs)
+
+    est = adaptive_mc(run_shard, rel_error=0.05, confidence=0.95, max_mc=5000, seed=3)
+    assert est.n_sims % MC_SHARD_SIZE == 0 and est.n_sims < 5000
+    fixed = np.concatenate([run_shard(runs, stream) for runs, stream in shard_streams(est.n_sims, seed=3)])
+    assert est.mean == pytest.approx(fixed.mean(), rel=1e-12)
+    assert est.ci[1] - est.mean <= 0.05 * est.mean
+
+
+def test_adaptive_mc_stops_at_the_cap():
+    est = adaptive_mc(lambda runs, stream: np.random.default_rng(stream).exponential(10.0, runs),
+                      rel_error=1e-6, max_mc=100, seed=0)
+    assert est.n_sims == 100
+    assert est.ci[0] < est.mean < est.ci[1]
+
+
+def test_adaptive_spread_equals_the_sharded_estimate(graph, edges):
+    est = IM.IC(graph, [0, 5], 0.2, mc=2000, seed=4, relError=0.05)
+    assert est.mean == pytest.approx(IM.IC(graph, [0, 5], 0.2, mc=est.n_sims, n_jobs=1, seed=4), abs=1e-12)
+    est = HG_IM.IC_hypergraph(edges, [0, 1], p=0.2, mc=2000, seed=5, rel_error=0.05)
+    fixed = HG_IM.IC_hypergraph(edges, [0, 1], p=0.2, mc=est.n_sims, n_jobs=1, seed=5)
+    assert est.mean == pytest.approx(fixed, abs=1e-12)
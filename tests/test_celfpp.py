@@ -0,0 +1,26 @@
+import networkx as nx
+import pytest
+
+import IM
+
+
+@pytest.fixture
+def graph():
+    return nx.gnp_random_graph(30, 0.12, seed=11, directed=True)
+
+
+def test_celfpp_picks_the_celf_seeds(graph):
+    S = IM.CELF(graph, 4, p=0.2, mc=50)[0]
+    assert IM.CELFpp(graph, 4, p=0.2, mc=50)[0] == S
+    table = IM.influenceTable(graph, p=0.2, mc=50)
+    assert IM.CELF(graph, 4, p=0.2, mc=50, table=table)[0] == S
+    assert IM.CELFpp(graph, 4, p=0.2, mc=50, table=table)[0] == S
+
+
+def test_celfpp_spread_and_lookups(graph):
+    S, SPREAD, _, lookUps = IM.CELFpp(graph, 4, p=0.2, mc=50)
+    assert SPREAD[-1] == pytest.approx(IM.IC(graph, S, 0.2, 50), abs=1e-9)
+    assert lookUps[0] == graph.number_of_nodes()
+    assert all(n < graph.number_of_nodes() for n in lookUps[1:])
+    assert IM.CELFpp(graph, 0, p=0.2, mc=50)[0] == []
+    assert sorted(IM.CELFpp(nx.path_graph(3, create_using=nx.DiGraph), 5, p=0.2, mc=10)[0]) == [0, 1, 2]
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+import HG_IM
+from csrHypergraph import as_csr
+
+
+@pytest.fixture
+def edges():
+    rng = np.random.default_rng(0)
+    return {f"e{j}": rng.choice(60, size=int(rng.integers(3, 15)), replace=False).tolist() for j in range(8)}
+
+
+def test_crn_gains_are_spread_differences_on_the_same_worlds(edges):
+    Hc = as_csr(edges)
+    S = [Hc.nodes[0], Hc.nodes[5]]
+    spread, gains = HG_IM.ic_marginal_gains(edges, S, p=0.2, mc=30, seed=4)
+    assert (gains >= 0).all()
+    assert gains[Hc.seed_ids(S)[0]].tolist() == [0.0, 0.0]
+    for v in (1, 8, 20):
+        extended, _ = HG_IM.ic_marginal_gains(edges, S + [Hc.nodes[v]], p=0.2, mc=30, seed=4)
+        assert extended - spread == pytest.approx(gains[v], abs=1e-9)
+
+
+def test_crn_spread_estimates_ic(edges):
+    Hc = as_csr(edges)
+    S = [Hc.nodes[0], Hc.nodes[5], "outside"]
+    spread, _ = HG_IM.ic_marginal_gains(edges, S, p=0.2, mc=2000, seed=1)
+    assert spread == pytest.approx(HG_IM.IC_hypergraph(edges, S, p=0.2, mc=2000, batched=True), rel=0.05)
+
+
+def test_crn_greedy_picks_the_hub():
+    edges = {f"e{j}": [0] + list(range(1 + 10 * j, 11 + 10 * j)) for j in range(6)}
+    S, spread, timeLapse = HG_IM.greedyIC_hypergraph(edges, 2, p=0.1, mc=50, crn=True)
+    assert S[0] == 0 and len(set(S)) == 2
+    # greedyIC_hypergraph reports the best marginal gain of every round
+    assert spread[0] > spread[1] > 0 and len(timeLapse) == 2
@@ -0,0 +1,111 @@
+import networkx as nx
+import numpy as np
+import pytest
+from scipy import sparse
+
+import IM
+from csrGraph import CSRGraph, as_csr_graph, csr_slots, reach_sums
+
+
+def _legacy_ic(DG, S, p, mc):
+    # IM.IC before the CSR kernels: simulation i re-seeds the global stream with i per node
+    spread = []
+    for i in range(mc):
+        newActive, currSeedSet = S[:], S[:]
+        while newActive:
+            newInfluenced = []
+            for node in newActive:
+                np.random.seed(i)
+                success = np.random.uniform(0, 1, len(list(DG.successors(node)))) < p
+                newInfluenced += list(np.extract(success, list(DG.successors(node))))
+            newActive = list(set(newInfluenced) - set(currSeedSet))
+            currSeedSet += newActive
+        spread.append(len(currSeedSet))
+    return np.mean(spread)
+
+
+def _legacy_lt(DG, I, mc):
+    # IM.LT before the CSR kernels
+    spread = []
+    for i in range(mc):
+        newInfected, currInfectedSet = I[:], I[:]
+        while newInfected:
+            nowInfected = []
+            for node in DG.nodes():
+                if node in currInfectedSet:
+                    continue
+                np.random.seed(i)
+                thNodes = np.random.uniform(0, 0.1) * DG.number_of_nodes()
+                cnt = sum(1 for adjNode in DG.neighbors(node) if adjNode in currInfectedSet)
+                if cnt > thNodes:
+                    nowInfected.append(node)
+            newInfected = nowInfected
+            currInfectedSet += newInfected
+        spread.append(len(currInfectedSet))
+    return np.mean(spread)
+
+
+@pytest.fixture
+def graph():
+    return nx.gnp_random_graph(30, 0.12, seed=11, directed=True)
+
+
+def test_csr_indexes_match_networkx(graph):
+    G = CSRGraph(graph)
+    assert G.n_nodes == graph.number_of_nodes() and G.n_arcs == graph.number_of_edges()
+    for u in graph.nodes():
+        i = G.node_index[u]
+        assert [G.nodes[v] for v in G.successors(i)] == list(graph.successors(u))
+        assert [G.nodes[v] for v in G.predecessors(i)] == sorted(graph.predecessors(u), key=G.node_index.get)
+    assert np.array_equal(G.out_nbrs[G.in_arcs], np.repeat(np.arange(G.n_nodes), G.in_degrees()))
+    A = G.adjacency_matrix().toarray()
+    assert np.array_equal(A, nx.to_numpy_array(graph, nodelist=G.nodes, dtype=int))
+    assert np.array_equal(G.out_nbrs[csr_slots(G.out_ptr, [3, 1])],
+                          np.concatenate([G.successors(3), G.successors(1)]))
+
+
+def test_undirected_graph_stores_both_arcs():
+    g = nx.path_graph(4)
+    G = CSRGraph(g)
+    assert G.n_arcs == 6
+    assert list(G.successors(1)) == [0, 2]
+
+
+def test_seed_ids_counts_outside_seeds(graph):
+    ids, n_outside = CSRGraph(graph).seed_ids([4, 2, 4, "x", "y"])
+    assert ids.tolist() == [2, 4] and n_outside == 2
+
+
+def test_as_csr_graph_is_cached_until_the_graph_changes(graph):
+    G = as_csr_graph(graph)
+    assert as_csr_graph(graph) is G and as_csr_graph(G) is G
+    graph.add_node("new")
+    assert as_csr_graph(graph) is not G
+
+
+def test_as_csr_graph_sees_edits_that_keep_the_counts():
+    g = nx.DiGraph([(0, 1), (1, 2)])
+    G = as_csr_graph(g)
+    g.remove_edge(0, 1)
+    g.add_edge(2, 0)
+    assert as_csr_graph(g) is not G
+    assert [list(as_csr_graph(g).successors(i)) for i in range(3)] == [[], [2], [0]]
+
+
+def test_reach_sums_matches_descendants():
+    for s in range(20):
+        g = nx.gnp_random_graph(25, 0.08, seed=s, directed=True)
+        A = nx.to_scipy_sparse_array(g, nodelist=range(25), format="csr")
+        w = np.random.default_rng(s).random(25)
+        before = A.copy()
+        expected = [w[v] + sum(w[u] for u in nx.descendants(g, v)) for v in range(25)]
+        assert np.allclose(reach_sums(A, w), expected)
+        assert np.allclose(reach_sums(sparse.csr_matrix(A)), [1 + len(nx.descendants(g, v)) for v in range(25)])
+        assert (A != before).nnz == 0
+
+
+def test_spread_equals_legacy_loops(graph):
+    for S in ([0], [3, 7], [5, 12, 20]):
+        assert IM.IC(graph, S, 0.2, mc=40) == pytest.approx(_legacy_ic(graph, S, 0.2, 40), abs=1e-12)
+        assert IM.LT(graph, S, mc=20) == pytest.approx(_legacy_lt(graph, S, 20), abs=1e-12)
+
@@ -0,0 +1,72 @@
+import hypernetx as hnx
+import numpy as np
+import pytest
+
+from csrHypergraph import CSRHypergraph, as_csr
+
+
+@pytest.fixture
+def edges():
+    rng = np.random.default_rng(0)
+    return {f"e{j}": rng.choice(60, size=int(rng.integers(3, 15)), replace=False).tolist() for j in range(8)}
+
+
+def test_csr_indexes_match_the_edge_dict(edges):
+    Hc = CSRHypergraph(edges)
+    assert Hc.edge_names == list(edges)
+    assert Hc.n_incidences == sum(len(m) for m in edges.values())
+    for e, name in enumerate(Hc.edge_names):
+        assert [Hc.nodes[u] for u in Hc.members(e)] == edges[name]
+        assert Hc.edges[name] == set(edges[name])
+    for u, label in enumerate(Hc.nodes):
+        assert [Hc.edge_names[e] for e in Hc.incident_edges(u)] == [e for e in edges if label in edges[e]]
+    assert np.array_equal(Hc.edge_members[Hc.node_slots], np.repeat(np.arange(Hc.n_nodes), Hc.degrees()))
+    B = Hc.incidence_matrix().toarray()
+    assert np.array_equal(B.sum(axis=0), Hc.edge_sizes())
+    assert np.array_equal(B.sum(axis=1), Hc.degrees())
+
+
+def test_nodes_order_duplicates_and_isolated_nodes():
+    Hc = CSRHypergraph({"a": [2, 1, 2], "b": [3]}, nodes=[9, 1])
+    assert Hc.nodes == [9, 1, 2, 3]
+    assert Hc.edge_sizes().tolist() == [2, 1]
+    assert Hc.degrees().tolist() == [0, 1, 1, 1]
+
+
+def test_from_hypernetx_keeps_the_hypergraph(edges):
+    H = hnx.Hypergraph(edges)
+    Hc = as_csr(H)
+    assert Hc.nodes == list(H.nodes)
+    assert {e: set(Hc.edges[e]) for e in Hc.edges} == {e: set(H.edges[e]) for e in H.edges}
+
+
+def test_signature_classes_and_seed_ids():
+    Hc = CSRHypergraph({"a": [0, 1, 2], "b": [1, 2, 3]})
+    node_class, class_edges = Hc.signature_classes()
+    assert node_class.tolist() == [0, 1, 1, 2]
+    assert [sig.tolist() for sig in class_edges] == [[0], [0, 1], [1]]
+    ids, n_outside = Hc.seed_ids([3, 0, 3, "x"])
+    assert ids.tolist() == [0, 3] and n_outside == 1
+
+
+def test_as_csr_is_cached_until_the_input_changes(edges):
+    Hc = as_csr(edges)
+    assert as_csr(edges) is Hc and as_csr(Hc) is Hc
+    edges["e0"] = edges["e0"] + [99]
+    assert as_csr(edges) is not Hc
+
+
+def test_as_csr_sees_member_swaps():
+    edges = {"a": [0, 1], "b": [1, 2]}
+    Hc = as_csr(edges)
+    edges["a"][1] = 2
+    assert as_csr(edges) is not Hc
+    assert as_csr(edges).edges["a"] == {0, 2}
+    H = hnx.Hypergraph({"a": [0, 1], "b": [1, 2]})
+    Hc = as_csr(H)
+    H.remove_edges(["a"])
+    H.add_edge("a")
+    H.add_incidences_from([("a", 0), ("a", 2)])
+    assert as_csr(H) is not Hc
+    assert as_csr(H).edges["a"] == {0, 2}
+
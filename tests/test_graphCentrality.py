@@ -0,0 +1,69 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from graphCentrality import (betweenness_centrality, betweenness_error_bound, betweenness_sample_size, centrality_table,
+                             degree_centrality, eigenvector_centrality, pagerank)
+
+
+def _nx_values(scores, graph):
+    return np.array([scores[u] for u in graph.nodes()])
+
+
+@pytest.fixture(params=["directed", "undirected"])
+def graph(request):
+    if request.param == "directed":
+        return nx.gnp_random_graph(40, 0.1, seed=5, directed=True)
+    return nx.relabel_nodes(nx.connected_watts_strogatz_graph(40, 4, 0.2, seed=5), lambda u: f"n{u}")
+
+
+def test_degree_centrality_matches_networkx(graph):
+    assert np.allclose(degree_centrality(graph), _nx_values(nx.degree_centrality(graph), graph))
+    if graph.is_directed():
+        assert np.allclose(degree_centrality(graph, "in"), _nx_values(nx.in_degree_centrality(graph), graph))
+        assert np.allclose(degree_centrality(graph, "out"), _nx_values(nx.out_degree_centrality(graph), graph))
+        with pytest.raises(ValueError):
+            degree_centrality(graph, "both")
+
+
+def test_exact_betweenness_matches_networkx(graph):
+    result = betweenness_centrality(graph)
+    assert result.n_sources == graph.number_of_nodes() and result.error_bound == 0.0
+    assert np.allclose(result.values, _nx_values(nx.betweenness_centrality(graph), graph))
+
+
+def test_sampled_betweenness_is_within_its_bound(graph):
+    exact = _nx_values(nx.betweenness_centrality(graph), graph)
+    result = betweenness_centrality(graph, epsilon=0.5, seed=2)
+    assert 0 < result.n_sources < graph.number_of_nodes()
+    assert np.abs(result.values - exact).max() <= result.error_bound
+    assert np.array_equal(betweenness_centrality(graph, k=result.n_sources, seed=2).values, result.values)
+
+
+def test_sample_size_meets_the_target_bound():
+    for n, epsilon in [(50, 0.3), (1000, 0.1), (10 ** 5, 0.05)]:
+        k = betweenness_sample_size(n, epsilon, 0.1)
+        assert betweenness_error_bound(n, k, 0.1) <= epsilon < betweenness_error_bound(n, k - 1, 0.1)
+    assert betweenness_error_bound(50, 50, 0.1) == 0.0
+
+
+def test_power_iterations_match_networkx(graph):
+    eig = eigenvector_centrality(graph, max_iter=1000, tol=1e-10)
+    assert eig.converged
+    assert np.allclose(eig.values, _nx_values(nx.eigenvector_centrality(graph, max_iter=1000, tol=1e-10), graph),
+                       atol=1e-8)
+    pr = pagerank(graph, tol=1e-10)
+    assert pr.converged
+    assert np.allclose(pr.values, _nx_values(nx.pagerank(graph, tol=1e-10), graph), atol=1e-8)
+
+
+def test_power_iteration_reports_non_convergence(graph):
+    for result in (eigenvector_centrality(graph, max_iter=2, tol=1e-14), pagerank(graph, max_iter=2, tol=1e-14)):
+        assert result.iterations == 2 and not result.converged and result.residual > 0
+
+
+def test_centrality_table_columns(graph):
+    table = centrality_table(graph, with_pagerank=True, verbose=False)
+    assert list(table.index) == list(graph.nodes())
+    assert list(table.columns) == ["Degree Centrality", "Betweenness Centrality", "Eigenvector Centrality", "PageRank"]
+    assert np.allclose(table["Betweenness Centrality"], betweenness_centrality(graph).values.round(3))
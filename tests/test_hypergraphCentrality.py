@@ -0,0 +1,66 @@
+import hypernetx as hnx
+import numpy as np
+import pytest
+
+from csrHypergraph import as_csr
+from hypergraphCentrality import (centrality_suite, hypergraph_eigenvector_centrality, s_betweenness_centrality,
+                                  s_closeness_centrality, weighted_hyperdegree)
+
+
+@pytest.fixture
+def edges():
+    rng = np.random.default_rng(1)
+    edges = {f"e{j}": rng.choice(30, size=int(rng.integers(2, 8)), replace=False).tolist() for j in range(12)}
+    edges["dup"] = list(edges["e0"])  # a repeated hyperedge and isolated pairs exercise the class logic
+    edges["pair"] = [100, 101]
+    return edges
+
+
+def _hnx_values(scores, items):
+    return np.array([scores.get(x, 0.0) for x in items])
+
+
+@pytest.mark.parametrize("s", [1, 2])
+@pytest.mark.parametrize("on_edges", [True, False])
+def test_s_centralities_match_hypernetx(edges, s, on_edges):
+    H = hnx.Hypergraph(edges)
+    Hc = as_csr(edges)
+    items = Hc.edge_names if on_edges else Hc.nodes
+    expected = hnx.s_closeness_centrality(H, s=s, edges=on_edges)
+    assert np.allclose(s_closeness_centrality(edges, s=s, edges=on_edges), _hnx_values(expected, items))
+    expected = hnx.s_betweenness_centrality(H, s=s, edges=on_edges)
+    result = s_betweenness_centrality(edges, s=s, edges=on_edges)
+    assert result.error_bound == 0.0 and result.n_sources == len(items)
+    assert np.allclose(result.values, _hnx_values(expected, items))
+
+
+def test_sampled_s_betweenness_is_within_its_bound(edges):
+    exact = s_betweenness_centrality(edges, edges=False).values
+    result = s_betweenness_centrality(edges, edges=False, epsilon=0.5, seed=3)
+    assert 0 < result.n_sources < len(exact)
+    assert np.abs(result.values - exact).max() <= result.error_bound
+
+
+def test_weighted_hyperdegree(edges):
+    Hc = as_csr(edges)
+    weights = {e: float(j + 1) for j, e in enumerate(edges)}
+    expected = [sum(weights[e] for e in edges if u in edges[e]) for u in Hc.nodes]
+    assert np.allclose(weighted_hyperdegree(edges, weights), expected)
+    assert np.array_equal(weighted_hyperdegree(edges), Hc.degrees())
+
+
+def test_eigenvector_is_the_leading_eigenvector_of_the_clique_expansion(edges):
+    del edges["pair"]  # keep the clique expansion connected enough for a unique leading vector
+    B = as_csr(edges).incidence_matrix().toarray().astype(float)
+    A = B @ B.T
+    np.fill_diagonal(A, 0.0)
+    vals, vecs = np.linalg.eigh(A)
+    assert vals[-1] - vals[-2] > 1e-6
+    assert np.allclose(hypergraph_eigenvector_centrality(edges), np.abs(vecs[:, -1]), atol=1e-8)
+
+
+def test_centrality_suite_columns(edges):
+    suite = centrality_suite(edges, s=1)
+    assert list(suite.index) == as_csr(edges).nodes
+    assert list(suite.columns) == ["Hyperdegree", "Weighted Hyperdegree", "Eigenvector Centrality",
+                                   "1-Closeness", "1-Betweenness"]
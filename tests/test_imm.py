@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+import HG_IM
+from csrHypergraph import as_csr
+
+
+@pytest.fixture
+def hubs():
+    # users 0 and 1 each sit in six hyperedges of ten leaves, everyone else in one
+    edges = {f"a{j}": [0] + list(range(2 + 10 * j, 12 + 10 * j)) for j in range(6)}
+    edges.update({f"b{j}": [1] + list(range(62 + 10 * j, 72 + 10 * j)) for j in range(6)})
+    edges.update({f"c{j}": list(range(122 + 5 * j, 127 + 5 * j)) for j in range(6)})
+    return edges
+
+
+def test_imm_picks_the_hubs_and_estimates_their_spread(hubs):
+    S, timeLapse, spread = HG_IM.IMM_IC_hypergraph(hubs, 2, p=0.3, epsilon=0.3, seed=1)
+    assert sorted(S) == [0, 1]
+    assert len(timeLapse) == 2
+    assert spread == pytest.approx(HG_IM.IC_hypergraph(hubs, S, p=0.3, mc=2000, batched=True), rel=0.1)
+
+
+def test_final_selection_uses_a_fresh_batch_of_rr_sets(hubs):
+    Hc = as_csr(hubs)
+    rng = np.random.RandomState(0)
+    keys = HG_IM._incidence_keys(Hc)
+    scratch = np.zeros(Hc.n_nodes, dtype=bool)
+    rr_nodes, rr_sizes, requests = [], [], []
+
+    def sample(count):
+        requests.append((count, len(rr_sizes)))
+        HG_IM._sample_rr_sets(Hc, 0.3, count, rng, keys, scratch, rr_nodes, rr_sizes)
+
+    HG_IM._imm_select(Hc, 2, 0.3, 1, sample, rr_nodes, rr_sizes, 0.0, [])
+    theta, already = requests[-1]
+    assert len(requests) > 1 and already == 0
+    assert len(rr_sizes) == len(rr_nodes) == theta
@@ -0,0 +1,47 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+import HG_IM
+import IM
+from csrHypergraph import as_csr
+
+
+@pytest.fixture
+def graph():
+    return nx.gnp_random_graph(30, 0.12, seed=11, directed=True)
+
+
+@pytest.fixture
+def hub():
+    # user 0 sits in all six hyperedges, everyone else in one
+    return {f"e{j}": [0] + list(range(1 + 10 * j, 11 + 10 * j)) for j in range(6)}
+
+
+def test_influence_table_equals_singleton_ic(graph):
+    table = IM.influenceTable(graph, p=0.2, mc=50)
+    for u in graph.nodes():
+        assert table[u] == pytest.approx(IM.IC(graph, [u], 0.2, 50), abs=1e-12)
+
+
+def test_hypergraph_influence_table_ranks_a_hub_first(hub):
+    table = HG_IM.influence_table(hub, p=0.3)
+    assert int(np.argmax(table)) == 0
+    assert HG_IM.influence_table(hub, p=0.3) is table
+
+
+def test_hypergraph_influence_table_estimates_singleton_spreads(hub):
+    Hc = as_csr(hub)
+    table = HG_IM.influence_table(hub, p=0.3, n_samples=3000, seed=1)
+    assert table.shape == (Hc.n_nodes,)
+    for u in (0, 1, 25):
+        spread = HG_IM.IC_hypergraph(hub, [Hc.nodes[u]], p=0.3, mc=2000, batched=True)
+        # RR-set estimate: standard error about sqrt(n * spread / n_samples)
+        assert table[u] == pytest.approx(spread, abs=4 * np.sqrt(Hc.n_nodes * spread / 3000) + 0.5)
+
+
+def test_warm_started_celf_skips_the_singleton_pass(hub):
+    S, _, _, stats = HG_IM.CELF_IC_hypergraph(hub, 2, p=0.1, mc=30, return_stats=True)
+    warm, _, _, warm_stats = HG_IM.CELF_IC_hypergraph(hub, 2, p=0.1, mc=30, return_stats=True, warm_start=True)
+    assert warm[0] == S[0] == 0
+    assert warm_stats["oracle_calls"] < stats["oracle_calls"]
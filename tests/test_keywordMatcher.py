@@ -0,0 +1,31 @@
+import numpy as np
+
+from keywordMatcher import KeywordMatcher
+from partyKeywords import party_keywords
+from polarityParty import negative_words, positive_words
+
+
+def _substring_labels(lexicons, text):
+    # the per-keyword scan KeywordMatcher replaces
+    return {label for label, words in lexicons.items() if any(w in text for w in words)}
+
+
+def test_overlapping_and_nested_keywords():
+    lexicons = {"a": ["he", "hers"], "b": ["she", "his"], "c": ["s"], "d": ["xyz"]}
+    matcher = KeywordMatcher(lexicons)
+    for text in ["ushers", "she", "hi", "h", "ahishe", "", "xy", "xxyz"]:
+        assert matcher.match(text) == _substring_labels(lexicons, text)
+    assert matcher.match_mask("ushers") == matcher.bits["a"] | matcher.bits["b"] | matcher.bits["c"]
+
+
+def test_matches_the_substring_scan_on_the_real_lexicons():
+    lexicons = {**party_keywords, "positive": positive_words, "negative": negative_words}
+    matcher = KeywordMatcher(lexicons)
+    words = [w for ws in lexicons.values() for w in ws] + ["the", "and", "rally", "#", "@x"]
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        picked = rng.choice(len(words), size=int(rng.integers(0, 6)))
+        # glue some words together and cut some in half, so keywords straddle word boundaries
+        parts = [words[i][:int(rng.integers(1, len(words[i]) + 1))] for i in picked]
+        text = "".join(part + (" " if rng.random() < 0.5 else "") for part in parts)
+        assert matcher.match(text) == _substring_labels(lexicons, text)
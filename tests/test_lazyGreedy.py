@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from HG_IM import lazy_greedy
+
+
+@pytest.fixture
+def coverage():
+    # weighted coverage: a deterministic monotone submodular oracle
+    rng = np.random.default_rng(5)
+    weights = rng.random(200)
+    covers = [set(rng.choice(200, size=int(rng.integers(1, 30)), replace=False).tolist()) for _ in range(40)]
+
+    def spread(S):
+        return float(sum(weights[v] for v in set().union(*(covers[u] for u in S))))
+
+    return spread
+
+
+def _plain_greedy(spread, candidates, k):
+    S = []
+    for _ in range(k):
+        best = max((u for u in candidates if u not in S), key=lambda u: spread(S + [u]))
+        S.append(best)
+    return S
+
+
+@pytest.mark.parametrize("method", ["celf", "celfpp"])
+def test_lazy_greedy_picks_the_plain_greedy_seeds(coverage, method):
+    expected = _plain_greedy(coverage, range(40), 8)
+    S, timeLapse, spread, stats = lazy_greedy(coverage, range(40), 8, method=method, verbose=False)
+    assert S == expected
+    assert spread == pytest.approx(coverage(expected), abs=1e-9)
+    assert len(timeLapse) == len(stats["lookups"]) == 8
+    assert stats["greedy_calls"] == sum(40 - j for j in range(8))
+    assert stats["oracle_calls"] < stats["greedy_calls"]
+
+
+def test_lazy_greedy_stops_when_candidates_run_out(coverage):
+    S, _, spread, _ = lazy_greedy(coverage, [3, 1, 4], 10, verbose=False)
+    assert sorted(S) == [1, 3, 4]
+    assert spread == pytest.approx(coverage(S), abs=1e-9)
+    with pytest.raises(ValueError, match="unknown lazy greedy method"):
+        lazy_greedy(coverage, range(40), 2, method="greedy")
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+import HG_IM
+
+
+def _legacy_lt(edges, nodes, seed_set, th_low, th_high, mc):
+    # LT_hypergraph before the incremental engine: active co-members recounted every sweep
+    spread = []
+    for sim in range(mc):
+        curr_active = set(seed_set)
+        new_active = list(seed_set)
+        np.random.seed(sim)
+        thr_value = np.random.uniform(th_low, th_high) * len(nodes)
+        while new_active:
+            newly_added = []
+            for u in nodes:
+                if u in curr_active:
+                    continue
+                active_neighbors = sum(1 for e in edges if u in edges[e]
+                                       for v in edges[e] if v in curr_active and v != u)
+                if active_neighbors > thr_value:
+                    newly_added.append(u)
+            new_active = newly_added
+            curr_active.update(newly_added)
+        spread.append(len(curr_active))
+    return np.mean(spread)
+
+
+@pytest.fixture
+def edges():
+    rng = np.random.default_rng(0)
+    return {f"e{j}": rng.choice(60, size=int(rng.integers(3, 15)), replace=False).tolist() for j in range(8)}
+
+
+def test_lt_equals_the_legacy_sweeps(edges):
+    nodes = list(dict.fromkeys(u for members in edges.values() for u in members))
+    for S, th_high in (([0], 0.05), ([3, 7, 11], 0.1), (list(range(10)), 0.2)):
+        expected = _legacy_lt(edges, nodes, S, 0.0, th_high, 30)
+        assert HG_IM.LT_hypergraph(edges, S, th_high=th_high, mc=30) == pytest.approx(expected, abs=1e-12)
+
+
+def test_batched_lt_equals_sequential(edges):
+    for S in ([0], [3, 7, 11], list(range(10))):
+        sequential = HG_IM.LT_hypergraph(edges, S, mc=40)
+        assert HG_IM.LT_hypergraph(edges, S, mc=40, batched=True) == sequential
@@ -0,0 +1,40 @@
+import networkx as nx
+import pytest
+
+import IM
+
+
+@pytest.fixture
+def graph():
+    return nx.gnp_random_graph(30, 0.12, seed=11, directed=True)
+
+
+def test_lt_weighted_does_not_depend_on_the_batch_size(graph, monkeypatch):
+    expected = IM.LTWeighted(graph, [0, 9], mc=200, seed=3)
+    monkeypatch.setattr(IM, "_FOREST_BATCH", 3 * graph.number_of_nodes())
+    assert IM.LTWeighted(graph, [0, 9], mc=200, seed=3) == pytest.approx(expected, abs=1e-12)
+    assert IM.LTWeighted(graph, list(graph.nodes()), mc=10) == graph.number_of_nodes()
+
+
+def test_lt_weights_are_read_on_every_call_and_validated():
+    g = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+    nx.set_edge_attributes(g, 0.0, "w")
+    assert IM.LTWeighted(g, [0], mc=20, weight="w") == 1
+    nx.set_edge_attributes(g, 1.0, "w")
+    assert IM.LTWeighted(g, [0], mc=20, weight="w") == 3
+    g[1][2]["w"] = -0.5
+    with pytest.raises(ValueError, match="edge 1 -> 2"):
+        IM.LTWeighted(g, [0], mc=20, weight="w")
+    g.add_edge(1, 0, w=0.5)
+    g[1][2]["w"] = 1.0
+    with pytest.raises(ValueError, match="node 0"):
+        IM.LTWeighted(g, [0], mc=20, weight="w")
+
+
+def test_live_edge_spread_matches_the_threshold_process():
+    # on a path every node has one in-neighbour: it activates iff its threshold <= that arc's weight
+    g = nx.path_graph(4, create_using=nx.DiGraph)
+    nx.set_edge_attributes(g, 0.5, "w")
+    assert IM.LTWeighted(g, [0], mc=4000, weight="w", seed=1) == pytest.approx(1 + 0.5 + 0.25 + 0.125, abs=0.05)
+    # default weights 1 / in-degree: a single in-neighbour always activates its successor
+    assert IM.LTWeighted(g, [0], mc=50) == 4
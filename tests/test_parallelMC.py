@@ -0,0 +1,59 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+import HG_IM
+import IM
+from parallelMC import ShardPool, shard_streams
+
+
+def _draws(state, task):
+    runs, stream = task
+    return (state["offset"] + np.random.default_rng(stream).random(runs)).tolist()
+
+
+@pytest.fixture
+def graph():
+    return nx.gnp_random_graph(40, 0.1, seed=3, directed=True)
+
+
+@pytest.fixture
+def edges():
+    rng = np.random.default_rng(0)
+    return {f"e{j}": rng.choice(60, size=int(rng.integers(3, 15)), replace=False).tolist() for j in range(8)}
+
+
+def test_shard_streams_cover_mc_with_fixed_streams():
+    shards = shard_streams(100, seed=7)
+    assert [runs for runs, _ in shards] == [32, 32, 32, 4]
+    again = shard_streams(100, seed=7)
+    for (_, a), (_, b) in zip(shards, again):
+        assert np.array_equal(a.generate_state(4), b.generate_state(4))
+
+
+def test_shard_pool_results_do_not_depend_on_n_jobs():
+    tasks = shard_streams(200, seed=1)
+    with ShardPool(1, {"offset": 1.0}) as serial, ShardPool(3, {"offset": 1.0}) as pool:
+        assert serial.map(_draws, tasks) == pool.map(_draws, tasks)
+
+
+def test_graph_spread_is_identical_for_any_n_jobs(graph):
+    ic = [IM.IC(graph, [0, 5], 0.2, mc=100, n_jobs=n_jobs, seed=4) for n_jobs in (1, 2)]
+    lt = [IM.LT(graph, [0, 5], 0.1, mc=100, n_jobs=n_jobs, seed=4) for n_jobs in (1, 2)]
+    assert ic[0] == ic[1]
+    assert lt[0] == lt[1]
+
+
+def test_greedy_selection_is_identical_for_any_n_jobs(graph):
+    S1 = IM.greedy(graph, 2, 0.2, mc=40, n_jobs=1, seed=2)
+    S2 = IM.greedy(graph, 2, 0.2, mc=40, n_jobs=2, seed=2)
+    assert S1[0] == S2[0]
+    assert S1[1] == S2[1]
+
+
+def test_hypergraph_spread_is_identical_for_any_n_jobs(edges):
+    ic = [HG_IM.IC_hypergraph(edges, [0, 1], p=0.2, mc=100, n_jobs=n_jobs, seed=5) for n_jobs in (1, 2)]
+    lt = [HG_IM.LT_hypergraph(edges, [0, 1], mc=100, n_jobs=n_jobs, seed=5) for n_jobs in (1, 2)]
+    assert ic[0] == ic[1]
+    assert lt[0] == lt[1]
+
@@ -0,0 +1,132 @@
+import random
+from collections import deque
+
+import numpy as np
+import pytest
+
+import HG_IM
+from csrHypergraph import as_csr
+
+
+def _legacy_diffusion(edges, S, polarity, theta, rng):
+    # polarity_aware_diffusion before polarity_slots: every edge scanned, polarity looked up per attempt
+    A = set(S)
+    Q = deque(S)
+    while Q:
+        u = Q.popleft()
+        for e, members in edges.items():
+            if u not in members:
+                continue
+            for v in members:
+                if v in A:
+                    continue
+                if polarity.get((u, e)) == polarity.get((v, e)):
+                    A.add(v)
+                    Q.append(v)
+                elif rng.random() > theta:
+                    A.add(v)
+                    Q.append(v)
+    return A
+
+
+@pytest.fixture
+def edges():
+    rng = np.random.default_rng(2)
+    return {f"e{j}": rng.choice(80, size=int(rng.integers(3, 12)), replace=False).tolist() for j in range(12)}
+
+
+@pytest.fixture
+def polarity(edges):
+    # three values per hyperedge, some incidences left without one
+    rng = np.random.default_rng(3)
+    return {(u, e): ["pos", "neg", 0][int(rng.integers(3))] for e, members in edges.items() for u in members
+            if rng.random() < 0.9}
+
+
+def test_polarity_slots_resolve_every_polarity_form(edges, polarity):
+    Hc = as_csr(edges)
+    slot_pol = HG_IM.polarity_slots(edges, polarity)
+    assert slot_pol.dtype == np.int8 and slot_pol.shape == (Hc.n_incidences,)
+    nested = {}
+    for (u, e), value in polarity.items():
+        nested.setdefault(u, {})[e] = value
+    assert np.array_equal(HG_IM.polarity_slots(edges, nested), slot_pol)
+    assert np.array_equal(HG_IM.polarity_slots(edges, lambda u, e: polarity.get((u, e))), slot_pol)
+    # equal codes exactly for equal values, a missing polarity being None
+    values = [polarity.get((Hc.nodes[v], Hc.edge_names[e])) for v, e in zip(Hc.edge_members, Hc.slot_edges)]
+    for a in range(0, len(values), 7):
+        for b in range(len(values)):
+            assert (slot_pol[a] == slot_pol[b]) == (values[a] == values[b])
+    assert HG_IM.polarity_slots(edges, slot_pol) is slot_pol
+    with pytest.raises(ValueError, match="polarity array has shape"):
+        HG_IM.polarity_slots(edges, slot_pol[:-1])
+
+
+def test_edge_name_polarity_matches_the_polarity_dict():
+    edges = {"support_bjp": [1, 2, 3], "against_tmc": [2, 4], "other": [5, 1]}
+    expected = [1, 1, 1, -1, -1, 0, 0]
+    assert HG_IM.edge_name_polarity(edges).tolist() == expected
+
+
+def test_diffusion_equals_the_legacy_scan(edges, polarity):
+    for seed in range(5):
+        for S, theta in (([edges["e0"][0]], 0.5), ([edges["e3"][1], edges["e7"][0], 99], 0.8),
+                         (edges["e1"][:2], 1.0)):
+            expected = _legacy_diffusion(edges, S, polarity, theta, random.Random(seed))
+            assert HG_IM.polarity_aware_diffusion(edges, S, polarity, theta, random.Random(seed)) == expected
+
+
+def test_mc_kernel_matches_repeated_diffusion(edges, polarity):
+    S = [edges["e0"][0], edges["e5"][2]]
+    mean, variance, frequency = HG_IM.polarity_diffusion_mc(edges, S, polarity, theta=0.7, mc=2000, seed=1)
+    rng = random.Random(1)
+    runs = [HG_IM.polarity_aware_diffusion(edges, S, polarity, 0.7, rng) for _ in range(1000)]
+    spreads = np.array([len(A) for A in runs])
+    assert mean == pytest.approx(spreads.mean(), abs=4 * np.sqrt(variance / 2000 + spreads.var() / 1000))
+    assert frequency.shape == (as_csr(edges).n_nodes,)
+    assert frequency.sum() == pytest.approx(mean, abs=1e-9)
+
+
+@pytest.mark.parametrize("theta", [0.0, 1.0])
+def test_mc_kernel_is_exact_when_no_draw_matters(edges, polarity, theta):
+    S = [edges["e2"][0], 99]
+    expected = len(HG_IM.polarity_aware_diffusion(edges, S, polarity, theta, random.Random(0)))
+    mean, variance, _ = HG_IM.polarity_diffusion_mc(edges, S, polarity, theta=theta, mc=70)
+    assert mean == expected and variance == 0.0
+
+
+@pytest.fixture
+def hubs():
+    # users 0 and 1 each sit in four hyperedges of six leaves, polarities mixed
+    edges = {f"a{j}": [0] + list(range(2 + 6 * j, 8 + 6 * j)) for j in range(4)}
+    edges.update({f"b{j}": [1] + list(range(26 + 6 * j, 32 + 6 * j)) for j in range(4)})
+    edges.update({f"c{j}": list(range(50 + 4 * j, 54 + 4 * j)) for j in range(3)})
+    rng = np.random.default_rng(4)
+    polarity = {(u, e): int(rng.integers(2)) for e, members in edges.items() for u in members}
+    return edges, polarity
+
+
+@pytest.mark.parametrize("method", ["celf", "celfpp"])
+def test_celf_polarity_picks_the_greedy_seeds(hubs, method):
+    # theta = 1: cascades follow equal polarities only, a deterministic coverage oracle
+    edges, polarity = hubs
+    nodes = as_csr(edges).nodes
+
+    def spread(S):
+        return HG_IM.polarity_diffusion_mc(edges, S, polarity, theta=1.0, mc=8)[0]
+
+    expected = []
+    for _ in range(3):
+        expected.append(max((u for u in nodes if u not in expected), key=lambda u: spread(expected + [u])))
+    S, _, final_spread, stats = HG_IM.CELF_polarity_hypergraph(edges, 3, polarity, theta=1.0, mc=8,
+                                                               method=method, return_stats=True)
+    assert S == expected
+    assert final_spread == pytest.approx(spread(S), abs=1e-9)
+    assert stats["oracle_calls"] < stats["greedy_calls"]
+
+
+def test_imm_polarity_picks_the_hubs(hubs):
+    edges, polarity = hubs
+    S, timeLapse, spread = HG_IM.IMM_polarity_hypergraph(edges, 2, polarity, theta=0.85, epsilon=0.3, seed=1)
+    assert sorted(S) == [0, 1] and len(timeLapse) == 2
+    assert spread == pytest.approx(HG_IM.polarity_diffusion_mc(edges, S, polarity, theta=0.85, mc=2000)[0], rel=0.1)
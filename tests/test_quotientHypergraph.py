@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+import HG_IM
+from HG_IM import lazy_greedy
+from quotientHypergraph import QuotientHypergraph
+
+
+@pytest.fixture
+def edges():
+    # six opinion-like hyperedges over 300 users: few signatures, large classes
+    rng = np.random.default_rng(6)
+    return {f"e{j}": np.flatnonzero(rng.random(300) < 0.3).tolist() for j in range(6)}
+
+
+def test_classes_group_users_with_the_same_hyperedges(edges):
+    Q = QuotientHypergraph(edges)
+    Hc = Q.Hc
+    assert Q.sizes.sum() == Hc.n_nodes and Q.n_classes <= 63
+    for c in range(Q.n_classes):
+        sigs = {Hc.incident_edges(u).tobytes() for u in Q.members(c)}
+        assert len(sigs) == 1
+    counts = np.zeros(Q.n_classes, dtype=int)
+    counts[[0, 2]] = [2, 1]
+    lifted = Q.lift(counts)
+    assert lifted == [Hc.nodes[u] for u in Q.members(0)[:2].tolist() + Q.members(2)[:1].tolist()]
+    assert Q.class_counts(Hc.seed_ids(lifted)[0]).tolist() == counts.tolist()
+
+
+def test_quotient_spread_matches_ic_hypergraph(edges):
+    S = [edges["e0"][0], edges["e3"][4], 999]
+    mean, variance, frequency = HG_IM.quotient_diffusion_mc(edges, S, p=0.004, mc=2000, seed=1)
+    direct = HG_IM.IC_hypergraph(edges, S, p=0.004, mc=2000, batched=True)
+    assert mean == pytest.approx(direct, abs=4 * np.sqrt(2 * variance / 2000))
+    assert frequency.sum() + 1 == pytest.approx(mean, abs=1e-9)
+
+
+def test_quotient_worlds_spread_grows_with_the_seed_counts(edges):
+    Q = HG_IM._quotient_for(edges, "IC", None)
+    worlds = HG_IM._QuotientWorlds(Q, 50, 3, seed=1, p=0.2)
+    counts = np.zeros(Q.n_classes, dtype=int)
+    spread = worlds.spread(counts).sum(axis=1)
+    for c in np.argsort(-Q.sizes)[:3]:
+        counts[c] += 1
+        grown = worlds.spread(counts).sum(axis=1)
+        assert (grown >= spread).all()
+        spread = grown
+
+
+@pytest.mark.parametrize("method", ["celf", "celfpp"])
+@pytest.mark.parametrize("warm", [False, True])
+def test_offered_slots_give_the_greedy_counts(method, warm):
+    # pools of interchangeable slots with a concave value in the number taken from each
+    sizes = np.array([3, 1, 4, 2, 5])
+    value = np.array([5.0, 7.0, 3.0, 6.0, 2.5])
+    keep = np.array([0.5, 0.2, 0.8, 0.3, 0.9])
+
+    def spread(S):
+        counts = np.bincount([c for c, _ in S], minlength=len(sizes))
+        return float(np.sum(value * (1 - keep ** counts)))
+
+    expected = []
+    for _ in range(9):
+        slots = [(c, j) for c in range(len(sizes)) for j in range(sizes[c]) if (c, j) not in expected]
+        expected.append(max(slots, key=lambda slot: spread(expected + [slot])))
+
+    def next_slot(slot):
+        c, j = slot
+        return (c, j + 1) if j + 1 < sizes[c] else None
+
+    initial = value * (1 - keep) if warm else None
+    S, _, total, stats = lazy_greedy(spread, [(c, 0) for c in range(len(sizes))], 9, method=method,
+                                     verbose=False, initial_gains=initial, next_candidate=next_slot)
+    assert sorted(S) == sorted(expected)
+    assert total == pytest.approx(spread(expected), abs=1e-9)
+    assert stats["oracle_calls"] < len(sizes) * 9
+
+
+def test_celf_quotient_returns_distinct_users(edges):
+    S, timeLapse, spread = HG_IM.CELF_quotient_hypergraph(edges, 4, p=0.004, mc=300, seed=2)
+    assert len(set(S)) == 4 and len(timeLapse) == 4
+    assert spread == pytest.approx(HG_IM.quotient_diffusion_mc(edges, S, p=0.004, mc=3000)[0], rel=0.1)
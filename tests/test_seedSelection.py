@@ -0,0 +1,55 @@
+import hypernetx as hnx
+import numpy as np
+import pytest
+
+import HG_IM
+
+
+def _legacy_relevance(H, T_prime, r, k):
+    # relevance_based_seed_selection before the incidence matrix: every user against every topic
+    R = {u: 0.0 for u in H.nodes}
+    for u in R:
+        for t in T_prime:
+            if t in H.edges and u in H.edges[t]:
+                R[u] += len(H.edges[t]) * r.get(t, 0)
+    return sorted(R, key=lambda u: abs(R[u]), reverse=True)[:k]
+
+
+def _legacy_opinion(V, E, k):
+    # opinion_based_seed_selection before the incidence matrix
+    hyperdegree = {u: 0 for u in V}
+    for e in E:
+        for u in E[e]:
+            hyperdegree[u] = hyperdegree.get(u, 0) + 1
+    return sorted(hyperdegree, key=lambda u: hyperdegree[u], reverse=True)[:k]
+
+
+@pytest.fixture
+def edges():
+    rng = np.random.default_rng(8)
+    return {f"t{j}": rng.choice(50, size=int(rng.integers(2, 20)), replace=False).tolist() for j in range(10)}
+
+
+def test_top_k_is_the_stable_descending_order():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        scores = rng.integers(0, 5, size=int(rng.integers(1, 40)))
+        for k in (0, 1, 3, len(scores), len(scores) + 2):
+            assert HG_IM._top_k(scores, k).tolist() == np.argsort(-scores, kind="stable")[:k].tolist()
+
+
+@pytest.mark.parametrize("k", [1, 5, 60])
+def test_relevance_selection_equals_the_legacy_ranking(edges, k):
+    H = hnx.Hypergraph(edges)
+    T_prime = ["t0", "t3", "t4", "t7", "missing"]
+    r = {"t0": 0.5, "t3": -2.0, "t4": 1.0, "t7": 0.25}
+    assert HG_IM.relevance_based_seed_selection(H, T_prime, r, k) == _legacy_relevance(H, T_prime, r, k)
+    assert HG_IM.relevance_based_seed_selection(edges, T_prime, r, k) == _legacy_relevance(H, T_prime, r, k)
+
+
+@pytest.mark.parametrize("k", [1, 5, 60])
+def test_opinion_selection_equals_the_legacy_ranking(edges, k):
+    H = hnx.Hypergraph(edges)
+    assert HG_IM.opinion_based_seed_selection(H, k) == _legacy_opinion(list(H.nodes), H.edges, k)
+    V = [99, 98] + list(H.nodes)
+    assert HG_IM.opinion_based_seed_selection((V, edges), k) == _legacy_opinion(V, edges, k)
@@ -0,0 +1,58 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+import HG_IM
+import IM
+from HG_IM import stochastic_greedy, stochastic_sample_size
+
+
+@pytest.fixture
+def coverage():
+    # weighted coverage: a deterministic monotone submodular oracle
+    rng = np.random.default_rng(5)
+    weights = rng.random(200)
+    covers = [set(rng.choice(200, size=int(rng.integers(1, 30)), replace=False).tolist()) for _ in range(40)]
+
+    def spread(S):
+        return float(sum(weights[v] for v in set().union(*(covers[u] for u in S))))
+
+    return spread
+
+
+def test_sample_size():
+    assert stochastic_sample_size(1000, 10, 0.1) == int(np.ceil(100 * np.log(10)))
+    assert stochastic_sample_size(40, 1, 0.01) == 40
+
+
+def test_sampling_everyone_is_plain_greedy(coverage):
+    expected = []
+    for _ in range(5):
+        expected.append(max((u for u in range(40) if u not in expected), key=lambda u: coverage(expected + [u])))
+    # (40 / 5) * ln(1 / 1e-3) > 40: every round sees all remaining candidates
+    S, _, spread, stats = stochastic_greedy(coverage, range(40), 5, epsilon=1e-3, verbose=False)
+    assert S == expected and spread == pytest.approx(coverage(expected), abs=1e-12)
+    assert stats["sample_size"] == 40
+
+
+def test_samples_cut_the_oracle_calls(coverage):
+    S, timeLapse, spread, stats = stochastic_greedy(coverage, range(40), 8, epsilon=0.5, seed=3, verbose=False)
+    assert len(set(S)) == 8 and len(timeLapse) == 8
+    assert spread == pytest.approx(coverage(S), abs=1e-12)
+    assert stats["sample_size"] == stochastic_sample_size(40, 8, 0.5)
+    assert stats["oracle_calls"] == 8 * stats["sample_size"] < stats["greedy_calls"]
+    assert stochastic_greedy(coverage, range(40), 8, epsilon=0.5, seed=3, verbose=False)[0] == S
+
+
+@pytest.mark.parametrize("epsilon", [0, 1, -0.2, 1.5])
+def test_epsilon_outside_the_unit_interval_is_rejected(coverage, epsilon):
+    edges = {"a": [0, 1, 2], "b": [2, 3]}
+    graph = nx.path_graph(4, create_using=nx.DiGraph)
+    with pytest.raises(ValueError, match="epsilon must be in"):
+        stochastic_greedy(coverage, range(40), 2, epsilon=epsilon)
+    with pytest.raises(ValueError, match="epsilon must be in"):
+        HG_IM.greedyIC_hypergraph(edges, 2, mc=5, epsilon=epsilon)
+    with pytest.raises(ValueError, match="epsilon must be in"):
+        IM.greedy(graph, 2, mc=5, epsilon=epsilon)
+    with pytest.raises(ValueError, match="epsilon must be in"):
+        IM.greedyLT(graph, 2, mc=5, epsilon=epsilon)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from partyKeywords import party_keywords
+from polarityParty import negative_words, positive_words
+from tweetPipeline import TWEET_COLUMNS, build_opinion_edges, iter_tweet_chunks, opinion_edges
+
+TWEETS = [
+    "Vote for Modi, BJP will win",
+    "down with didi and the tmc",
+    "i love the left front",
+    "bjp and tmc are both bad",
+    "nothing political here",
+    "Support Mamata against BJP",
+    None,
+    "cpi marxist rally, good turnout",
+]
+
+
+def _legacy_edges(df, cross_party):
+    # IMatrix2.py (cross_party) and IMatrix.py before classify_tweets
+    edges = {name: set() for name in ["support_bjp", "support_tmc", "support_leftfront",
+                                      "against_bjp", "against_tmc", "against_leftfront"]}
+    for _, row in df.iterrows():
+        text = str(row['tweet']).lower()
+        for party, keywords in party_keywords.items():
+            if any(k in text for k in keywords):
+                if any(w in text for w in positive_words):
+                    edges["support_" + party].add(row['user_id'])
+                    if cross_party:
+                        for other in party_keywords:
+                            if other != party:
+                                edges["against_" + other].add(row['user_id'])
+                elif any(w in text for w in negative_words):
+                    edges["against_" + party].add(row['user_id'])
+    return edges
+
+
+def _write_month(path, n_copies):
+    rows = []
+    for i in range(n_copies):
+        for j, tweet in enumerate(TWEETS):
+            rows.append({"id": len(rows), "tweet": tweet, "user_id": f"u{(i + j) % 11}", "likes": j})
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return pd.read_csv(path, dtype=str)
+
+
+def test_chunks_are_bounded_and_cover_every_file(tmp_path):
+    full = pd.concat([_write_month(tmp_path / "march.csv", 5), _write_month(tmp_path / "april.csv", 3)],
+                     ignore_index=True)
+    chunks = list(iter_tweet_chunks(str(tmp_path), ["march.csv", "april.csv"], chunksize=7))
+    assert all(len(chunk) <= 7 for chunk in chunks)
+    assert all(list(chunk.columns) == TWEET_COLUMNS for chunk in chunks)
+    streamed = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, full[TWEET_COLUMNS])
+
+    edges, n_tweets = build_opinion_edges(iter_tweet_chunks(str(tmp_path), ["march.csv", "april.csv"], chunksize=7))
+    assert n_tweets == len(full)
+    assert edges == opinion_edges(full)
+
+
+@pytest.mark.parametrize("cross_party", [True, False])
+def test_classification_equals_the_iterrows_rules(cross_party):
+    words = [w for ws in party_keywords.values() for w in ws[:40]] + positive_words[:40] + negative_words[:40]
+    rng = np.random.default_rng(1)
+    tweets = [" ".join(rng.choice(words, size=int(rng.integers(0, 5)))) for _ in range(400)] + TWEETS
+    df = pd.DataFrame({"tweet": tweets, "user_id": [f"u{i % 150}" for i in range(len(tweets))]})
+    assert opinion_edges(df, cross_party=cross_party) == _legacy_edges(df, cross_party)
@@ -0,0 +1,189 @@
+import os
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from polarityParty import positive_words, negative_words
+from partyKeywords import party_keywords
+from keywordMatcher import KeywordMatcher
+
+# columns the hypergraph construction actually needs; everything else in the monthly csv files is dropped on read
+TWEET_COLUMNS = ["tweet", "user_id"]
+
+opinion_classes = {    #each opinion class represents a hyperedge in the graph.
+    1: "support_bjp",
+    2: "support_tmc",
+    3: "support_leftfront",
+    4: "against_bjp",
+    5: "against_tmc",
+    6: "against_leftfront"
+}
+
+# one automaton for every party lexicon plus the two polarity lexicons, compiled once at import
+opinion_matcher = KeywordMatcher({**party_keywords, "positive": positive_words, "negative": negative_words})
+
+
+def iter_tweet_chunks(folder_path: str,
+                      filenames: Sequence[str],
+                      chunksize: int = 100_000,
+                      columns: Sequence[str] = TWEET_COLUMNS) -> Iterator[pd.DataFrame]:
+    """
+    Stream the monthly tweet csv files as bounded-size chunks.
+
+    Parameters
+    ----------
+    folder_path : str
+        Folder holding the csv files.
+    filenames : sequence of str
+        Files to read, in order (e.g. "february_1.csv", ..., "april_2.csv").
+    chunksize : int
+        Maximum number of rows per yielded chunk.
+    columns : sequence of str
+        Columns to keep; only these are parsed.
+
+    Yields
+    ------
+    pd.DataFrame
+        At most `chunksize` rows with the requested columns (as str).
+        At no point is more than one chunk of one file held in memory.
+    """
+    for file in filenames:
+        file_path = os.path.join(folder_path, file)
+        with pd.read_csv(file_path, dtype=str, usecols=list(columns), chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield chunk
+
+
+def opinion_edge_names(parties: Sequence[str] = None) -> List[str]:
+    """Hyperedge names for `parties`: all support_<party> edges, then all against_<party> edges."""
+    if parties is None:
+        parties = list(party_keywords)
+    return [f"support_{party}" for party in parties] + [f"against_{party}" for party in parties]
+
+
+def empty_opinion_edges(parties: Sequence[str] = None) -> Dict[str, Set]:
+    """Empty opinion hyperedges (six for bjp/tmc/leftfront), keyed by opinion class name."""
+    return {name: set() for name in opinion_edge_names(parties)}
+
+
+def classify_tweets(tweets: pd.Series,
+                    matcher: KeywordMatcher = None,
+                    parties: Sequence[str] = None,
+                    cross_party: bool = True) -> pd.DataFrame:
+    """
+    Classify a whole column of tweets into compact label codes.
+
+    The text column is lower-cased in one vectorized call and scanned once per tweet by
+    the Aho–Corasick matcher; the opinion rules are then applied to the whole column
+    with NumPy bit operations.
+
+    Parameters
+    ----------
+    tweets : pd.Series
+        Raw tweet texts (NaN is treated as the text "nan", as before).
+    matcher : KeywordMatcher
+        Must have one label per party plus "positive" and "negative".
+        Defaults to `opinion_matcher`.
+    parties : sequence of str
+        Party labels, in edge order. Defaults to the keys of `party_keywords`.
+    cross_party : bool
+        If True (IMatrix2 scheme), support for one party also counts as being against
+        every other party. If False (IMatrix scheme), it does not.
+
+    Returns
+    -------
+    pd.DataFrame (same index as `tweets`) with columns
+        party    : uint8 bitmask, bit i set if party i was mentioned
+        polarity : int8, 1 = positive, -1 = negative (and not positive), 0 = neither
+        opinion  : uint8 bitmask over `opinion_edge_names(parties)`
+    """
+    if matcher is None:
+        matcher = opinion_matcher
+    if parties is None:
+        parties = list(party_keywords)
+
+    texts = tweets.astype(str).str.lower()
+    masks = np.fromiter((matcher.match_mask(t) for t in texts), dtype=np.uint32, count=len(texts))
+
+    n_parties = len(parties)
+    party = np.zeros(len(masks), dtype=np.uint8)
+    for i, name in enumerate(parties):
+        party |= ((masks & matcher.bits[name]) != 0).astype(np.uint8) << i
+    pos = (masks & matcher.bits["positive"]) != 0
+    neg = ((masks & matcher.bits["negative"]) != 0) & ~pos
+
+    all_parties = np.uint8((1 << n_parties) - 1)
+    supported = np.where(pos, party, 0).astype(np.uint8)   # support_<p> bits
+    opposed = np.where(neg, party, 0).astype(np.uint8)     # against_<p> bits
+    if cross_party:
+        # supporting any party is also being against each of the others
+        for i in range(n_parties):
+            others = all_parties & ~np.uint8(1 << i)
+            opposed |= ((supported & others) != 0).astype(np.uint8) << i
+
+    opinion = (supported | (opposed.astype(np.uint16) << n_parties)).astype(np.uint8)
+    polarity = np.where(pos, 1, np.where(neg, -1, 0)).astype(np.int8)
+    return pd.DataFrame({"party": party, "polarity": polarity, "opinion": opinion}, index=tweets.index)
+
+
+def add_chunk_to_edges(edges: Dict[str, Set],
+                       df: pd.DataFrame,
+                       matcher: KeywordMatcher = None,
+                       parties: Sequence[str] = None,
+                       cross_party: bool = True) -> None:
+    """
+    Classify the tweets of one chunk and add their users to the opinion hyperedges (in-place).
+
+    Parameters
+    ----------
+    edges : dict
+        edge name -> set of user ids, as created by `empty_opinion_edges`.
+    df : pd.DataFrame
+        Chunk with at least the 'tweet' and 'user_id' columns.
+    matcher, parties, cross_party :
+        See `classify_tweets`.
+    """
+    names = opinion_edge_names(parties)
+    opinion = classify_tweets(df['tweet'], matcher, parties, cross_party)["opinion"].to_numpy()
+
+    # one boolean column per opinion edge, OR-ed per user (rows without a user id are dropped)
+    flags = pd.DataFrame((opinion[:, None] >> np.arange(len(names), dtype=np.uint8)) & 1 == 1, columns=names)
+    flags["user_id"] = df['user_id'].to_numpy()
+    per_user = flags.groupby("user_id", sort=False).any()
+    for name in names:
+        edges[name].update(per_user.index[per_user[name].to_numpy()])
+
+
+def opinion_edges(df: pd.DataFrame,
+                  matcher: KeywordMatcher = None,
+                  parties: Sequence[str] = None,
+                  cross_party: bool = True) -> Dict[str, Set]:
+    """Opinion hyperedges of a single in-memory DataFrame (see `add_chunk_to_edges`)."""
+    edges = empty_opinion_edges(parties)
+    add_chunk_to_edges(edges, df, matcher, parties, cross_party)
+    return edges
+
+
+def build_opinion_edges(chunks: Iterable[pd.DataFrame]) -> Tuple[Dict[str, Set], int]:
+    """
+    Build the six opinion hyperedges from a stream of tweet chunks.
+
+    Parameters
+    ----------
+    chunks : iterable of pd.DataFrame
+        e.g. `iter_tweet_chunks(folder_path, filenames)`.
+
+    Returns
+    -------
+    edges : dict
+        edge name -> set of user ids (ready for hnx.Hypergraph(edges)).
+    n_tweets : int
+        Number of tweets consumed.
+    """
+    edges = empty_opinion_edges()
+    n_tweets = 0
+    for df in chunks:
+        add_chunk_to_edges(edges, df)
+        n_tweets += len(df)
+    return edges, n_tweets